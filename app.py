@@ -1,20 +1,42 @@
 import streamlit as st
-import pandas as pd
 import numpy as np
 from src.laptop_price_prediction.pipeline.stage_04_prediction_pipeline import Prediction, CustomData
+from src.laptop_price_prediction.config.configurations import ConfigurationManager
+from src.laptop_price_prediction.logger import configure_logging
+from src.laptop_price_prediction.utils.prediction_cache import PredictionCache
+from src.laptop_price_prediction.utils.table_io import read_table
+from src.laptop_price_prediction.utils.metrics import metrics
+
+# columns the select boxes are filled from
+OPTION_COLUMNS = ['Company', 'Product', 'TypeName', 'ScreenResolution', 'Cpu', 'Memory', 'Gpu', 'OpSys']
 
 @st.cache_data
 def load_data():
     '''
-    This function loads the raw data
+    This function loads the columns of the raw data the app needs
     '''
     try:
-        data = pd.read_csv('artifacts/data_ingestion/raw.csv')
+        raw_path = ConfigurationManager().get_data_ingestion_config().raw_path
+        data = read_table(raw_path, columns=OPTION_COLUMNS)
         return data
 
     except Exception as e:
         st.info(f':warning: An error occured while loading the data: {e}')
         return None
+
+
+@st.cache_resource
+def load_predictor():
+    '''
+    This function creates the predictor shared by every session, with the prediction cache, logging and metrics set in config.yaml
+    '''
+    config = ConfigurationManager()
+    configure_logging(config.get_logging_config())
+    metrics.configure(config.get_metrics_config())
+    cache = PredictionCache.from_config(config.get_prediction_cache_config())
+    return Prediction(cache=cache)
+
+
 def main():
     '''
     This function initiates the streamlit app
@@ -133,7 +155,7 @@ def main():
                     )
 
                     features = custom_data.get_data_as_dataframe()
-                    prediction = Prediction()
+                    prediction = load_predictor()
                     prediction = prediction.predict(features)
                     prediction = np.round(prediction[0], 2)
 
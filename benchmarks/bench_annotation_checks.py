@@ -0,0 +1,108 @@
+import argparse
+import json
+import os
+import pickle
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+
+
+def best_time(fn, number: int, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        timings.append((time.perf_counter() - start) / number)
+    return min(timings)
+
+
+def time_helpers(number: int, repeat: int) -> dict:
+    '''
+    Time calls of the utils/common.py helpers in the ANNOTATION_CHECKS mode of the current process
+
+    Logging is raised to WARNING so the timings only contain the helper and its annotation checks.
+
+    Args:
+        - number (int): Calls per timed run
+        - repeat (int): Number of timed runs, the fastest one is reported
+
+    Returns:
+        - dict: Microseconds per call of every helper
+    '''
+    from src.laptop_price_prediction.logger import logging
+    from src.laptop_price_prediction.utils import common
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        object_path = os.path.join(tmp_dir, 'object.pkl')
+        with open(object_path, 'wb') as file:
+            pickle.dump({'price': 1.0}, file)
+
+        json_path = os.path.join(tmp_dir, 'data.json')
+        with open(json_path, 'w') as file:
+            json.dump({'price': 1.0}, file)
+
+        connection = sqlite3.connect(':memory:')
+        ids = np.arange(100)
+
+        helpers = {
+            'load_object': lambda: common.load_object(object_path),
+            'load_json': lambda: common.load_json(json_path),
+            'get_file_hash': lambda: common.get_file_hash(json_path),
+            'get_placeholder': lambda: common.get_placeholder(connection),
+            'hash_split': lambda: common.hash_split(ids, 0.2)
+        }
+
+        return {name: round(best_time(fn, number, repeat) * 1e6, 2) for name, fn in helpers.items()}
+
+
+def run(modes: list, number: int, repeat: int) -> list:
+    '''
+    Time the helpers with every annotation checks mode, each in a fresh interpreter since the mode is read at import
+
+    Args:
+        - modes (list): ANNOTATION_CHECKS modes to compare
+        - number (int): Calls per timed run
+        - repeat (int): Number of timed runs, the fastest one is reported
+
+    Returns:
+        - list: One result dict per mode and helper
+    '''
+    timings = {}
+    for mode in modes:
+        process = subprocess.run(
+            [sys.executable, '-c', f'import json; from benchmarks.bench_annotation_checks import time_helpers; print(json.dumps(time_helpers({number}, {repeat})))'],
+            env={**os.environ, 'ANNOTATION_CHECKS': mode},
+            capture_output=True,
+            text=True,
+            check=True
+        )
+        timings[mode] = json.loads(process.stdout.strip().splitlines()[-1])
+
+    baseline = timings.get('off')
+    return [
+        {
+            'mode': mode,
+            'helper': helper,
+            'us_per_call': us,
+            'overhead_us': round(us - baseline[helper], 2) if baseline else None
+        }
+        for mode, helpers in timings.items()
+        for helper, us in helpers.items()
+    ]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure the call overhead of the ensure_annotations checks on the utils/common.py helpers')
+    parser.add_argument('--modes', nargs='+', choices=['strict', 'off'], default=['strict', 'off'])
+    parser.add_argument('--number', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    for result in run(args.modes, args.number, args.repeat):
+        print(json.dumps(result))
@@ -0,0 +1,61 @@
+import argparse
+import json
+import time
+import numpy as np
+from benchmarks.synthetic import make_synthetic_laptops
+from src.laptop_price_prediction.components.compiled_model import CompiledTreeEnsemble
+from src.laptop_price_prediction.pipeline.stage_04_prediction_pipeline import PREPROCESSOR_PATH, MODEL_PATH, FEATURE_COLUMNS
+from src.laptop_price_prediction.utils.common import load_object
+
+
+def best_time(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(batch_sizes: list, repeat: int) -> list:
+    '''
+    Compare the sklearn and compiled flat-array ensemble on the same transformed rows
+
+    Args:
+        - batch_sizes (list): Number of rows per predict call
+        - repeat (int): Number of timed calls per batch size, the fastest one is reported
+
+    Returns:
+        - list: One result dict per batch size
+    '''
+    preprocessor = load_object(PREPROCESSOR_PATH)
+    model = load_object(MODEL_PATH)
+    compiled = CompiledTreeEnsemble.from_gradient_boosting(model)
+
+    raw = make_synthetic_laptops(max(batch_sizes))
+    X = preprocessor.transform(raw[FEATURE_COLUMNS])
+
+    results = []
+    for batch_size in batch_sizes:
+        batch = X[:batch_size]
+        sklearn_seconds = best_time(lambda: model.predict(batch), repeat)
+        compiled_seconds = best_time(lambda: compiled.predict(batch), repeat)
+        results.append({
+            'batch_size': batch_size,
+            'sklearn_ms': round(sklearn_seconds * 1000, 4),
+            'compiled_ms': round(compiled_seconds * 1000, 4),
+            'speedup': round(sklearn_seconds / compiled_seconds, 2),
+            'max_abs_diff': float(np.abs(model.predict(batch) - compiled.predict(batch)).max())
+        })
+
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the compiled tree ensemble against GradientBoostingRegressor.predict')
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 10, 100, 1000, 10000])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    for result in run(args.batch_sizes, args.repeat):
+        print(json.dumps(result))
@@ -0,0 +1,68 @@
+import argparse
+import json
+import time
+import numpy as np
+from benchmarks.synthetic import make_synthetic_laptops
+from src.laptop_price_prediction.components.compiled_preprocessor import CompiledPreprocessor
+from src.laptop_price_prediction.pipeline.stage_04_prediction_pipeline import PREPROCESSOR_PATH, FEATURE_COLUMNS
+from src.laptop_price_prediction.utils.common import load_object
+
+
+def best_time(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(batch_sizes: list, repeat: int) -> list:
+    '''
+    Compare the fitted ColumnTransformer and the compiled preprocessor on the same rows
+
+    Args:
+        - batch_sizes (list): Number of rows per transform call
+        - repeat (int): Number of timed calls per batch size, the fastest one is reported
+
+    Returns:
+        - list: One result dict per batch size, plus a single-record entry
+    '''
+    preprocessor = load_object(PREPROCESSOR_PATH)
+    compiled = CompiledPreprocessor.from_preprocessor(preprocessor)
+    features = make_synthetic_laptops(max(batch_sizes))[FEATURE_COLUMNS]
+
+    record = features.iloc[0].to_dict()
+    sklearn_seconds = best_time(lambda: preprocessor.transform(features.iloc[:1]), repeat)
+    record_seconds = best_time(lambda: compiled.transform_record(record), repeat)
+    results = [{
+        'batch_size': 'record',
+        'sklearn_us': round(sklearn_seconds * 1e6, 1),
+        'compiled_us': round(record_seconds * 1e6, 1),
+        'speedup': round(sklearn_seconds / record_seconds, 1),
+        'identical': bool((preprocessor.transform(features.iloc[:1]) == compiled.transform_record(record)).all())
+    }]
+
+    for batch_size in batch_sizes:
+        batch = features.iloc[:batch_size]
+        sklearn_seconds = best_time(lambda: preprocessor.transform(batch), repeat)
+        compiled_seconds = best_time(lambda: compiled.transform(batch), repeat)
+        results.append({
+            'batch_size': batch_size,
+            'sklearn_us': round(sklearn_seconds * 1e6, 1),
+            'compiled_us': round(compiled_seconds * 1e6, 1),
+            'speedup': round(sklearn_seconds / compiled_seconds, 1),
+            'identical': bool(np.array_equal(preprocessor.transform(batch), compiled.transform(batch)))
+        })
+
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark the compiled preprocessor against the fitted ColumnTransformer')
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 100, 10000, 100000])
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    for result in run(args.batch_sizes, args.repeat):
+        print(json.dumps(result))
@@ -0,0 +1,70 @@
+import argparse
+import json
+import time
+import pandas as pd
+from benchmarks.synthetic import make_synthetic_laptops
+from src.laptop_price_prediction.components.feature_engineering import FeatureExtractor
+from src.laptop_price_prediction.components.feature_parsing import EXTRACTORS, extract_unique
+
+
+def best_time(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def extract_all_rows(df: pd.DataFrame):
+    # regex matching on every row, the baseline the factorized extraction is compared against
+    for column, extract in EXTRACTORS.items():
+        extract(df[column].reset_index(drop=True))
+
+
+def extract_distinct(df: pd.DataFrame):
+    for column, extract in EXTRACTORS.items():
+        extract_unique(df[column], extract)
+
+
+def run(rows: int, repeat: int) -> list:
+    '''
+    Time the feature extraction over every row against the extraction over distinct values only
+
+    Args:
+        - rows (int): Number of synthetic rows
+        - repeat (int): Number of timed runs, the fastest one is reported
+
+    Returns:
+        - list: One result dict per extraction method
+    '''
+    df = make_synthetic_laptops(rows)
+    extractor = FeatureExtractor().fit(df)
+
+    methods = {
+        'all_rows': lambda: extract_all_rows(df),
+        'distinct_values': lambda: extract_distinct(df),
+        'feature_extractor': lambda: extractor.transform(df)
+    }
+
+    results = []
+    for method, fn in methods.items():
+        seconds = best_time(fn, repeat)
+        results.append({
+            'method': method,
+            'rows': rows,
+            'seconds': round(seconds, 3),
+            'rows_per_s': round(rows / seconds)
+        })
+
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure the throughput of the engineered feature extraction')
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    for result in run(args.rows, args.repeat):
+        print(json.dumps(result))
@@ -0,0 +1,98 @@
+import argparse
+import json
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+# each scenario runs in a fresh interpreter, so its imports are measured from a cold start
+SCENARIOS = {
+    'prediction_module': (
+        'import src.laptop_price_prediction.pipeline.stage_04_prediction_pipeline'
+    ),
+    'streamlit_app': (
+        'import streamlit\n'
+        'from src.laptop_price_prediction.pipeline.stage_04_prediction_pipeline import Prediction, CustomData\n'
+        'from src.laptop_price_prediction.config.configurations import ConfigurationManager\n'
+        'from src.laptop_price_prediction.utils.prediction_cache import PredictionCache\n'
+        'from src.laptop_price_prediction.utils.table_io import read_table'
+    ),
+    'serving': (
+        'import src.laptop_price_prediction.serving.server'
+    ),
+    'scoring_worker': (
+        'from src.laptop_price_prediction.pipeline.stage_04_prediction_pipeline import Prediction, CustomData, '
+        'COMPILED_PREPROCESSOR_PATH, COMPILED_MODEL_PATH\n'
+        'features = CustomData("Apple", "MacBook Pro", "Ultrabook", 13.3, "IPS Panel Retina Display 2560x1600", '
+        '"Intel Core i5 2.3GHz", 8, "128GB SSD", "Intel Iris Plus Graphics 640", "macOS", 1.37).get_data_as_dataframe()\n'
+        'Prediction(COMPILED_PREPROCESSOR_PATH, COMPILED_MODEL_PATH).predict_batch(features)'
+    ),
+    'training': (
+        'import src.laptop_price_prediction.pipeline.training_pipeline'
+    )
+}
+
+
+def parse_importtime(stderr: str, top: int) -> tuple:
+    '''
+    Sum the self time of every imported module per top-level package from `-X importtime` output
+
+    Args:
+        - stderr (str): Standard error of a `python -X importtime` run
+        - top (int): Number of packages to keep
+
+    Returns:
+        - tuple: Total import time in ms and the slowest packages as {package: ms}
+    '''
+    packages = defaultdict(int)
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        packages[name.strip().split('.')[0]] += int(self_us)
+
+    slowest = sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+    return round(sum(packages.values()) / 1000, 1), {package: round(us / 1000, 1) for package, us in slowest}
+
+
+def run(scenarios: list, repeat: int, top: int) -> list:
+    '''
+    Measure the cold-start time of every scenario in a fresh interpreter
+
+    Args:
+        - scenarios (list): Names of the scenarios to run
+        - repeat (int): Number of runs, the fastest one is reported
+        - top (int): Number of packages in the import breakdown
+
+    Returns:
+        - list: One result dict per scenario
+    '''
+    results = []
+    for scenario in scenarios:
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            process = subprocess.run([sys.executable, '-X', 'importtime', '-c', SCENARIOS[scenario]], capture_output=True, text=True)
+            seconds = time.perf_counter() - start
+
+            if process.returncode != 0:
+                best = {'scenario': scenario, 'error': process.stderr.strip().splitlines()[-1]}
+                break
+            if best is None or seconds < best['wall_s']:
+                import_ms, packages = parse_importtime(process.stderr, top)
+                best = {'scenario': scenario, 'wall_s': round(seconds, 3), 'import_ms': import_ms, 'packages_ms': packages}
+
+        results.append(best)
+
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Measure the cold-start import time of the app, the serving and scoring workers and the training pipeline')
+    parser.add_argument('--scenarios', nargs='+', choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--top', type=int, default=8)
+    args = parser.parse_args()
+
+    for result in run(args.scenarios, args.repeat, args.top):
+        print(json.dumps(result))
@@ -0,0 +1,130 @@
+import argparse
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueListener
+from types import SimpleNamespace
+import numpy as np
+from src.laptop_price_prediction import logger
+from src.laptop_price_prediction.logger import logging, configure_logging
+from src.laptop_price_prediction.pipeline.stage_04_prediction_pipeline import Prediction, CustomData, COMPILED_PREPROCESSOR_PATH, COMPILED_MODEL_PATH
+
+# sync: the former setup, synchronous file and stdout handlers with every request line logged
+# queue: the same lines written by the background listener, queue_sampled: the default config.yaml levels
+MODES = {
+    'sync': {'queue': False, 'level': 'DEBUG', 'request_sample_rate': 1.0},
+    'queue': {'queue': True, 'level': 'DEBUG', 'request_sample_rate': 1.0},
+    'queue_sampled': {'queue': True, 'level': 'INFO', 'request_sample_rate': 0.01}
+}
+
+
+def use_handlers(mode: dict, log_dir: str, name: str) -> QueueListener:
+    '''
+    Point the logging setup of `mode` at a log file and a stand-in for stdout in `log_dir`
+
+    Args:
+        - mode (dict): Entry of MODES
+        - log_dir (str): Directory the log files are written to
+        - name (str): Prefix of the log files
+
+    Returns:
+        - QueueListener: Running listener of the queue modes, None for the synchronous mode
+    '''
+    formatter = logging.Formatter(logger.LOG_FORMAT)
+    handlers = [
+        logging.FileHandler(os.path.join(log_dir, f'{name}.log')),
+        logging.FileHandler(os.path.join(log_dir, f'{name}.stdout'))
+    ]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    listener = None
+    if mode['queue']:
+        logging.getLogger().handlers = [logger.queue_handler]
+        listener = QueueListener(logger.queue_handler.queue, *handlers, respect_handler_level=True)
+        listener.start()
+    else:
+        for handler in handlers:
+            handler.addFilter(logger.log_filter)
+        logging.getLogger().handlers = handlers
+
+    configure_logging(SimpleNamespace(level=mode['level'], module_levels={}, request_sample_rate=mode['request_sample_rate']))
+    return listener
+
+
+def run(modes: list, requests: int, concurrency: int) -> list:
+    '''
+    Send single-row predictions from concurrent threads under every logging mode and compare the request latency
+
+    Every request builds a CustomData row and calls Prediction.predict on the compiled artifacts,
+    the path of the Streamlit app.
+
+    Args:
+        - modes (list): Names of the logging modes to compare
+        - requests (int): Number of requests per mode
+        - concurrency (int): Number of threads sending requests
+
+    Returns:
+        - list: One result dict per mode
+    '''
+    prediction = Prediction(COMPILED_PREPROCESSOR_PATH, COMPILED_MODEL_PATH)
+
+    def request(_) -> float:
+        start = time.perf_counter()
+        features = CustomData(
+            'Apple', 'MacBook Pro', 'Ultrabook', 13.3, 'IPS Panel Retina Display 2560x1600',
+            'Intel Core i5 2.3GHz', 8, '128GB SSD', 'Intel Iris Plus Graphics 640', 'macOS', 1.37
+        ).get_data_as_dataframe()
+        prediction.predict(features)
+        return time.perf_counter() - start
+
+    results = []
+    # the benchmark listeners drain the shared queue instead of the one writing to logs/ and stdout
+    logger.listener.stop()
+    try:
+        with tempfile.TemporaryDirectory() as log_dir:
+            for name in modes:
+                listener = use_handlers(MODES[name], log_dir, name)
+                request(None)
+
+                start = time.perf_counter()
+                with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                    latencies = np.array(list(executor.map(request, range(requests)))) * 1e6
+                seconds = time.perf_counter() - start
+
+                # the queue modes are only done once the listener has written every record
+                if listener is not None:
+                    listener.stop()
+                for handler in logging.getLogger().handlers:
+                    handler.flush()
+
+                results.append({
+                    'mode': name,
+                    'requests': requests,
+                    'concurrency': concurrency,
+                    'requests_per_s': round(requests / seconds),
+                    'p50_us': round(float(np.percentile(latencies, 50)), 1),
+                    'p99_us': round(float(np.percentile(latencies, 99)), 1),
+                    'drain_s': round(time.perf_counter() - start - seconds, 3),
+                    'log_mb': round(sum(os.path.getsize(os.path.join(log_dir, file)) for file in os.listdir(log_dir) if file.startswith(name)) / 2 ** 20, 2)
+                })
+                logging.getLogger().handlers = [logger.queue_handler]
+
+    finally:
+        logging.getLogger().handlers = [logger.queue_handler]
+        logger.listener.start()
+
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare request latency with synchronous, queued and sampled logging')
+    parser.add_argument('--modes', nargs='+', choices=list(MODES), default=list(MODES))
+    parser.add_argument('--requests', type=int, default=20000)
+    parser.add_argument('--concurrency', type=int, default=8)
+    args = parser.parse_args()
+
+    for result in run(args.modes, args.requests, args.concurrency):
+        print(json.dumps(result))
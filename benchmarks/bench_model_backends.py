@@ -0,0 +1,98 @@
+import argparse
+import json
+import time
+from dataclasses import replace
+from sklearn.metrics import mean_absolute_error, r2_score
+from benchmarks.synthetic import make_synthetic_laptops
+from src.laptop_price_prediction.components.data_transformation import DataTransformation
+from src.laptop_price_prediction.config.configurations import ConfigurationManager
+from src.laptop_price_prediction.pipeline.stage_04_prediction_pipeline import FEATURE_COLUMNS
+from src.laptop_price_prediction.utils.table_io import read_table
+from src.laptop_price_prediction.utils.model_backends import MODEL_BACKENDS, STAGE_PARAMS, build_estimator
+
+TARGET = 'Price_euros'
+
+
+def best_time(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(backends: list, n_estimators: int, max_depth: int, learning_rate: float, synthetic_rows: int, repeat: int) -> list:
+    '''
+    Fit every backend with the same hyperparameters and compare fit time, predict latency and test accuracy
+
+    Args:
+        - backends (list): Model backends to compare
+        - n_estimators (int): Number of boosting stages
+        - max_depth (int): Maximum depth of the trees
+        - learning_rate (float): Learning rate
+        - synthetic_rows (int): Train on this many synthetic rows instead of train.csv to measure how fit time scales
+          (synthetic columns are sampled independently, so only the timings are meaningful)
+        - repeat (int): Number of timed predict calls, the fastest one is reported
+
+    Returns:
+        - list: One result dict per backend
+    '''
+    config = ConfigurationManager()
+    ingestion_config = config.get_data_ingestion_config()
+    transformation_config = config.get_data_transformation_config()
+
+    train = read_table(ingestion_config.train_path)
+    if synthetic_rows:
+        train = make_synthetic_laptops(synthetic_rows, raw_path=ingestion_config.raw_path)
+    test = read_table(ingestion_config.test_path)
+
+    X_train_raw, y_train = train[FEATURE_COLUMNS], train[TARGET].to_numpy()
+    X_test_raw, y_test = test[FEATURE_COLUMNS], test[TARGET].to_numpy()
+
+    results = []
+    for backend in backends:
+        transformation = DataTransformation(replace(transformation_config, model_backend=backend))
+        preprocessor = transformation.create_preprocessor()
+        X_train = preprocessor.fit_transform(X_train_raw)
+        X_test = preprocessor.transform(X_test_raw)
+
+        model = build_estimator(
+            backend,
+            n_features=X_train.shape[1],
+            categorical_features=transformation.get_categorical_features(preprocessor),
+            random_state=42
+        )
+        model.set_params(**{STAGE_PARAMS[backend]: n_estimators, 'max_depth': max_depth, 'learning_rate': learning_rate})
+
+        start = time.perf_counter()
+        model.fit(X_train, y_train)
+        fit_seconds = time.perf_counter() - start
+
+        y_pred = model.predict(X_test)
+        results.append({
+            'backend': backend,
+            'train_rows': len(X_train),
+            'fit_s': round(fit_seconds, 3),
+            'predict_1_ms': round(best_time(lambda: model.predict(X_test[:1]), repeat) * 1000, 4),
+            'predict_batch_ms': round(best_time(lambda: model.predict(X_test), repeat) * 1000, 4),
+            'batch_size': len(X_test),
+            'test_r2': round(r2_score(y_test, y_pred), 4),
+            'test_mae': round(mean_absolute_error(y_test, y_pred), 2)
+        })
+
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare fit time, predict latency and accuracy of the model backends')
+    parser.add_argument('--backends', nargs='+', choices=MODEL_BACKENDS, default=list(MODEL_BACKENDS))
+    parser.add_argument('--n-estimators', type=int, default=200)
+    parser.add_argument('--max-depth', type=int, default=5)
+    parser.add_argument('--learning-rate', type=float, default=0.1)
+    parser.add_argument('--synthetic-rows', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    for result in run(args.backends, args.n_estimators, args.max_depth, args.learning_rate, args.synthetic_rows, args.repeat):
+        print(json.dumps(result))
@@ -0,0 +1,94 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import numpy as np
+from sklearn.ensemble import GradientBoostingRegressor
+from sklearn.model_selection import GridSearchCV
+from benchmarks.synthetic import make_synthetic_laptops
+from src.laptop_price_prediction.pipeline.stage_04_prediction_pipeline import PREPROCESSOR_PATH, FEATURE_COLUMNS
+from src.laptop_price_prediction.utils.common import load_object
+from src.laptop_price_prediction.utils.memory import PeakMemorySampler
+from src.laptop_price_prediction.utils.parallel_cv import SharedMemoryGridSearch
+
+EXECUTORS = ('joblib', 'shared')
+
+# reduced grid, the benchmark measures the executor and not the search space
+PARAM_GRID = {
+    'n_estimators': [20, 50],
+    'max_depth': [3, 5],
+    'learning_rate': [1e-1]
+}
+
+
+def run_one(executor: str, rows: int, cv: int, n_jobs: int) -> dict:
+    preprocessor = load_object(PREPROCESSOR_PATH)
+    raw = make_synthetic_laptops(rows)
+    X = preprocessor.transform(raw[FEATURE_COLUMNS])
+    y = raw['Price_euros'].to_numpy(dtype=np.float64)
+
+    if executor == 'joblib':
+        search = GridSearchCV(GradientBoostingRegressor(random_state=42), PARAM_GRID, cv=cv, n_jobs=n_jobs)
+    else:
+        search = SharedMemoryGridSearch(GradientBoostingRegressor(random_state=42), PARAM_GRID, cv=cv, n_jobs=n_jobs)
+
+    start = time.perf_counter()
+    search.fit(X, y)
+    return {'fit_s': round(time.perf_counter() - start, 2), 'best_params': search.best_params_}
+
+
+def run(executors: list, rows: int, cv: int, n_jobs: int) -> list:
+    '''
+    Run every CV executor in a fresh interpreter and sample the memory of its process tree
+
+    Args:
+        - executors (list): 'joblib' (GridSearchCV) and/or 'shared' (SharedMemoryGridSearch)
+        - rows (int): Number of synthetic training rows
+        - cv (int): Number of cross-validation folds
+        - n_jobs (int): Number of worker processes
+
+    Returns:
+        - list: One result dict per executor
+    '''
+    results = []
+    for executor in executors:
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, '-m', 'benchmarks.bench_parallel_cv', '--run-one', executor,
+             '--rows', str(rows), '--cv', str(cv), '--n-jobs', str(n_jobs)],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+        )
+
+        with PeakMemorySampler(process.pid, interval=0.05) as sampler:
+            output, _ = process.communicate()
+
+        result = json.loads(output.strip().splitlines()[-1])
+        results.append({
+            'executor': executor,
+            'rows': rows,
+            'n_jobs': n_jobs,
+            'wall_s': round(time.perf_counter() - start, 2),
+            'fit_s': result['fit_s'],
+            'peak_pss_mb': round(sampler.peak_kb / 1024, 1),
+            'best_params': result['best_params']
+        })
+
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare wall time and peak memory of GridSearchCV and the shared-memory CV executor')
+    parser.add_argument('--executors', nargs='+', choices=EXECUTORS, default=list(EXECUTORS))
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--cv', type=int, default=5)
+    parser.add_argument('--n-jobs', type=int, default=os.cpu_count())
+    parser.add_argument('--run-one', choices=EXECUTORS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_one:
+        print(json.dumps(run_one(args.run_one, args.rows, args.cv, args.n_jobs)))
+    else:
+        for result in run(args.executors, args.rows, args.cv, args.n_jobs):
+            print(json.dumps(result))
@@ -0,0 +1,49 @@
+import argparse
+import os
+import tempfile
+from benchmarks.synthetic import write_synthetic_csv
+from src.laptop_price_prediction.pipeline.stage_05_batch_prediction_pipeline import BatchPredictionPipeline
+
+
+def run(n_rows: int, max_workers: int, chunk_size: int) -> list:
+    '''
+    Score the same synthetic CSV with 1..max_workers processes and report the scaling
+
+    Args:
+        - n_rows (int): Number of synthetic rows to score
+        - max_workers (int): Largest process pool size to benchmark
+        - chunk_size (int): Rows per shard
+
+    Returns:
+        - list: One result dict per pool size
+    '''
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_path = os.path.join(tmp_dir, 'laptops.csv')
+        output_path = os.path.join(tmp_dir, 'predictions.csv')
+        write_synthetic_csv(input_path, n_rows)
+
+        for workers in range(1, max_workers + 1):
+            stats = BatchPredictionPipeline(
+                input_path=input_path,
+                output_path=output_path,
+                chunk_size=chunk_size,
+                workers=workers
+            ).main()
+            stats['workers'] = workers
+            stats['speedup'] = round(stats['rows_per_sec'] / results[0]['rows_per_sec'], 2) if results else 1.0
+            results.append(stats)
+
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark sharded batch scoring from 1 to N processes')
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count())
+    parser.add_argument('--chunk-size', type=int, default=10000)
+    args = parser.parse_args()
+
+    print(f"{'workers':>8} {'seconds':>10} {'rows/sec':>12} {'speedup':>8}")
+    for result in run(args.rows, args.max_workers, args.chunk_size):
+        print(f"{result['workers']:>8} {result['seconds']:>10} {result['rows_per_sec']:>12} {result['speedup']:>8}")
@@ -0,0 +1,72 @@
+import argparse
+import json
+import time
+from sklearn.ensemble import GradientBoostingRegressor
+from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
+from src.laptop_price_prediction.config.configurations import ConfigurationManager
+from src.laptop_price_prediction.utils.common import load_transformed_data
+from src.laptop_price_prediction.utils.model_search import SEARCH_STRATEGIES, build_search
+
+
+def run(strategies: list, cv: int, n_jobs: int, n_iter: int, time_budget_seconds: float) -> list:
+    '''
+    Run every search strategy on the transformed train data and score the refitted best model on the test data
+
+    Args:
+        - strategies (list): Search strategies to compare
+        - cv (int): Number of cross-validation folds
+        - n_jobs (int): Number of parallel jobs
+        - n_iter (int): Maximum number of candidates of the random strategy
+        - time_budget_seconds (float): Wall-clock budget of the random strategy
+
+    Returns:
+        - list: One result dict per strategy
+    '''
+    config = ConfigurationManager().get_data_transformation_config()
+    train_arr = load_transformed_data(config.train_arr_path)
+    test_arr = load_transformed_data(config.test_arr_path)
+    X_train, y_train = train_arr[:, :-1], train_arr[:, -1]
+    X_test, y_test = test_arr[:, :-1], test_arr[:, -1]
+
+    results = []
+    for strategy in strategies:
+        search = build_search(
+            GradientBoostingRegressor(), strategy=strategy, cv=cv, n_jobs=n_jobs,
+            n_iter=n_iter, time_budget_seconds=time_budget_seconds
+        )
+        start = time.perf_counter()
+        search.fit(X_train, y_train)
+        seconds = time.perf_counter() - start
+
+        y_pred = search.best_estimator_.predict(X_test)
+        results.append({
+            'strategy': strategy,
+            'seconds': round(seconds, 2),
+            'candidates': len(search.cv_results_['params']),
+            'cv_r2': round(float(search.best_score_), 4),
+            'test_r2': round(r2_score(y_test, y_pred), 4),
+            'test_mse': round(mean_squared_error(y_test, y_pred), 2),
+            'test_mae': round(mean_absolute_error(y_test, y_pred), 2),
+            'params': {name: value.item() if hasattr(value, 'item') else value for name, value in search.best_params_.items()}
+        })
+
+    grid = next((result for result in results if result['strategy'] == 'grid'), None)
+    if grid is not None:
+        for result in results:
+            result['speedup_vs_grid'] = round(grid['seconds'] / result['seconds'], 2)
+            result['test_r2_delta_vs_grid'] = round(result['test_r2'] - grid['test_r2'], 4)
+
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare wall-clock time and test metrics of the hyperparameter search strategies')
+    parser.add_argument('--strategies', nargs='+', choices=SEARCH_STRATEGIES, default=list(SEARCH_STRATEGIES))
+    parser.add_argument('--cv', type=int, default=5)
+    parser.add_argument('--n-jobs', type=int, default=-1)
+    parser.add_argument('--n-iter', type=int, default=20)
+    parser.add_argument('--time-budget-seconds', type=float, default=None)
+    args = parser.parse_args()
+
+    for result in run(args.strategies, args.cv, args.n_jobs, args.n_iter, args.time_budget_seconds):
+        print(json.dumps(result))
@@ -0,0 +1,290 @@
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from dataclasses import replace
+from pathlib import Path
+import numpy as np
+from sklearn.model_selection import ParameterGrid
+from benchmarks.synthetic import make_synthetic_laptops
+from src.laptop_price_prediction.logger import logging
+from src.laptop_price_prediction.config.configurations import ConfigurationManager
+from src.laptop_price_prediction.components.data_ingestion import DataIngestion
+from src.laptop_price_prediction.components.data_transformation import DataTransformation
+from src.laptop_price_prediction.components.model_building_and_evaluation import ModelBuilding
+from src.laptop_price_prediction.components.compiled_model import CompiledTreeEnsemble
+from src.laptop_price_prediction.pipeline.stage_04_prediction_pipeline import Prediction, FEATURE_COLUMNS
+from src.laptop_price_prediction.utils.common import load_object, load_json
+from src.laptop_price_prediction.utils.model_backends import MODEL_BACKENDS
+from src.laptop_price_prediction.utils.table_io import read_table
+
+SIZES = (1000, 100000, 1000000)
+
+# reduced fixed grid, the same candidates on every run so timings compare against a stored baseline
+PARAM_GRID = {
+    'n_estimators': [20, 50],
+    'max_depth': [3, 5],
+    'learning_rate': [1e-1]
+}
+
+# metrics compared against the baseline, mapped to True when a higher value is worse
+COMPARED_METRICS = {'seconds': True, 'load_ms': True, 'p50_ms': True, 'p99_ms': True, 'rows_per_s': False}
+
+
+def best_time(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def timed(fn) -> tuple:
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def build_configs(work_dir: str, backend: str, cv: int) -> tuple:
+    '''
+    Point the config.yaml settings of the ingestion, transformation and model building stages at `work_dir`
+
+    The model search is an exhaustive grid search, run by `run_size` on the reduced PARAM_GRID.
+
+    Args:
+        - work_dir (str): Directory every table, array and artifact is written to
+        - backend (str): Model backend, the one of config.yaml if None
+        - cv (int): Number of cross-validation folds of the search
+
+    Returns:
+        - tuple: DataIngestionConfig, DataTransformationConfig and ModelBuildingConfig
+    '''
+    config = ConfigurationManager()
+    ingestion_config = config.get_data_ingestion_config()
+    transformation_config = config.get_data_transformation_config()
+    model_config = config.get_model_building_config()
+    backend = backend or model_config.backend
+
+    ingestion_config = replace(
+        ingestion_config,
+        raw_path=os.path.join(work_dir, Path(ingestion_config.raw_path).name),
+        train_path=os.path.join(work_dir, Path(ingestion_config.train_path).name),
+        test_path=os.path.join(work_dir, Path(ingestion_config.test_path).name),
+        watermark_path=os.path.join(work_dir, 'watermark.json'),
+        # the incremental mode appends to the files of the previous run
+        mode='full' if ingestion_config.mode == 'incremental' else ingestion_config.mode
+    )
+    transformation_config = replace(
+        transformation_config,
+        preprocessor_path=os.path.join(work_dir, 'preprocessor.pkl'),
+        compiled_preprocessor_path=os.path.join(work_dir, 'compiled_preprocessor.pkl'),
+        train_arr_path=os.path.join(work_dir, 'train_arr.npy'),
+        test_arr_path=os.path.join(work_dir, 'test_arr.npy'),
+        model_backend=backend
+    )
+    model_config = replace(
+        model_config,
+        model_path=os.path.join(work_dir, 'model.pkl'),
+        compiled_model_path=os.path.join(work_dir, 'compiled_model.npz'),
+        train_metrics_path=os.path.join(work_dir, 'train_metrics.json'),
+        test_metrics_path=os.path.join(work_dir, 'test_metrics.json'),
+        backend=backend,
+        search=replace(model_config.search, strategy='grid', cv=cv)
+    )
+    return ingestion_config, transformation_config, model_config
+
+
+def create_database(file_path: str, table: str, n_rows: int, seed: int, chunk_size: int = 100000):
+    # SQLite stand-in for the MySQL table, filled chunk by chunk so 1M rows never sit in memory at once
+    with sqlite3.connect(file_path) as connection:
+        for offset in range(0, n_rows, chunk_size):
+            chunk = make_synthetic_laptops(min(chunk_size, n_rows - offset), seed=seed + offset)
+            chunk['laptop_ID'] += offset
+            chunk.to_sql(table, connection, if_exists='replace' if offset == 0 else 'append', index=False)
+
+
+def run_size(n_rows: int, work_dir: str, args) -> list:
+    '''
+    Run ingestion, transformation and model building on `n_rows` synthetic laptops, then time the trained artifacts
+
+    Args:
+        - n_rows (int): Number of rows of the synthetic table
+        - work_dir (str): Directory the database, tables and artifacts are written to
+        - args (argparse.Namespace): Search, prediction and repeat settings of the command line
+
+    Returns:
+        - list: One result dict per stage, artifact and prediction mode
+    '''
+    ingestion_config, transformation_config, model_config = build_configs(work_dir, args.backend, args.cv)
+    database_path = os.path.join(work_dir, 'laptops.db')
+    create_database(database_path, ingestion_config.table, n_rows, args.seed)
+
+    results = []
+    with sqlite3.connect(database_path) as connection:
+        ingestion = DataIngestion(ingestion_config, connection=connection)
+        (train_path, test_path), seconds = timed(ingestion.initiate_data_ingestion)
+    results.append({'stage': 'ingestion', 'mode': ingestion_config.mode, 'seconds': round(seconds, 3), 'rows_per_s': round(n_rows / seconds)})
+
+    transformation = DataTransformation(transformation_config)
+    _, seconds = timed(lambda: transformation.initiate_data_transformation(train_data=train_path, test_data=test_path))
+    results.append({'stage': 'data_transformation', 'seconds': round(seconds, 3), 'rows_per_s': round(n_rows / seconds)})
+
+    sidecar = load_json(Path(transformation_config.train_arr_path).with_suffix('.json'))
+    model_building = ModelBuilding(model_config)
+    _, seconds = timed(lambda: model_building.initiate_model_building(
+        train_arr=transformation_config.train_arr_path,
+        test_arr=transformation_config.test_arr_path,
+        categorical_features=sidecar.get('categorical', []),
+        param_grid=PARAM_GRID
+    ))
+    # the synthetic columns are sampled independently, so only the time of the fit is meaningful, not its scores
+    results.append({'stage': 'model_building', 'backend': model_config.backend, 'candidates': len(ParameterGrid(PARAM_GRID)), 'cv': args.cv, 'seconds': round(seconds, 3)})
+
+    # the compiled model is only exported for GradientBoostingRegressor
+    artifacts = {
+        'pickle': (transformation_config.preprocessor_path, model_config.model_path, load_object),
+        'compiled': (transformation_config.compiled_preprocessor_path, model_config.compiled_model_path, CompiledTreeEnsemble.load)
+    }
+    artifacts = {name: paths for name, paths in artifacts.items() if os.path.exists(paths[1])}
+
+    for name, (preprocessor_path, model_path, model_loader) in artifacts.items():
+        for artifact, path, loader in (('preprocessor', preprocessor_path, load_object), ('model', model_path, model_loader)):
+            results.append({
+                'stage': 'artifact_load',
+                'artifacts': name,
+                'artifact': artifact,
+                'size_mb': round(os.path.getsize(path) / 2 ** 20, 3),
+                'load_ms': round(best_time(lambda: loader(path), args.repeat) * 1000, 3)
+            })
+
+    features = read_table(test_path)[FEATURE_COLUMNS]
+    rows = [features.iloc[[i]] for i in range(min(args.single_requests, len(features)))]
+    batch = features.iloc[:args.batch_size]
+
+    for name, (preprocessor_path, model_path, _) in artifacts.items():
+        prediction = Prediction(preprocessor_path, model_path)
+        if prediction.predict(rows[0]) is None:
+            raise RuntimeError(f'Single-row prediction with the {name} artifacts failed, see the logs')
+
+        latencies = []
+        for row in rows:
+            start = time.perf_counter()
+            prediction.predict(row)
+            latencies.append(time.perf_counter() - start)
+        latencies = np.array(latencies) * 1000
+
+        results.append({
+            'stage': 'predict_single',
+            'artifacts': name,
+            'requests': len(rows),
+            'p50_ms': round(float(np.percentile(latencies, 50)), 4),
+            'p99_ms': round(float(np.percentile(latencies, 99)), 4),
+            'rows_per_s': round(len(rows) / (latencies.sum() / 1000))
+        })
+
+        seconds = best_time(lambda: prediction.predict_batch(batch), args.repeat)
+        results.append({
+            'stage': 'predict_batch',
+            'artifacts': name,
+            'batch_size': len(batch),
+            'seconds': round(seconds, 4),
+            'rows_per_s': round(len(batch) / seconds)
+        })
+
+    for result in results:
+        result['rows'] = n_rows
+    return results
+
+
+def result_key(result: dict) -> tuple:
+    return tuple(result.get(field) for field in ('rows', 'stage', 'mode', 'backend', 'artifacts', 'artifact', 'batch_size'))
+
+
+def compare(results: list, baseline: list, tolerance: float) -> list:
+    '''
+    Annotate every result with its relative change against the matching baseline result
+
+    Args:
+        - results (list): Results of the current run
+        - baseline (list): Results of a stored run
+        - tolerance (float): Relative slowdown above which a metric is reported as a regression, e.g. 0.2 for 20%
+
+    Returns:
+        - list: The results with `change_vs_baseline` and `regressions` set where a baseline result exists
+    '''
+    baseline = {result_key(result): result for result in baseline}
+    for result in results:
+        previous = baseline.get(result_key(result))
+        if previous is None:
+            continue
+
+        result['change_vs_baseline'] = {}
+        result['regressions'] = []
+        for metric, higher_is_worse in COMPARED_METRICS.items():
+            if not result.get(metric) or not previous.get(metric):
+                continue
+            change = result[metric] / previous[metric] - 1
+            result['change_vs_baseline'][metric] = round(change, 4)
+            if (change if higher_is_worse else -change) > tolerance:
+                result['regressions'].append(metric)
+
+    return results
+
+
+def run(sizes: list, args) -> list:
+    '''
+    Benchmark the training pipeline stages and the prediction paths on synthetic laptop tables of every size
+
+    Every size runs in its own temporary directory, so the artifacts/ of the project are left untouched.
+    Logging is raised to WARNING so the timings do not include the per-stage log lines.
+
+    Args:
+        - sizes (list): Number of rows of the synthetic tables
+        - args (argparse.Namespace): Search, prediction and repeat settings of the command line
+
+    Returns:
+        - list: One result dict per size, stage, artifact and prediction mode
+    '''
+    logging.getLogger().setLevel(logging.WARNING)
+
+    results = []
+    for n_rows in sizes:
+        with tempfile.TemporaryDirectory() as work_dir:
+            results.extend(run_size(n_rows, work_dir, args))
+
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Time ingestion, transformation, model building, artifact loading and prediction on synthetic laptop tables')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES))
+    parser.add_argument('--backend', choices=MODEL_BACKENDS, default=None, help='Model backend, the one of config.yaml by default')
+    parser.add_argument('--cv', type=int, default=3)
+    parser.add_argument('--single-requests', type=int, default=500)
+    parser.add_argument('--batch-size', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default=None, help='JSON file the results are saved to, e.g. to be used as a later baseline')
+    parser.add_argument('--baseline', default=None, help='JSON file of a previous run to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Relative slowdown reported as a regression')
+    args = parser.parse_args()
+
+    results = run(args.sizes, args)
+    if args.baseline is not None:
+        with open(args.baseline) as file:
+            results = compare(results, json.load(file), args.tolerance)
+
+    for result in results:
+        print(json.dumps(result))
+
+    if args.output is not None:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=4)
+
+    # a non-zero exit status lets CI fail on a regression
+    if any(result.get('regressions') for result in results):
+        sys.exit(1)
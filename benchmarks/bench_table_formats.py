@@ -0,0 +1,71 @@
+import argparse
+import json
+import os
+import tempfile
+import time
+from benchmarks.synthetic import make_synthetic_laptops
+from src.laptop_price_prediction.components.data_transformation import NUMERIC_FEATURES, CATEGORICAL_FEATURES, TARGET
+from src.laptop_price_prediction.utils.table_io import TABLE_FORMATS, read_table, write_table
+
+# columns read by each consumer of the ingestion artifacts
+READERS = {
+    'all_columns': None,
+    'transformation': NUMERIC_FEATURES + CATEGORICAL_FEATURES + TARGET,
+    'app': CATEGORICAL_FEATURES
+}
+
+
+def best_time(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(rows: int, formats: list, repeat: int) -> list:
+    '''
+    Write the same synthetic table in every artifact format and time the readers of each consumer
+
+    Args:
+        - rows (int): Number of synthetic rows
+        - formats (list): Artifact formats to compare
+        - repeat (int): Number of timed reads, the fastest one is reported
+
+    Returns:
+        - list: One result dict per format
+    '''
+    df = make_synthetic_laptops(rows)
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for table_format in formats:
+            file_path = os.path.join(tmp_dir, f'raw.{table_format}')
+
+            start = time.perf_counter()
+            write_table(df, file_path)
+            result = {
+                'format': table_format,
+                'rows': rows,
+                'size_mb': round(os.path.getsize(file_path) / 2 ** 20, 2),
+                'write_s': round(time.perf_counter() - start, 3)
+            }
+
+            for reader, columns in READERS.items():
+                result[f'read_{reader}_s'] = round(best_time(lambda: read_table(file_path, columns=columns), repeat), 3)
+
+            results.append(result)
+
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compare disk size and read time of the csv and parquet ingestion artifacts')
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--formats', nargs='+', choices=TABLE_FORMATS, default=list(TABLE_FORMATS))
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    for result in run(args.rows, args.formats, args.repeat):
+        print(json.dumps(result))
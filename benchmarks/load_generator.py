@@ -0,0 +1,99 @@
+import argparse
+import asyncio
+import json
+import time
+import numpy as np
+from benchmarks.synthetic import RAW_DATA_PATH
+from src.laptop_price_prediction.pipeline.stage_04_prediction_pipeline import FEATURE_COLUMNS
+from src.laptop_price_prediction.utils.table_io import read_table
+
+
+def load_payloads(n_payloads: int = 1000, seed: int = 42) -> list:
+    '''
+    Build single-row /predict request bodies from rows of raw.csv
+
+    Args:
+        - n_payloads (int): Number of distinct bodies to build
+        - seed (int): Seed used to sample the rows
+
+    Returns:
+        - list: Encoded JSON bodies
+    '''
+    raw = read_table(RAW_DATA_PATH, columns=FEATURE_COLUMNS)
+    rows = raw.sample(n=n_payloads, replace=True, random_state=seed)
+    return [json.dumps(record).encode() for record in rows.to_dict(orient='records')]
+
+
+async def client(host: str, port: int, payloads: list, n_requests: int, latencies: list):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for i in range(n_requests):
+            body = payloads[i % len(payloads)]
+            writer.write(
+                f'POST /predict HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n'
+                f'Content-Length: {len(body)}\r\n\r\n'.encode('latin-1') + body
+            )
+            start = time.perf_counter()
+            await writer.drain()
+
+            status_line = await reader.readline()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                if name.lower() == 'content-length':
+                    length = int(value)
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - start)
+
+            if b' 200 ' not in status_line:
+                raise RuntimeError(f'Unexpected response: {status_line!r}')
+    finally:
+        writer.close()
+
+
+async def run(host: str, port: int, concurrency: int, total_requests: int) -> dict:
+    '''
+    Send `total_requests` single-row predictions over `concurrency` keep-alive connections
+
+    Args:
+        - host (str): Server host
+        - port (int): Server port
+        - concurrency (int): Number of concurrent connections
+        - total_requests (int): Number of requests sent across all connections
+
+    Returns:
+        - dict: Throughput and latency percentiles in milliseconds
+    '''
+    payloads = load_payloads()
+    latencies = []
+    per_client = total_requests // concurrency
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, payloads, per_client, latencies) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies_ms = np.array(latencies) * 1000
+    return {
+        'concurrency': concurrency,
+        'requests': len(latencies),
+        'seconds': round(elapsed, 3),
+        'requests_per_sec': round(len(latencies) / elapsed, 1),
+        'p50_ms': round(float(np.percentile(latencies_ms, 50)), 2),
+        'p95_ms': round(float(np.percentile(latencies_ms, 95)), 2),
+        'p99_ms': round(float(np.percentile(latencies_ms, 99)), 2)
+    }
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate concurrent single-row load against the prediction server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32, 64])
+    parser.add_argument('--requests', type=int, default=2000)
+    args = parser.parse_args()
+
+    for concurrency in args.concurrency:
+        print(json.dumps(asyncio.run(run(args.host, args.port, concurrency, args.requests))))
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+from src.laptop_price_prediction.utils.table_io import read_table
+
+RAW_DATA_PATH = 'artifacts/data_ingestion/raw.csv'
+
+
+def make_synthetic_laptops(n_rows: int, seed: int = 42, raw_path=RAW_DATA_PATH) -> pd.DataFrame:
+    '''
+    Generate a synthetic laptop dataset with the raw.csv schema
+
+    Every column is sampled independently from the values observed in raw.csv, so the
+    strings keep their original format ('8GB', '1.37kg', '128GB SSD + 1TB HDD', ...).
+
+    Args:
+        - n_rows (int): Number of rows to generate
+        - seed (int): Seed of the random generator
+        - raw_path (str): Path to the raw dataset the values are sampled from
+
+    Returns:
+        - pd.DataFrame: Synthetic dataset with unique, increasing laptop_ID values
+    '''
+    rng = np.random.default_rng(seed)
+    raw = read_table(raw_path)
+
+    data = {'laptop_ID': np.arange(1, n_rows + 1)}
+    for column in raw.columns.drop('laptop_ID'):
+        values = raw[column].to_numpy()
+        data[column] = values[rng.integers(0, len(values), size=n_rows)]
+
+    return pd.DataFrame(data)
+
+
+def write_synthetic_csv(file_path, n_rows: int, seed: int = 42, chunk_size: int = 100000):
+    '''
+    Write a synthetic laptop dataset to a CSV file without holding it all in memory
+
+    Args:
+        - file_path (str): Path of the CSV file to write
+        - n_rows (int): Number of rows to generate
+        - seed (int): Seed of the random generator
+        - chunk_size (int): Number of rows generated and written at a time
+    '''
+    written = 0
+    while written < n_rows:
+        size = min(chunk_size, n_rows - written)
+        chunk = make_synthetic_laptops(size, seed=seed + written)
+        chunk['laptop_ID'] += written
+        chunk.to_csv(file_path, mode='w' if written == 0 else 'a', header=written == 0, index=False)
+        written += size
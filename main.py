@@ -1,41 +1,39 @@
+import argparse
 import logging
-from src.laptop_price_prediction.pipeline.stage_01_data_ingestion_pipeline import DataIngestionPipeline
-from src.laptop_price_prediction.pipeline.stage_02_data_transformation_pipeline import DataTransformationPipeline
-from src.laptop_price_prediction.pipeline.stage_03_model_building_pipeline import ModelBuildingPipeline
+from src.laptop_price_prediction.config.configurations import ConfigurationManager
+from src.laptop_price_prediction.logger import configure_logging
+from src.laptop_price_prediction.pipeline.dag import DAGRunner
+from src.laptop_price_prediction.pipeline.training_pipeline import STAGES, build_training_stages
+from src.laptop_price_prediction.utils.stage_cache import StageCache
+from src.laptop_price_prediction.utils.metrics import metrics
 
-STAGE_NAME = "Data Ingestion"
 if __name__ == "__main__":
-    try:
-        logging.info(f"Initiating {STAGE_NAME} Pipeline")
-        train_data_path, test_data_path = DataIngestionPipeline().main()
-        logging.info(f"{STAGE_NAME} Pipeline completed successfully")
-    
-    except Exception as e:
-        logging.error(f"Error in {STAGE_NAME} Pipeline: {e}")
-        raise e
-    
+    parser = argparse.ArgumentParser(description='Run the training pipeline, skipping the stages whose inputs, config and code did not change')
+    parser.add_argument('--force', nargs='*', choices=STAGES + ('all',), default=[], help='Stages to rerun even if they are unchanged')
+    args = parser.parse_args()
+    force = set(STAGES) if 'all' in args.force else set(args.force)
 
-STAGE_NAME = "Data Transformation"
-
-if __name__ == "__main__":
     try:
-        logging.info(f"Initiating {STAGE_NAME} Pipeline")
-        train_arr, test_arr = DataTransformationPipeline(train_data_path, test_data_path).main()
-        logging.info(f"{STAGE_NAME} Pipeline completed successfully")        
-    
-    except Exception as e:
-        logging.error(f"Error in {STAGE_NAME} Pipeline: {e}")
-        raise e
-    
+        config = ConfigurationManager()
+        configure_logging(config.get_logging_config())
+        metrics_config = config.get_metrics_config()
+        metrics.configure(metrics_config)
+        stage_cache_config = config.get_stage_cache_config()
 
-STAGE_NAME = "Model Building"
+        logging.info(f"Initiating Training Pipeline")
+        runner = DAGRunner(
+            build_training_stages(config),
+            stage_cache=StageCache(stage_cache_config.state_path),
+            manifest_path=stage_cache_config.manifest_path,
+            max_workers=stage_cache_config.max_parallel_stages
+        )
+        runner.run(force=force)
+        logging.info(f"Training Pipeline completed successfully, run manifest saved to {stage_cache_config.manifest_path}")
+
+        if metrics.enabled:
+            metrics.save(json_path=metrics_config.json_path, prometheus_path=metrics_config.prometheus_path)
+            logging.info(f"Metrics saved to {metrics_config.json_path} and {metrics_config.prometheus_path}")
 
-if __name__ == "__main__":
-    try:
-        logging.info(f"Initiating {STAGE_NAME} Pipeline")
-        ModelBuildingPipeline(train_arr, test_arr).main()
-        logging.info(f"{STAGE_NAME} Pipeline completed successfully")
-    
     except Exception as e:
-        logging.error(f"Error in {STAGE_NAME} Pipeline: {e}")
-        raise e
\ No newline at end of file
+        logging.error(f"Error in Training Pipeline: {e}")
+        raise e
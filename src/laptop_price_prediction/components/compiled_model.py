@@ -0,0 +1,203 @@
+import os
+import numpy as np
+from src.laptop_price_prediction.logger import logging
+
+# rows evaluated at a time, bounds the (rows x trees) node index matrix
+PREDICT_BLOCK_SIZE = 256
+
+
+class CompiledTreeEnsemble:
+    def __init__(self, feature, threshold, left, right, value, roots, max_depth: int, base_prediction: float):
+        '''
+        Tree ensemble flattened into contiguous NumPy arrays
+
+        Node `i` of the flattened forest splits on `feature[i]` at `threshold[i]` and continues to
+        `left[i]` or `right[i]`. Leaves point to themselves and hold the learning-rate-scaled leaf
+        value, so every tree can be walked for a fixed `max_depth` steps and the prediction is
+        `base_prediction + value[leaves].sum()`.
+
+        Args:
+            - feature (np.ndarray): Split feature per node
+            - threshold (np.ndarray): Split threshold per node
+            - left (np.ndarray): Index of the left child per node
+            - right (np.ndarray): Index of the right child per node
+            - value (np.ndarray): Scaled leaf value per node
+            - roots (np.ndarray): Index of the root node of every tree
+            - max_depth (int): Depth of the deepest tree
+            - base_prediction (float): Initial prediction the tree outputs are added to
+        '''
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.value = value
+        self.roots = roots
+        self.max_depth = int(max_depth)
+        self.base_prediction = float(base_prediction)
+
+    @classmethod
+    def from_gradient_boosting(cls, model):
+        '''
+        Flatten a fitted GradientBoostingRegressor
+
+        Args:
+            - model (GradientBoostingRegressor): Fitted model
+
+        Returns:
+            - CompiledTreeEnsemble: Flattened ensemble predicting the same values as `model`
+
+        Raises:
+            - ValueError: If the model uses an initial estimator other than the default constant one
+        '''
+        from sklearn.dummy import DummyRegressor
+
+        if isinstance(model.init_, str) and model.init_ == 'zero':
+            base_prediction = 0.0
+        elif isinstance(model.init_, DummyRegressor):
+            base_prediction = float(np.ravel(model.init_.constant_)[0])
+        else:
+            raise ValueError(f'Unsupported initial estimator: {model.init_!r}')
+
+        features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+        offset = 0
+        max_depth = 0
+
+        for estimator in model.estimators_[:, 0]:
+            tree = estimator.tree_
+            n_nodes = tree.node_count
+            nodes = np.arange(offset, offset + n_nodes, dtype=np.int32)
+            is_leaf = tree.children_left == -1
+
+            features.append(np.where(is_leaf, 0, tree.feature).astype(np.int32))
+            thresholds.append(np.where(is_leaf, np.inf, tree.threshold))
+            lefts.append(np.where(is_leaf, nodes, tree.children_left + offset).astype(np.int32))
+            rights.append(np.where(is_leaf, nodes, tree.children_right + offset).astype(np.int32))
+            values.append(np.where(is_leaf, tree.value[:, 0, 0] * model.learning_rate, 0.0))
+            roots.append(offset)
+
+            max_depth = max(max_depth, tree.max_depth)
+            offset += n_nodes
+
+        logging.info(f'Compiled {len(roots)} trees with {offset} nodes into flat arrays')
+
+        return cls(
+            feature=np.concatenate(features),
+            threshold=np.concatenate(thresholds),
+            left=np.concatenate(lefts),
+            right=np.concatenate(rights),
+            value=np.concatenate(values),
+            roots=np.asarray(roots, dtype=np.int32),
+            max_depth=max_depth,
+            base_prediction=base_prediction
+        )
+
+    def predict(self, X) -> np.ndarray:
+        '''
+        Predict with every tree at once using vectorized NumPy indexing
+
+        Args:
+            - X (np.ndarray): Transformed features, one row per sample
+
+        Returns:
+            - np.ndarray: Predictions, one per row
+        '''
+        # sklearn compares float32 features against float64 thresholds
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+
+        predictions = np.empty(X.shape[0])
+        for start in range(0, X.shape[0], PREDICT_BLOCK_SIZE):
+            predictions[start:start + PREDICT_BLOCK_SIZE] = self._predict_block(X[start:start + PREDICT_BLOCK_SIZE])
+        return predictions
+
+    def _predict_block(self, X: np.ndarray) -> np.ndarray:
+        n_rows, n_features = X.shape
+        flat = X.ravel()
+        row_offsets = (np.arange(n_rows) * n_features)[:, None]
+        nodes = np.broadcast_to(self.roots, (n_rows, self.roots.shape[0]))
+
+        for _ in range(self.max_depth):
+            go_left = flat.take(row_offsets + self.feature.take(nodes)) <= self.threshold.take(nodes)
+            nodes = np.where(go_left, self.left.take(nodes), self.right.take(nodes))
+
+        return self.base_prediction + self.value.take(nodes).sum(axis=1)
+
+    def save(self, file_path):
+        '''
+        Save the flattened ensemble to an uncompressed .npz file
+
+        Args:
+            - file_path (str): Path to the .npz file
+        '''
+        with open(file_path, 'wb') as file:
+            np.savez(
+                file,
+                feature=self.feature,
+                threshold=self.threshold,
+                left=self.left,
+                right=self.right,
+                value=self.value,
+                roots=self.roots,
+                max_depth=self.max_depth,
+                base_prediction=self.base_prediction
+            )
+
+    @classmethod
+    def load(cls, file_path):
+        '''
+        Load a flattened ensemble saved with `save`
+
+        Args:
+            - file_path (str): Path to the .npz file
+
+        Returns:
+            - CompiledTreeEnsemble: Loaded ensemble
+        '''
+        with np.load(file_path) as arrays:
+            return cls(
+                feature=arrays['feature'],
+                threshold=arrays['threshold'],
+                left=arrays['left'],
+                right=arrays['right'],
+                value=arrays['value'],
+                roots=arrays['roots'],
+                max_depth=arrays['max_depth'],
+                base_prediction=arrays['base_prediction']
+            )
+
+
+def export_compiled_model(model, file_path) -> bool:
+    '''
+    Flatten a fitted model and save it next to the pickled one
+
+    A compiled model left by an earlier run is removed when the model cannot be exported,
+    so it is never scored in place of the model it does not match.
+
+    Args:
+        - model (object): Fitted model
+        - file_path (str): Path to the .npz file
+
+    Returns:
+        - bool: True if the model was exported, False if its type is not supported and no compiled model is left at `file_path`
+
+    Raises:
+        - Error: If there is an error flattening or saving the model
+    '''
+    from sklearn.ensemble import GradientBoostingRegressor
+
+    try:
+        if not isinstance(model, GradientBoostingRegressor):
+            logging.info(f'Skipping compiled model export, {type(model).__name__} is not supported')
+            if os.path.exists(file_path):
+                os.remove(file_path)
+                logging.info(f'Removed the stale compiled model {file_path}')
+            return False
+
+        CompiledTreeEnsemble.from_gradient_boosting(model).save(file_path)
+        logging.info(f'Compiled model saved to {file_path}')
+        return True
+
+    except Exception as e:
+        logging.error(f'Error exporting compiled model: {e}')
+        raise e
@@ -0,0 +1,278 @@
+import os
+import numpy as np
+import pandas as pd
+from src.laptop_price_prediction.logger import logging
+from src.laptop_price_prediction.utils.common import save_object
+
+# probe value that no fitted OrdinalEncoder has seen, used to pre-compute the unknown=-1 output
+UNKNOWN_PROBE = '\x00__unknown__'
+
+# below this many rows plain dict lookups beat the fixed overhead of pandas' vectorized indexer
+DICT_LOOKUP_MAX_ROWS = 2048
+
+
+class NumericColumn:
+    def __init__(self, name: str, fill: float, mean: float, scale: float):
+        '''
+        Imputation and standard scaling of one numeric column fused into a single affine step
+
+        Args:
+            - name (str): Input column name
+            - fill (float): Value missing entries are imputed with
+            - mean (float): Mean subtracted by the scaler
+            - scale (float): Standard deviation the centred value is divided by
+        '''
+        self.name = name
+        self.fill = fill
+        self.mean = mean
+        self.scale = scale
+        self.fill_value = (fill - mean) / scale
+
+    def transform(self, values) -> np.ndarray:
+        try:
+            values = np.asarray(values, dtype=np.float64)
+        except (TypeError, ValueError):
+            values = pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(dtype=np.float64)
+        return np.where(np.isnan(values), self.fill_value, (values - self.mean) / self.scale)
+
+    def transform_value(self, value) -> float:
+        if value is None or value != value:
+            return self.fill_value
+        return (float(value) - self.mean) / self.scale
+
+
+class CategoricalColumn:
+    def __init__(self, name: str, categories, values, unknown_value: float, missing_value: float):
+        '''
+        Imputation, ordinal encoding and standard scaling of one categorical column pre-computed as a lookup table
+
+        Args:
+            - name (str): Input column name
+            - categories (list): Categories seen during fitting
+            - values (np.ndarray): Final transformed value of every category
+            - unknown_value (float): Final value of categories unseen during fitting
+            - missing_value (float): Final value of missing entries
+        '''
+        self.name = name
+        self.index = pd.Index(categories, dtype=object)
+        # get_indexer returns -1 for unknown categories, which lands on the trailing unknown slot
+        self.table = np.append(np.asarray(values, dtype=np.float64), unknown_value)
+        self.lookup = dict(zip(categories, self.table[:-1].tolist()))
+        self.unknown_value = float(unknown_value)
+        self.missing_value = float(missing_value)
+
+    def transform(self, values) -> np.ndarray:
+        if len(values) <= DICT_LOOKUP_MAX_ROWS:
+            return np.array([self.transform_value(value) for value in values], dtype=np.float64)
+
+        values = np.asarray(values, dtype=object)
+        transformed = self.table[self.index.get_indexer(values)]
+        missing = pd.isna(values)
+        if missing.any():
+            transformed[missing] = self.missing_value
+        return transformed
+
+    def transform_value(self, value) -> float:
+        if value is None or value != value:
+            return self.missing_value
+        return self.lookup.get(value, self.unknown_value)
+
+
+class FunctionStep:
+    def __init__(self, transform, transform_record):
+        '''
+        Stateless step run before the column specs, given as plain module-level functions
+
+        Functions are pickled by reference, so loading the compiled preprocessor only imports the
+        module defining them instead of the transformer (and sklearn) they were compiled from.
+
+        Args:
+            - transform (callable): Function transforming a DataFrame of rows
+            - transform_record (callable): Function transforming a single record dict
+        '''
+        self.transform = transform
+        self.transform_record = transform_record
+
+
+class CompiledPreprocessor:
+    def __init__(self, columns: list, pre_steps: list = None):
+        '''
+        Inference-only replacement for the fitted preprocessor
+
+        Numeric columns become a fused impute + affine transform and categorical columns a lookup
+        table to their final scaled value, so transforming a batch is pure NumPy and a single record
+        is a handful of dict lookups.
+
+        Args:
+            - columns (list): NumericColumn / CategoricalColumn specs in output order
+            - pre_steps (list): Fitted transformers applied to the raw frame before the column specs
+        '''
+        self.columns = columns
+        self.pre_steps = pre_steps or []
+
+    @classmethod
+    def from_preprocessor(cls, preprocessor):
+        '''
+        Compile a fitted ColumnTransformer, or a Pipeline ending with one
+
+        Args:
+            - preprocessor (ColumnTransformer | Pipeline): Fitted preprocessor
+
+        Returns:
+            - CompiledPreprocessor: Preprocessor producing the same output as `preprocessor`
+
+        Raises:
+            - ValueError: If the preprocessor contains a transformer that cannot be compiled
+        '''
+        from sklearn.pipeline import Pipeline
+
+        pre_steps = []
+        if isinstance(preprocessor, Pipeline):
+            pre_steps = [step.compile() if hasattr(step, 'compile') else step for _, step in preprocessor.steps[:-1]]
+            preprocessor = preprocessor.steps[-1][1]
+
+        columns = []
+        for name, transformer, column_names in preprocessor.transformers_:
+            if transformer == 'drop':
+                continue
+            if transformer == 'passthrough':
+                columns.extend(NumericColumn(column, np.nan, 0.0, 1.0) for column in column_names)
+                continue
+
+            steps = transformer.steps if isinstance(transformer, Pipeline) else [(name, transformer)]
+            if any(type(step).__name__ == 'OrdinalEncoder' for _, step in steps):
+                columns.extend(compile_categorical(transformer, steps, column_names))
+            else:
+                columns.extend(compile_numeric(steps, column_names))
+
+        return cls(columns=columns, pre_steps=pre_steps)
+
+    def transform(self, features: pd.DataFrame) -> np.ndarray:
+        '''
+        Transform a batch of rows
+
+        Args:
+            - features (pd.DataFrame): Raw features
+
+        Returns:
+            - np.ndarray: Transformed features in the same column order as the fitted preprocessor
+        '''
+        for step in self.pre_steps:
+            features = step.transform(features)
+
+        transformed = np.empty((len(features), len(self.columns)))
+        for i, column in enumerate(self.columns):
+            transformed[:, i] = column.transform(features[column.name].to_numpy())
+        return transformed
+
+    def transform_record(self, record: dict) -> np.ndarray:
+        '''
+        Transform a single record without building a DataFrame
+
+        Args:
+            - record (dict): Raw feature values keyed by column name
+
+        Returns:
+            - np.ndarray: Transformed features with shape (1, n_features)
+        '''
+        if not all(hasattr(step, 'transform_record') for step in self.pre_steps):
+            return self.transform(pd.DataFrame([record]))
+
+        for step in self.pre_steps:
+            record = step.transform_record(record)
+
+        return np.array([[column.transform_value(record.get(column.name)) for column in self.columns]])
+
+
+def compile_numeric(steps: list, column_names: list) -> list:
+    from sklearn.impute import SimpleImputer
+    from sklearn.preprocessing import StandardScaler
+
+    n_columns = len(column_names)
+    fill = np.full(n_columns, np.nan)
+    mean = np.zeros(n_columns)
+    scale = np.ones(n_columns)
+
+    for position, (_, step) in enumerate(steps):
+        if isinstance(step, SimpleImputer) and position == 0 and not step.add_indicator:
+            fill = step.statistics_.astype(np.float64)
+        elif isinstance(step, StandardScaler) and position == len(steps) - 1:
+            if step.with_mean:
+                mean = step.mean_
+            if step.with_std:
+                scale = step.scale_
+        else:
+            raise ValueError(f'Cannot compile numeric step {step!r}')
+
+    return [NumericColumn(column, fill[i], mean[i], scale[i]) for i, column in enumerate(column_names)]
+
+
+def compile_categorical(transformer, steps: list, column_names: list) -> list:
+    from sklearn.impute import SimpleImputer
+    from sklearn.preprocessing import StandardScaler, OrdinalEncoder
+
+    encoder = None
+    for _, step in steps:
+        if isinstance(step, OrdinalEncoder):
+            encoder = step
+        elif not isinstance(step, (SimpleImputer, StandardScaler)) or getattr(step, 'add_indicator', False):
+            raise ValueError(f'Cannot compile categorical step {step!r}')
+
+    categories = [list(column_categories) for column_categories in encoder.categories_]
+
+    # every column is transformed independently, so pushing each category (plus an unknown and a
+    # missing probe) through the fitted pipeline yields its exact final value
+    n_rows = max(len(column_categories) for column_categories in categories) + 2
+    probe = pd.DataFrame({
+        column: (column_categories + [UNKNOWN_PROBE, np.nan] + [column_categories[0]] * n_rows)[:n_rows]
+        for column, column_categories in zip(column_names, categories)
+    }, dtype=object)
+    probe_output = np.asarray(transformer.transform(probe), dtype=np.float64)
+
+    compiled = []
+    for i, (column, column_categories) in enumerate(zip(column_names, categories)):
+        n_categories = len(column_categories)
+        compiled.append(CategoricalColumn(
+            name=column,
+            categories=column_categories,
+            values=probe_output[:n_categories, i],
+            unknown_value=probe_output[n_categories, i],
+            missing_value=probe_output[n_categories + 1, i]
+        ))
+    return compiled
+
+
+def export_compiled_preprocessor(preprocessor, file_path) -> bool:
+    '''
+    Compile a fitted preprocessor and save it next to the original one
+
+    A compiled preprocessor left by an earlier run is removed when the preprocessor cannot be
+    compiled, so it is never used in place of the preprocessor it does not match.
+
+    Args:
+        - preprocessor (object): Fitted preprocessor
+        - file_path (str): Path of the compiled preprocessor pickle
+
+    Returns:
+        - bool: True if the preprocessor was exported, False if it contains steps that cannot be compiled and no compiled preprocessor is left at `file_path`
+
+    Raises:
+        - Error: If there is an error saving the compiled preprocessor
+    '''
+    try:
+        compiled = CompiledPreprocessor.from_preprocessor(preprocessor)
+    except ValueError as e:
+        logging.info(f'Skipping compiled preprocessor export: {e}')
+        if os.path.exists(file_path):
+            os.remove(file_path)
+            logging.info(f'Removed the stale compiled preprocessor {file_path}')
+        return False
+
+    try:
+        save_object(compiled, file_path)
+        logging.info(f'Compiled preprocessor saved to {file_path}')
+        return True
+
+    except Exception as e:
+        logging.error(f'Error exporting compiled preprocessor: {e}')
+        raise e
@@ -1,42 +1,120 @@
+import os
+import hashlib
 import pandas as pd
+from pathlib import Path
 from src.laptop_price_prediction.logger import logging
-from src.laptop_price_prediction.utils.common import read_sql
+from src.laptop_price_prediction.utils.common import read_sql, read_sql_chunks, create_connection, hash_split, get_placeholder, save_json, load_json
 from src.laptop_price_prediction.entity.config_entity import DataIngestionConfig
+from src.laptop_price_prediction.utils.table_io import TableWriter, read_table, write_table
 from typing import Tuple
-from sklearn.model_selection import train_test_split
 
 
 
 class DataIngestion:
-    def __init__(self, config: DataIngestionConfig):
+    def __init__(self, config: DataIngestionConfig, connection=None):
+        '''
+        Args:
+            - config (DataIngestionConfig): Data Ingestion Configuration
+            - connection (Connection): Optional open DB-API connection (e.g. a local SQLite stand-in), the MySQL database from the environment is used otherwise
+        '''
         self.config = config
+        self.connection = connection
+
+    def get_connection(self):
+        return self.connection if self.connection is not None else create_connection()
+
+    def get_source_fingerprint(self) -> dict:
+        '''
+        Fingerprint the source table to tell whether it changed since the last run
+
+        The full and streaming modes read the whole table anyway, so the table is streamed in id
+        order and every row is hashed: in-place updates and deletes followed by inserts change the
+        fingerprint even when the row count and the largest watermark stay the same. The
+        incremental mode only fetches the rows past the watermark, so its fingerprint stays a
+        cheap COUNT(*) and MAX(watermark) query instead of an O(table size) scan on every run.
+
+        Returns:
+            - dict: Row count and largest watermark column value of the table, plus its content hash outside the incremental mode
+
+        Raises:
+            - Error: If there is an error reading the table
+        '''
+        connection = self.get_connection()
+        try:
+            if self.config.mode == 'incremental':
+                cursor = connection.cursor()
+                try:
+                    cursor.execute(f'SELECT COUNT(*), MAX({self.config.watermark_column}) FROM {self.config.table}')
+                    rows, watermark = cursor.fetchone()
+                finally:
+                    cursor.close()
+
+                return {'table': self.config.table, 'rows': rows, 'watermark': watermark}
+
+            digest = hashlib.sha256()
+            rows, watermark = 0, None
+            query = f'SELECT * FROM {self.config.table} ORDER BY {self.config.id_column}'
+
+            for chunk in read_sql_chunks(connection, query, self.config.chunk_size):
+                digest.update(','.join(chunk.columns).encode())
+                digest.update(pd.util.hash_pandas_object(chunk, index=False).to_numpy().tobytes())
+                rows += len(chunk)
+                chunk_watermark = chunk[self.config.watermark_column].max()
+                if watermark is None or chunk_watermark > watermark:
+                    watermark = chunk_watermark
+
+            return {
+                'table': self.config.table,
+                'rows': rows,
+                'watermark': watermark.item() if hasattr(watermark, 'item') else watermark,
+                'content_hash': digest.hexdigest()
+            }
+
+        except Exception as e:
+            logging.error(f"Error fingerprinting table {self.config.table}: {e}")
+            raise e
+
+        finally:
+            # only close the connection opened here, not the one passed by the caller
+            if self.connection is None:
+                connection.close()
 
     def initiate_data_ingestion(self) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
         '''
         This function reads data from the SQL database, splits it into train and test data and saves it in the specified paths
-        
+
         Returns:
             - Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]: Paths to the raw, train and test data
-        
+
         Raises:
             - Error: If there is an error reading the data or splitting the data
         '''
-        
+        if self.config.mode == 'streaming':
+            return self.initiate_streaming_ingestion()
+
+        if self.config.mode == 'incremental':
+            return self.initiate_incremental_ingestion()
+
         try:
-            df = read_sql()
+            if self.connection is None:
+                df = read_sql(self.config.table)
+            else:
+                df = pd.read_sql_query(f'SELECT * FROM {self.config.table}', self.connection)
 
             logging.info(f"Data loaded successfully")
-            df.to_csv(self.config.raw_path, index=False, header=True)
+            write_table(df, self.config.raw_path)
 
             logging.info(f"Data saved successfully")
 
             logging.info(f"Splitting data into train and test data")
-            train_data, test_data = train_test_split(df, test_size=0.2, random_state=42)
+            # the same id hash split as the streaming and incremental modes, so every mode splits a table identically
+            is_test = hash_split(df[self.config.id_column], self.config.test_size)
+            train_data, test_data = df[~is_test], df[is_test]
 
             logging.info(f"Data split successfully")
 
-            train_data.to_csv(self.config.train_path, index=False, header=True)
-            test_data.to_csv(self.config.test_path, index=False, header=True)
+            write_table(train_data, self.config.train_path)
+            write_table(test_data, self.config.test_path)
 
             logging.info(f"Train and Test data saved successfully")
 
@@ -44,8 +122,179 @@ class DataIngestion:
                 self.config.train_path,
                 self.config.test_path
             )
-        
+
         except Exception as e:
             logging.error(f"Error in data ingestion: {e}")
             raise e
-        
\ No newline at end of file
+
+    def initiate_streaming_ingestion(self) -> Tuple[str, str]:
+        '''
+        This function streams the table in chunks and appends every chunk to the raw, train and test files
+
+        Rows are assigned to train or test from a hash of their id, so the split is reproducible
+        without holding the whole table in memory. The files are written next to their final path
+        and only moved into place once the whole table has been read.
+
+        Returns:
+            - Tuple[str, str]: Paths to the train and test data
+
+        Raises:
+            - Error: If there is an error reading, splitting or saving the data
+        '''
+        try:
+            logging.info(f"Streaming table {self.config.table} in chunks of {self.config.chunk_size} rows")
+            connection = self.get_connection()
+            query = f'SELECT * FROM {self.config.table}'
+
+            paths = [self.config.raw_path, self.config.train_path, self.config.test_path]
+            # keep the extension so the writers pick the configured format
+            tmp_paths = [str(Path(path).with_name(f'{Path(path).stem}.tmp{Path(path).suffix}')) for path in paths]
+
+            with TableWriter(tmp_paths[0]) as raw_writer, \
+                 TableWriter(tmp_paths[1]) as train_writer, \
+                 TableWriter(tmp_paths[2]) as test_writer:
+
+                counts, watermark = self._write_chunks(
+                    read_sql_chunks(connection, query, self.config.chunk_size),
+                    raw_writer, train_writer, test_writer
+                )
+
+            for tmp_path, path in zip(tmp_paths, paths):
+                os.replace(tmp_path, path)
+
+            self.save_watermark(watermark)
+
+            logging.info(f"Streamed {counts['raw']} rows ({counts['train']} train, {counts['test']} test) successfully")
+
+            return (
+                self.config.train_path,
+                self.config.test_path
+            )
+
+        except Exception as e:
+            logging.error(f"Error in streaming data ingestion: {e}")
+            raise e
+
+    def initiate_incremental_ingestion(self) -> Tuple[str, str]:
+        '''
+        This function fetches only the rows past the stored watermark and appends them to the raw, train and test files
+
+        New rows are routed to train or test with the same id hash as the streaming mode, and the
+        watermark is only advanced once every file has been written. If anything fails, the files
+        are truncated back to their previous size so a rerun does not duplicate rows. Without
+        existing artifacts the whole table is streamed once to bootstrap them. Only the csv format
+        can be appended to.
+
+        The watermark must be the monotonically increasing id column: nothing dedupes the appended
+        rows, so an updated-at timestamp would append every updated row a second time. Updates to
+        rows that were already ingested are not picked up, use the full or streaming mode for those.
+
+        Returns:
+            - Tuple[str, str]: Paths to the train and test data
+
+        Raises:
+            - Error: If there is an error reading, splitting or saving the data
+        '''
+        if self.config.format != 'csv':
+            raise ValueError(f"The incremental mode appends to the ingestion files and needs the csv format, got {self.config.format!r}")
+
+        if self.config.watermark_column != self.config.id_column:
+            raise ValueError(
+                f"The incremental mode needs the id column as watermark so appended rows are never duplicated, "
+                f"got watermark_column={self.config.watermark_column!r} and id_column={self.config.id_column!r}"
+            )
+
+        paths = [self.config.raw_path, self.config.train_path, self.config.test_path]
+        if not all(os.path.exists(path) for path in paths):
+            logging.info(f"No ingestion artifacts found, streaming the whole table once")
+            return self.initiate_streaming_ingestion()
+
+        sizes = [os.path.getsize(path) for path in paths]
+        try:
+            watermark = self.load_watermark()
+            logging.info(f"Fetching rows with {self.config.watermark_column} > {watermark}")
+
+            connection = self.get_connection()
+            query = (
+                f'SELECT * FROM {self.config.table} '
+                f'WHERE {self.config.watermark_column} > {get_placeholder(connection)} '
+                f'ORDER BY {self.config.watermark_column}'
+            )
+            chunks = read_sql_chunks(connection, query, self.config.chunk_size, params=(watermark,))
+
+            with TableWriter(paths[0], append=True) as raw_writer, \
+                 TableWriter(paths[1], append=True) as train_writer, \
+                 TableWriter(paths[2], append=True) as test_writer:
+
+                counts, new_watermark = self._write_chunks(chunks, raw_writer, train_writer, test_writer)
+
+            if counts['raw']:
+                self.save_watermark(new_watermark)
+
+            logging.info(f"Appended {counts['raw']} new rows ({counts['train']} train, {counts['test']} test) successfully")
+
+            return (
+                self.config.train_path,
+                self.config.test_path
+            )
+
+        except Exception as e:
+            for path, size in zip(paths, sizes):
+                with open(path, 'a') as file:
+                    file.truncate(size)
+            logging.error(f"Error in incremental data ingestion: {e}")
+            raise e
+
+    def _write_chunks(self, chunks, raw_writer, train_writer, test_writer):
+        counts = {'raw': 0, 'train': 0, 'test': 0}
+        watermark = None
+
+        for chunk in chunks:
+            is_test = hash_split(chunk[self.config.id_column], self.config.test_size)
+
+            raw_writer.write(chunk)
+            train_writer.write(chunk[~is_test])
+            test_writer.write(chunk[is_test])
+
+            counts['raw'] += len(chunk)
+            counts['test'] += int(is_test.sum())
+            counts['train'] += len(chunk) - int(is_test.sum())
+
+            if len(chunk):
+                chunk_max = chunk[self.config.watermark_column].max()
+                watermark = chunk_max if watermark is None else max(watermark, chunk_max)
+
+        return counts, watermark
+
+    def load_watermark(self):
+        '''
+        Return the stored high-watermark, deriving it from the raw data when no watermark file exists yet
+
+        Returns:
+            - object: Largest watermark column value already ingested
+        '''
+        if os.path.exists(self.config.watermark_path):
+            return load_json(self.config.watermark_path)['value']
+
+        raw = read_table(self.config.raw_path, columns=[self.config.watermark_column])
+        watermark = raw[self.config.watermark_column].max()
+        return watermark.item() if hasattr(watermark, 'item') else watermark
+
+    def save_watermark(self, watermark):
+        '''
+        Persist the high-watermark next to the ingestion artifacts
+
+        Args:
+            - watermark (object): Largest watermark column value ingested so far
+        '''
+        if watermark is None:
+            return
+
+        if hasattr(watermark, 'item'):
+            watermark = watermark.item()
+        elif not isinstance(watermark, (int, float, str)):
+            watermark = str(watermark)
+
+        tmp_path = f'{self.config.watermark_path}.tmp'
+        save_json({'column': self.config.watermark_column, 'value': watermark}, tmp_path)
+        os.replace(tmp_path, self.config.watermark_path)
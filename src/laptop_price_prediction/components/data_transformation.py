@@ -1,3 +1,4 @@
+import time
 import pandas as pd
 import numpy as np
 from sklearn.impute import SimpleImputer
@@ -6,9 +7,22 @@ from sklearn.compose import ColumnTransformer
 from sklearn.pipeline import Pipeline
 from src.laptop_price_prediction.entity.config_entity import DataTransformationConfig
 from src.laptop_price_prediction.utils.common import save_object, save_transformed_data
+from src.laptop_price_prediction.components.compiled_preprocessor import export_compiled_preprocessor
+from src.laptop_price_prediction.utils.model_backends import HIST_BACKENDS, HIST_MAX_CATEGORIES
+from src.laptop_price_prediction.utils.table_io import read_table
+from src.laptop_price_prediction.utils.metrics import metrics
+from src.laptop_price_prediction.components.feature_engineering import UnitParser, FeatureExtractor, ENGINEERED_NUMERIC_FEATURES, ENGINEERED_CATEGORICAL_FEATURES
 from pathlib import Path
 from src.laptop_price_prediction.logger import logging
 
+NUMERIC_FEATURES = ['Inches', 'Ram', 'Weight']
+CATEGORICAL_FEATURES = ['Company', 'Product', 'TypeName', 'ScreenResolution', 'Cpu', 'Memory', 'Gpu', 'OpSys']
+TARGET = ['Price_euros']
+
+# with feature engineering the raw description strings (and the high-cardinality Product name) are replaced
+# by the features extracted from them
+FEATURE_ENGINEERING_CATEGORICAL_FEATURES = ['Company', 'TypeName', 'OpSys'] + ENGINEERED_CATEGORICAL_FEATURES
+
 
 class DataTransformation:
     def __init__(self, config: DataTransformationConfig):
@@ -17,6 +31,12 @@ class DataTransformation:
     def create_preprocessor(self) -> pd.DataFrame:
         '''
         Create a preprocessor to transform the data
+
+        The hist backends bin the features themselves and split categories natively, so for them
+        the features are only imputed and ordinal encoded, with unknown categories left missing.
+        The column transformer is preceded by a UnitParser turning 'Ram' and 'Weight' into numbers,
+        and with feature engineering enabled by a FeatureExtractor, in which case it encodes the
+        extracted features instead of the raw description strings.
         
         Returns:
             - pd.DataFrame: Preprocessor to transform the data
@@ -25,23 +45,42 @@ class DataTransformation:
             - Error: If there is an error creating the preprocessor
         '''
         try:
-            numeric_features = ['Inches', 'Ram', 'Weight']
-            categorical_features = ['Company', 'Product', 'TypeName', 'ScreenResolution', 'Cpu', 'Memory', 'Gpu', 'OpSys']
-
-            num_pipeline = Pipeline(
-                steps=[
-                    ('imputer', SimpleImputer(strategy='most_frequent')),
-                    ('scaler', StandardScaler())
-                ]
-            )
-
-            cat_pipeline = Pipeline(
-                steps=[
-                    ('imputer', SimpleImputer(strategy='most_frequent')),
-                    ('encoder', OrdinalEncoder(handle_unknown='use_encoded_value', unknown_value=-1)),
-                    ('scaler', StandardScaler())
-                ]
-            )
+            numeric_features = NUMERIC_FEATURES
+            categorical_features = CATEGORICAL_FEATURES
+
+            if self.config.feature_engineering:
+                numeric_features = NUMERIC_FEATURES + ENGINEERED_NUMERIC_FEATURES
+                categorical_features = FEATURE_ENGINEERING_CATEGORICAL_FEATURES
+
+            if self.config.model_backend in HIST_BACKENDS:
+                num_pipeline = Pipeline(
+                    steps=[
+                        ('imputer', SimpleImputer(strategy='most_frequent'))
+                    ]
+                )
+
+                cat_pipeline = Pipeline(
+                    steps=[
+                        ('imputer', SimpleImputer(strategy='most_frequent')),
+                        ('encoder', OrdinalEncoder(handle_unknown='use_encoded_value', unknown_value=np.nan))
+                    ]
+                )
+
+            else:
+                num_pipeline = Pipeline(
+                    steps=[
+                        ('imputer', SimpleImputer(strategy='most_frequent')),
+                        ('scaler', StandardScaler())
+                    ]
+                )
+
+                cat_pipeline = Pipeline(
+                    steps=[
+                        ('imputer', SimpleImputer(strategy='most_frequent')),
+                        ('encoder', OrdinalEncoder(handle_unknown='use_encoded_value', unknown_value=-1)),
+                        ('scaler', StandardScaler())
+                    ]
+                )
 
             preprocessor = ColumnTransformer(
                 transformers=[
@@ -50,6 +89,12 @@ class DataTransformation:
                 ]
             )
 
+            steps = [('units', UnitParser())]
+            if self.config.feature_engineering:
+                steps.append(('features', FeatureExtractor()))
+
+            preprocessor = Pipeline(steps=steps + [('columns', preprocessor)])
+
             logging.info(f"Preprocessor created successfully")
 
             return preprocessor
@@ -57,6 +102,32 @@ class DataTransformation:
         except Exception as e:
             logging.error(f"Error creating preprocessor: {e}")
             raise e
+
+    def get_categorical_features(self, preprocessor) -> list:
+        '''
+        Return the indices of the transformed columns the hist backends can split natively as categories
+
+        Args:
+            - preprocessor (ColumnTransformer | Pipeline): Fitted preprocessor
+
+        Returns:
+            - list: Column indices, empty for the gbr backend
+        '''
+        if self.config.model_backend not in HIST_BACKENDS:
+            return []
+
+        if isinstance(preprocessor, Pipeline):
+            preprocessor = preprocessor.steps[-1][1]
+
+        encoder = preprocessor.named_transformers_['cat'].named_steps['encoder']
+        n_numeric = len(preprocessor.transformers_[0][2])
+
+        # wider columns (e.g. Product) do not fit in the histogram bins and are split as ordinal codes
+        return [
+            n_numeric + i
+            for i, categories in enumerate(encoder.categories_)
+            if len(categories) <= HIST_MAX_CATEGORIES
+        ]
         
     
     def initiate_data_transformation(self, train_data, test_data):
@@ -78,26 +149,19 @@ class DataTransformation:
             logging.info(f"Initiating data transformation")
 
             logging.info(f"Reading train and test data")
-            train_data = pd.read_csv(train_data)
-            test_data = pd.read_csv(test_data)
+            columns = NUMERIC_FEATURES + CATEGORICAL_FEATURES + TARGET
+            with metrics.timer('data_transformation_phase_seconds', phase='read'):
+                train_data = read_table(train_data, columns=columns)
+                test_data = read_table(test_data, columns=columns)
 
             logging.info(f"Data read successfully")
 
             logging.info(f"Creating preprocessor")
             preprocessor = self.create_preprocessor()
 
-            logging.info(f"Converting 'Ram' and 'Weight' feature to numeric dtype")
-            train_data['Ram'] = train_data['Ram'].replace('GB', '', regex=True).astype(int)
-            test_data['Ram'] = test_data['Ram'].replace('GB', '', regex=True).astype(int)
-
-            train_data['Weight'] = train_data['Weight'].replace('kg', '', regex=True).astype(float)
-            test_data['Weight'] = test_data['Weight'].replace('kg', '', regex=True).astype(float)
-
-            logging.info(f"Successfully converted 'Ram' and 'Weight' feature to numeric dtype")
-
             logging.info(f"Splittng data into features and target")
 
-            target = ['Price_euros']
+            target = TARGET
 
             train_features = train_data.drop(target, axis=1)
             train_target = train_data[target]
@@ -108,10 +172,12 @@ class DataTransformation:
             logging.info(f"Data split successfully")
 
             logging.info(f"Transforming train and test data")
-            train_features = preprocessor.fit_transform(train_features)
+            with metrics.timer('data_transformation_phase_seconds', phase='fit_transform'):
+                train_features = preprocessor.fit_transform(train_features)
             logging.info(f"Train data transformed successfully")
 
-            test_features = preprocessor.transform(test_features)
+            with metrics.timer('data_transformation_phase_seconds', phase='transform'):
+                test_features = preprocessor.transform(test_features)
             logging.info(f"Test data transformed successfully")
 
             logging.info(f"Converting transformed data to numpy array")
@@ -127,6 +193,7 @@ class DataTransformation:
 
             logging.info(f"Data transformed successfully")
 
+            save_start = time.perf_counter()
             logging.info(f"Saving preprocessor")
             save_object(
                 obj=preprocessor,
@@ -135,17 +202,31 @@ class DataTransformation:
 
             logging.info(f"Preprocessor saved successfully")    
 
+            logging.info(f"Exporting compiled preprocessor")
+            export_compiled_preprocessor(
+                preprocessor=preprocessor,
+                file_path=self.config.compiled_preprocessor_path
+            )
+
             logging.info(f"Saving transformed train and test data")
+            columns = list(preprocessor.get_feature_names_out()) + target
+            categorical = self.get_categorical_features(preprocessor)
+
             save_transformed_data(
                 data=train_arr,
-                file_path=self.config.train_arr_path
+                file_path=self.config.train_arr_path,
+                columns=columns,
+                categorical=categorical
             )
 
             save_transformed_data(
                 data = test_arr,
-                file_path = self.config.test_arr_path
+                file_path = self.config.test_arr_path,
+                columns = columns,
+                categorical=categorical
             )
 
+            metrics.observe('data_transformation_phase_seconds', time.perf_counter() - save_start, phase='save')
             logging.info(f"Transformed data saved successfully")
 
             return (
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator, TransformerMixin
+from src.laptop_price_prediction.components.compiled_preprocessor import FunctionStep
+# the parsing itself lives in feature_parsing, which does not import sklearn, so the compiled
+# preprocessor can run it without loading sklearn
+from src.laptop_price_prediction.components.feature_parsing import (
+    ENGINEERED_NUMERIC_FEATURES, ENGINEERED_CATEGORICAL_FEATURES,
+    parse_units, parse_units_record, extract_features, extract_features_record
+)
+
+
+class UnitParser(BaseEstimator, TransformerMixin):
+    def __init__(self):
+        '''
+        Parse the 'Ram' and 'Weight' columns into floats, whether they hold numbers or raw '8GB' / '1.37kg' strings
+
+        It is the first step of the saved preprocessor, so training, batch scoring and single
+        predictions all parse the units with the same code.
+        '''
+
+    def fit(self, X: pd.DataFrame, y=None):
+        self.feature_names_in_ = np.asarray(X.columns, dtype=object)
+        self.n_features_in_ = len(self.feature_names_in_)
+        return self
+
+    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+        return parse_units(X)
+
+    def transform_record(self, record: dict) -> dict:
+        return parse_units_record(record)
+
+    def compile(self) -> FunctionStep:
+        return FunctionStep(parse_units, parse_units_record)
+
+    def get_feature_names_out(self, input_features=None) -> np.ndarray:
+        return np.asarray(self.feature_names_in_ if input_features is None else input_features, dtype=object)
+
+
+class FeatureExtractor(BaseEstimator, TransformerMixin):
+    def __init__(self):
+        '''
+        Extract numeric and low-cardinality features from the raw laptop description strings
+
+        Adds the screen resolution, pixel density, touchscreen and IPS flags (ScreenResolution),
+        the CPU family and clock speed (Cpu), the SSD/HDD/Flash/Hybrid capacities in GB (Memory)
+        and the GPU vendor (Gpu). It is stateless and embedded in the saved preprocessor, so
+        training and `Prediction.predict` run exactly the same extraction.
+        '''
+
+    def fit(self, X: pd.DataFrame, y=None):
+        self.feature_names_in_ = np.asarray(X.columns, dtype=object)
+        self.n_features_in_ = len(self.feature_names_in_)
+        return self
+
+    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+        return extract_features(X)
+
+    def transform_record(self, record: dict) -> dict:
+        return extract_features_record(record)
+
+    def compile(self) -> FunctionStep:
+        return FunctionStep(extract_features, extract_features_record)
+
+    def get_feature_names_out(self, input_features=None) -> np.ndarray:
+        input_features = self.feature_names_in_ if input_features is None else input_features
+        return np.asarray(list(input_features) + ENGINEERED_NUMERIC_FEATURES + ENGINEERED_CATEGORICAL_FEATURES, dtype=object)
@@ -0,0 +1,174 @@
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+
+ENGINEERED_NUMERIC_FEATURES = [
+    'resolution_width', 'resolution_height', 'ppi', 'touchscreen', 'ips',
+    'cpu_ghz', 'ssd_gb', 'hdd_gb', 'flash_gb', 'hybrid_gb'
+]
+ENGINEERED_CATEGORICAL_FEATURES = ['cpu_family', 'gpu_vendor']
+
+RESOLUTION_PATTERN = r'(?P<resolution_width>\d+)x(?P<resolution_height>\d+)'
+# 'Intel Core i5 7200U 2.5GHz' -> 'Intel Core i5', 'AMD A9-Series 9420 3GHz' -> 'AMD A', 'Intel Celeron Dual Core ...' -> 'Intel Celeron'
+CPU_FAMILY_PATTERN = r'^(?P<cpu_family>\w+\s+(?:Core\s+\w+|[A-Za-z]+))'
+CPU_GHZ_PATTERN = r'(?P<cpu_ghz>\d+(?:\.\d+)?)\s*GHz'
+GPU_VENDOR_PATTERN = r'^(?P<gpu_vendor>\w+)'
+# '128GB SSD +  1TB HDD' -> (128, GB, SSD), (1, TB, HDD)
+STORAGE_PATTERN = r'(?P<size>\d+(?:\.\d+)?)\s*(?P<unit>GB|TB)\s+(?P<kind>SSD|HDD|Flash Storage|Hybrid)'
+STORAGE_COLUMNS = {'SSD': 'ssd_gb', 'HDD': 'hdd_gb', 'Flash Storage': 'flash_gb', 'Hybrid': 'hybrid_gb'}
+
+# raw columns stored with a unit suffix, '8GB' and '1.37kg'
+UNIT_COLUMNS = {'Ram': 'GB', 'Weight': 'kg'}
+
+
+def extract_unique(series: pd.Series, extract) -> pd.DataFrame:
+    '''
+    Run a vectorized string extraction once per distinct value and broadcast it back to every row
+
+    Laptop strings repeat heavily, so extracting from the few hundred distinct values and
+    gathering the result by integer codes is much cheaper than regex matching every row.
+
+    Args:
+        - series (pd.Series): String column
+        - extract (callable): Function taking a Series of distinct strings and returning a DataFrame aligned with it
+
+    Returns:
+        - pd.DataFrame: Extracted columns with one row per input row and the input index
+    '''
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    extracted = extract(pd.Series(np.asarray(uniques, dtype=object), dtype=object)).reset_index(drop=True)
+
+    # missing values (code -1) gather from an extra all-NaN row
+    extracted = extracted.reindex(range(len(extracted) + 1))
+    codes = np.where(codes < 0, len(extracted) - 1, codes)
+    result = extracted.take(codes)
+    result.index = series.index
+    return result
+
+
+def parse_unit(series: pd.Series, unit: str) -> np.ndarray:
+    '''
+    Parse a column of numbers or unit strings such as '8GB' into floats
+
+    Numeric columns are only cast. String, categorical and mixed columns are parsed once per
+    distinct value and gathered back by integer codes, unparseable values become NaN.
+
+    Args:
+        - series (pd.Series): Values, either numbers or strings with the unit suffix
+        - unit (str): Unit suffix to remove
+
+    Returns:
+        - np.ndarray: Float values
+    '''
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    codes, uniques = pd.factorize(series, use_na_sentinel=True)
+    uniques = pd.Series(np.asarray(uniques, dtype=object), dtype=object).astype(str).str.strip().str.removesuffix(unit)
+    parsed = pd.to_numeric(uniques, errors='coerce').to_numpy(dtype=np.float64)
+
+    # missing values (code -1) gather the trailing NaN
+    return np.append(parsed, np.nan)[codes]
+
+
+def parse_unit_value(value, unit: str) -> float:
+    if value is None or isinstance(value, (int, float, np.number)):
+        return np.nan if value is None else float(value)
+    try:
+        return float(str(value).strip().removesuffix(unit))
+    except ValueError:
+        return np.nan
+
+
+def extract_screen(values: pd.Series) -> pd.DataFrame:
+    screen = values.str.extract(RESOLUTION_PATTERN).astype(float)
+    screen['touchscreen'] = values.str.contains('Touchscreen', regex=False).astype(float)
+    screen['ips'] = values.str.contains('IPS', regex=False).astype(float)
+    return screen
+
+
+def extract_cpu(values: pd.Series) -> pd.DataFrame:
+    cpu = values.str.extract(CPU_FAMILY_PATTERN)
+    cpu['cpu_ghz'] = values.str.extract(CPU_GHZ_PATTERN)['cpu_ghz'].astype(float)
+    return cpu
+
+
+def extract_gpu(values: pd.Series) -> pd.DataFrame:
+    return values.str.extract(GPU_VENDOR_PATTERN)
+
+
+def extract_storage(values: pd.Series) -> pd.DataFrame:
+    parts = values.str.extractall(STORAGE_PATTERN)
+    gigabytes = parts['size'].astype(float) * np.where(parts['unit'] == 'TB', 1000.0, 1.0)
+
+    # sum drives of the same kind ('256GB SSD +  256GB SSD'), zero for kinds a laptop does not have
+    storage = (
+        gigabytes.groupby([parts.index.get_level_values(0), parts['kind']]).sum()
+        .unstack(fill_value=0.0)
+        .reindex(index=range(len(values)), columns=list(STORAGE_COLUMNS), fill_value=0.0)
+        .rename(columns=STORAGE_COLUMNS)
+    )
+    storage.columns.name = None
+
+    # strings without any recognizable drive stay missing instead of zero
+    storage[values.isna().to_numpy() | ~values.index.isin(parts.index.get_level_values(0))] = np.nan
+    return storage
+
+
+EXTRACTORS = {
+    'ScreenResolution': extract_screen,
+    'Cpu': extract_cpu,
+    'Memory': extract_storage,
+    'Gpu': extract_gpu
+}
+
+
+@lru_cache(maxsize=4096)
+def extract_value(column: str, value) -> dict:
+    # single records repeat the same few hundred strings, so each one is only regex matched once
+    return EXTRACTORS[column](pd.Series([value], dtype=object)).iloc[0].to_dict()
+
+
+def parse_units(X: pd.DataFrame) -> pd.DataFrame:
+    '''
+    Parse the unit columns of a batch of rows
+
+    Args:
+        - X (pd.DataFrame): Raw features with the 'Ram' and 'Weight' columns
+
+    Returns:
+        - pd.DataFrame: Features with float 'Ram' and 'Weight' columns, the other columns are not copied
+    '''
+    return X.assign(**{column: parse_unit(X[column], unit) for column, unit in UNIT_COLUMNS.items()})
+
+
+def parse_units_record(record: dict) -> dict:
+    return {**record, **{column: parse_unit_value(record.get(column), unit) for column, unit in UNIT_COLUMNS.items()}}
+
+
+def extract_features(X: pd.DataFrame) -> pd.DataFrame:
+    '''
+    Add the engineered features to a batch of raw rows
+
+    Args:
+        - X (pd.DataFrame): Raw features with the ScreenResolution, Inches, Cpu, Memory and Gpu columns
+
+    Returns:
+        - pd.DataFrame: Input columns followed by the engineered features
+    '''
+    extracted = pd.concat([extract_unique(X[column], extract) for column, extract in EXTRACTORS.items()], axis=1)
+    inches = pd.to_numeric(X['Inches'], errors='coerce')
+    extracted['ppi'] = np.hypot(extracted['resolution_width'], extracted['resolution_height']) / inches.where(inches > 0)
+
+    return pd.concat([X, extracted[ENGINEERED_NUMERIC_FEATURES + ENGINEERED_CATEGORICAL_FEATURES]], axis=1)
+
+
+def extract_features_record(record: dict) -> dict:
+    extracted = {}
+    for column in EXTRACTORS:
+        extracted.update(extract_value(column, record.get(column)))
+
+    inches = parse_unit_value(record.get('Inches'), '')
+    extracted['ppi'] = np.hypot(extracted['resolution_width'], extracted['resolution_height']) / inches if inches > 0 else np.nan
+
+    return {**record, **{name: extracted[name] for name in ENGINEERED_NUMERIC_FEATURES + ENGINEERED_CATEGORICAL_FEATURES}}
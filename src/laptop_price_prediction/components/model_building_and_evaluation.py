@@ -1,26 +1,32 @@
 import pandas as pd
 from pathlib import Path
-from src.laptop_price_prediction.utils.common import save_object, save_json, model_building_and_evaluation
+from src.laptop_price_prediction.utils.common import save_object, save_json, model_building_and_evaluation, load_transformed_data
 from src.laptop_price_prediction.logger import logging
 from src.laptop_price_prediction.entity.config_entity import ModelBuildingConfig
+from src.laptop_price_prediction.components.compiled_model import export_compiled_model
 
 class ModelBuilding:
     def __init__(self, config: ModelBuildingConfig):
         self.config = config
 
-    def initiate_model_building(self, train_arr, test_arr):
+    def initiate_model_building(self, train_arr, test_arr, categorical_features=None, param_grid=None):
         '''
         This function reads the train and test data, splits the data into features and target, builds the model and saves the model and metrics
         
         Args:
-            - train_arr (Path): Path to the transformed training data
-            - test_arr (Path): Path to the transformed test data
+            - train_arr (np.ndarray | Path): Transformed training data, or the path to its .npy file
+            - test_arr (np.ndarray | Path): Transformed test data, or the path to its .npy file
+            - categorical_features (list): Indices of the features the hist backends split natively as categories
+            - param_grid (dict): Grid searched by the grid-based strategies, the default grid if None (e.g. a reduced grid for benchmarks)
             
         Raises:
             - Error: If there is an error reading the data or building the model
         '''
         try:
-            
+            if isinstance(train_arr, (str, Path)):
+                train_arr = load_transformed_data(train_arr, mmap_mode='r')
+            if isinstance(test_arr, (str, Path)):
+                test_arr = load_transformed_data(test_arr, mmap_mode='r')
 
             logging.info(f"Data read successfully")
 
@@ -37,13 +43,22 @@ class ModelBuilding:
 
             logging.info(f"Initiating model building")
 
-            results = model_building_and_evaluation(X_train, y_train, X_test, y_test)
+            results = model_building_and_evaluation(
+                X_train, y_train, X_test, y_test,
+                search_config=self.config.search,
+                backend=self.config.backend,
+                categorical_features=categorical_features,
+                param_grid=param_grid
+            )
 
             logging.info(f"Model building completed successfully")
 
             logging.info(f"Saving model to {self.config.model_path}")
             save_object(results['model'], self.config.model_path)
 
+            logging.info(f"Exporting compiled model to {self.config.compiled_model_path}")
+            export_compiled_model(results['model'], self.config.compiled_model_path)
+
             # save the metrics
             logging.info(f"Saving train metrics to {self.config.train_metrics_path}")
             save_json(results['train'], self.config.train_metrics_path)
@@ -1,8 +1,14 @@
 from src.laptop_price_prediction.logger import logging
 from src.laptop_price_prediction.utils.common import read_yaml, create_directories
+from src.laptop_price_prediction.utils.table_io import table_path
 from src.laptop_price_prediction.entity.config_entity import DataIngestionConfig
 from src.laptop_price_prediction.entity.config_entity import DataTransformationConfig
-from src.laptop_price_prediction.entity.config_entity import ModelBuildingConfig
+from src.laptop_price_prediction.entity.config_entity import ModelBuildingConfig, ModelSearchConfig
+from src.laptop_price_prediction.entity.config_entity import ServingConfig
+from src.laptop_price_prediction.entity.config_entity import PredictionCacheConfig
+from src.laptop_price_prediction.entity.config_entity import StageCacheConfig
+from src.laptop_price_prediction.entity.config_entity import LoggingConfig
+from src.laptop_price_prediction.entity.config_entity import MetricsConfig
 from src.laptop_price_prediction.constants.constant import *
 
 
@@ -49,9 +55,17 @@ class ConfigurationManager:
             logging.info(f"Assigning paths to raw, train and test data")
             
             data_ingestion_config = DataIngestionConfig(
-                raw_path = config.raw_path,
-                train_path = config.train_path,
-                test_path = config.test_path
+                raw_path = table_path(config.raw_path, config.format),
+                train_path = table_path(config.train_path, config.format),
+                test_path = table_path(config.test_path, config.format),
+                table = config.table,
+                id_column = config.id_column,
+                watermark_path = config.watermark_path,
+                watermark_column = config.watermark_column,
+                mode = config.mode,
+                chunk_size = int(config.chunk_size),
+                test_size = float(config.test_size),
+                format = config.format
             )
 
             logging.info(f"Paths assigned successfully")
@@ -86,8 +100,11 @@ class ConfigurationManager:
             
             data_ingestion_config = DataTransformationConfig(
                 preprocessor_path=config.preprocessor_path,
+                compiled_preprocessor_path=config.compiled_preprocessor_path,
                 train_arr_path=config.train_arr_path,
-                test_arr_path=config.test_arr_path
+                test_arr_path=config.test_arr_path,
+                feature_engineering=bool(config.feature_engineering),
+                model_backend=self.config.model.backend
             )
 
             logging.info(f"Paths assigned successfully")
@@ -121,8 +138,19 @@ class ConfigurationManager:
             
             data_ingestion_config = ModelBuildingConfig(
                 model_path=config.model_path,
+                compiled_model_path=config.compiled_model_path,
                 train_metrics_path=config.train_metrics_path,
-                test_metrics_path=config.test_metrics_path
+                test_metrics_path=config.test_metrics_path,
+                backend=config.backend,
+                search=ModelSearchConfig(
+                    strategy=config.search.strategy,
+                    cv=int(config.search.cv),
+                    n_jobs=int(config.search.n_jobs),
+                    resource=config.search.resource,
+                    n_iter=int(config.search.n_iter),
+                    time_budget_seconds=float(config.search.time_budget_seconds) if config.search.time_budget_seconds else None,
+                    random_state=int(config.search.random_state)
+                )
             )
 
             logging.info(f"Paths assigned successfully")
@@ -131,4 +159,136 @@ class ConfigurationManager:
         
         except Exception as e:
             logging.error(f"Error loading data ingestion configuration: {e}")
-            raise e
\ No newline at end of file
+            raise e
+
+    def get_serving_config(self) -> ServingConfig:
+        '''
+        This function loads the prediction server configuration from the configuration file
+
+        Returns:
+            - ServingConfig: Prediction Server Configuration
+
+        Raises:
+            - Error: If there is an error loading the configuration
+        '''
+        try:
+            config = self.config.serving
+            logging.info(f"Serving Configuration loaded successfully")
+
+            serving_config = ServingConfig(
+                host=config.host,
+                port=int(config.port),
+                max_batch_size=int(config.max_batch_size),
+                max_wait_ms=float(config.max_wait_ms)
+            )
+
+            return serving_config
+
+        except Exception as e:
+            logging.error(f"Error loading serving configuration: {e}")
+            raise e
+
+
+    def get_prediction_cache_config(self) -> PredictionCacheConfig:
+        '''
+        This function loads the prediction cache configuration from the configuration file
+
+        Returns:
+            - PredictionCacheConfig: Prediction Cache Configuration
+
+        Raises:
+            - Error: If there is an error loading the configuration
+        '''
+        try:
+            config = self.config.prediction_cache
+            logging.info(f"Prediction Cache Configuration loaded successfully")
+
+            prediction_cache_config = PredictionCacheConfig(
+                enabled=bool(config.enabled),
+                max_size=int(config.max_size),
+                ttl_seconds=float(config.ttl_seconds) if config.ttl_seconds else None
+            )
+
+            return prediction_cache_config
+
+        except Exception as e:
+            logging.error(f"Error loading prediction cache configuration: {e}")
+            raise e
+
+    def get_stage_cache_config(self) -> StageCacheConfig:
+        '''
+        This function loads the stage cache configuration from the configuration file
+
+        Returns:
+            - StageCacheConfig: Stage Cache Configuration
+
+        Raises:
+            - Error: If there is an error loading the configuration
+        '''
+        try:
+            config = self.config.stage_cache
+            logging.info(f"Stage Cache Configuration loaded successfully")
+
+            stage_cache_config = StageCacheConfig(
+                state_path=config.state_path,
+                manifest_path=config.manifest_path,
+                max_parallel_stages=int(config.max_parallel_stages)
+            )
+
+            return stage_cache_config
+
+        except Exception as e:
+            logging.error(f"Error loading stage cache configuration: {e}")
+            raise e
+
+    def get_logging_config(self) -> LoggingConfig:
+        '''
+        This function loads the logging configuration from the configuration file
+
+        Returns:
+            - LoggingConfig: Logging Configuration
+
+        Raises:
+            - Error: If there is an error loading the configuration
+        '''
+        try:
+            config = self.config.logging
+            logging.info(f"Logging Configuration loaded successfully")
+
+            logging_config = LoggingConfig(
+                level=str(config.level).upper(),
+                module_levels={module: str(level).upper() for module, level in (config.module_levels or {}).items()},
+                request_sample_rate=float(config.request_sample_rate)
+            )
+
+            return logging_config
+
+        except Exception as e:
+            logging.error(f"Error loading logging configuration: {e}")
+            raise e
+
+    def get_metrics_config(self) -> MetricsConfig:
+        '''
+        This function loads the metrics configuration from the configuration file
+
+        Returns:
+            - MetricsConfig: Metrics Configuration
+
+        Raises:
+            - Error: If there is an error loading the configuration
+        '''
+        try:
+            config = self.config.metrics
+            logging.info(f"Metrics Configuration loaded successfully")
+
+            metrics_config = MetricsConfig(
+                enabled=bool(config.enabled),
+                json_path=config.json_path,
+                prometheus_path=config.prometheus_path
+            )
+
+            return metrics_config
+
+        except Exception as e:
+            logging.error(f"Error loading metrics configuration: {e}")
+            raise e
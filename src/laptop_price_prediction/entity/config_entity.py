@@ -8,17 +8,77 @@ class DataIngestionConfig:
     raw_path: Path
     train_path: Path
     test_path: Path
+    table: str
+    id_column: str
+    watermark_path: Path
+    watermark_column: str
+    mode: str
+    chunk_size: int
+    test_size: float
+    format: str
 
 
 @dataclass(frozen=True)
 class DataTransformationConfig:
     preprocessor_path: Path
+    compiled_preprocessor_path: Path
     train_arr_path: Path
     test_arr_path: Path
+    feature_engineering: bool
+    model_backend: str
+
+
+@dataclass(frozen=True)
+class ModelSearchConfig:
+    strategy: str
+    cv: int
+    n_jobs: int
+    resource: str
+    n_iter: int
+    time_budget_seconds: float
+    random_state: int
 
 
 @dataclass(frozen=True)
 class ModelBuildingConfig:
     model_path: Path
+    compiled_model_path: Path
     train_metrics_path: Path
-    test_metrics_path: Path
\ No newline at end of file
+    test_metrics_path: Path
+    backend: str
+    search: ModelSearchConfig
+
+@dataclass(frozen=True)
+class ServingConfig:
+    host: str
+    port: int
+    max_batch_size: int
+    max_wait_ms: float
+
+
+@dataclass(frozen=True)
+class StageCacheConfig:
+    state_path: Path
+    manifest_path: Path
+    max_parallel_stages: int
+
+
+@dataclass(frozen=True)
+class PredictionCacheConfig:
+    enabled: bool
+    max_size: int
+    ttl_seconds: float
+
+
+@dataclass(frozen=True)
+class LoggingConfig:
+    level: str
+    module_levels: dict
+    request_sample_rate: float
+
+
+@dataclass(frozen=True)
+class MetricsConfig:
+    enabled: bool
+    json_path: Path
+    prometheus_path: Path
@@ -1,23 +1,111 @@
+import atexit
 import os
 import sys
+import queue
+import random
 import logging
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 
-LOG_FILE_STYLES = f'{datetime.now().strftime("%Y-%m-%d-%H-%M-%S")}.log'
+LOG_FORMAT = '[ %(asctime)s ] %(levelno)d %(name)s - %(levelname)s - %(message)s'
 
 # create log directory if it doesn't exist
 log_dir = 'logs'
 os.makedirs(log_dir, exist_ok=True)
 
-# specify log file path
-log_file = os.path.join(log_dir, LOG_FILE_STYLES)
-
-# create logger
-logging.basicConfig(
-    level=logging.INFO,
-    format='[ %(asctime)s ] %(levelno)d %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
\ No newline at end of file
+# per-request log records are marked with extra=REQUEST so they can be sampled
+REQUEST = {'request': True}
+
+
+class LogFilter(logging.Filter):
+    def __init__(self, level: int = logging.INFO, module_levels: dict = None, request_sample_rate: float = 1.0):
+        '''
+        Drop log records below the level of the module emitting them, and sample per-request records
+
+        Every module logs through the root logger, so the per-module levels are matched on the
+        module name of the record (e.g. stage_04_prediction_pipeline) instead of the logger name.
+
+        Args:
+            - level (int): Level of the modules without an override
+            - module_levels (dict): Level overrides keyed by module name
+            - request_sample_rate (float): Fraction of the records logged with extra=REQUEST that are kept
+        '''
+        super().__init__()
+        self.level = level
+        self.module_levels = module_levels or {}
+        self.request_sample_rate = request_sample_rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < self.module_levels.get(record.module, self.level):
+            return False
+        if self.request_sample_rate < 1.0 and getattr(record, 'request', False):
+            return random.random() < self.request_sample_rate
+        return True
+
+
+def get_log_file() -> str:
+    # one file per process, so the workers of a process pool never interleave their writes
+    return os.path.join(log_dir, f'{datetime.now().strftime("%Y-%m-%d-%H-%M-%S")}-{os.getpid()}.log')
+
+
+def start_listener() -> QueueListener:
+    '''
+    Start the background thread writing the queued log records to this process's log file and to stdout
+
+    Returns:
+        - QueueListener: Running listener
+    '''
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [logging.FileHandler(get_log_file(), delay=True), logging.StreamHandler(sys.stdout)]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    queue_handler.queue = queue.SimpleQueue()
+    listener = QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def restart_listener():
+    # a forked child inherits the queue handler but not the listener thread draining it
+    global listener
+    listener = start_listener()
+
+    # process pool workers leave through os._exit, which skips atexit but runs multiprocessing finalizers
+    from multiprocessing import util
+    util.Finalize(None, stop_listener, exitpriority=0)
+
+
+def stop_listener():
+    listener.stop()
+
+
+def configure_logging(config):
+    '''
+    Apply the logging section of config.yaml
+
+    Args:
+        - config (LoggingConfig): Default level, per-module levels and request sample rate
+    '''
+    level = logging.getLevelName(config.level)
+    module_levels = {module: logging.getLevelName(module_level) for module, module_level in config.module_levels.items()}
+
+    log_filter.level = level
+    log_filter.module_levels = module_levels
+    log_filter.request_sample_rate = config.request_sample_rate
+
+    # the root logger lets through the lowest configured level, the filter applies the per-module ones
+    logging.getLogger().setLevel(min([level, *module_levels.values()]))
+
+
+# records are only formatted and enqueued on the calling thread, the file and terminal writes
+# happen on the listener thread
+log_filter = LogFilter()
+queue_handler = QueueHandler(queue.SimpleQueue())
+queue_handler.addFilter(log_filter)
+
+logging.basicConfig(level=logging.INFO, handlers=[queue_handler], format='%(message)s')
+
+listener = start_listener()
+os.register_at_fork(after_in_child=restart_listener)
+atexit.register(stop_listener)
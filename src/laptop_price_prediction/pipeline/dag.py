@@ -0,0 +1,185 @@
+import os
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from src.laptop_price_prediction.logger import logging
+from src.laptop_price_prediction.utils.common import save_json
+from src.laptop_price_prediction.utils.memory import PeakMemorySampler
+
+
+@dataclass
+class Stage:
+    name: str
+    run: object
+    inputs: list = field(default_factory=list)
+    outputs: list = field(default_factory=list)
+    config: dict = field(default_factory=dict)
+    modules: list = field(default_factory=list)
+    source: object = None
+
+
+def now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+
+class DAGRunner:
+    def __init__(self, stages: list, stage_cache=None, manifest_path=None, max_workers: int = 2):
+        '''
+        Run pipeline stages in dependency order, wired together by the artifact paths they read and write
+
+        A stage depends on every stage producing one of its inputs. Stages whose dependencies are
+        done run concurrently on a thread pool, stages that are still fresh in the stage cache are
+        skipped, so rerunning after a failure resumes from the first incomplete stage. A manifest
+        with the status, duration and peak memory of every stage is written after each stage.
+
+        Args:
+            - stages (list): Stage definitions
+            - stage_cache (StageCache): Fingerprint store deciding which stages can be skipped, every stage runs if None
+            - manifest_path (str): Path of the run manifest JSON, not written if None
+            - max_workers (int): Maximum number of stages running at the same time
+
+        Raises:
+            - ValueError: If two stages write the same artifact or the stages contain a cycle
+        '''
+        self.stages = {stage.name: stage for stage in stages}
+        self.stage_cache = stage_cache
+        self.manifest_path = manifest_path
+        self.max_workers = max_workers
+        self.dependencies = self.resolve_dependencies()
+        self.order = self.topological_order()
+
+    def resolve_dependencies(self) -> dict:
+        producers = {}
+        for stage in self.stages.values():
+            for path in stage.outputs:
+                path = os.path.normpath(str(path))
+                if path in producers:
+                    raise ValueError(f'{path} is written by both {producers[path]} and {stage.name}')
+                producers[path] = stage.name
+
+        return {
+            stage.name: {
+                producers[os.path.normpath(str(path))]
+                for path in stage.inputs
+                if os.path.normpath(str(path)) in producers and producers[os.path.normpath(str(path))] != stage.name
+            }
+            for stage in self.stages.values()
+        }
+
+    def topological_order(self) -> list:
+        order, done = [], set()
+        while len(order) < len(self.stages):
+            ready = [name for name in self.stages if name not in done and self.dependencies[name] <= done]
+            if not ready:
+                raise ValueError(f'The stages {sorted(set(self.stages) - done)} contain a dependency cycle')
+            order.extend(ready)
+            done.update(ready)
+        return order
+
+    def run(self, force: set = None) -> dict:
+        '''
+        Run every stage that is not fresh, in dependency order
+
+        Args:
+            - force (set): Names of the stages to run even if they are fresh
+
+        Returns:
+            - dict: Run manifest
+
+        Raises:
+            - Error: The error of the first failed stage, after the stages already running have finished
+        '''
+        force = force or set()
+        self.manifest = {
+            'started_at': now(),
+            'finished_at': None,
+            'status': 'running',
+            'stages': {name: {'status': 'pending', 'depends_on': sorted(self.dependencies[name])} for name in self.order}
+        }
+
+        pending, done, running = list(self.order), set(), {}
+        error = None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                if error is None:
+                    for name in [name for name in pending if self.dependencies[name] <= done]:
+                        pending.remove(name)
+                        running[executor.submit(self.execute, self.stages[name], name in force)] = name
+
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    try:
+                        future.result()
+                        done.add(name)
+                    except Exception as e:
+                        error = error or e
+
+                self.write_manifest()
+
+        self.manifest['finished_at'] = now()
+        self.manifest['status'] = 'failed' if error is not None else 'completed'
+        self.write_manifest()
+
+        if error is not None:
+            raise error
+        return self.manifest
+
+    def execute(self, stage: Stage, force: bool = False):
+        record = self.manifest['stages'][stage.name]
+        record.update({'status': 'running', 'started_at': now()})
+
+        try:
+            fingerprint = None
+            if self.stage_cache is not None:
+                fingerprint = self.stage_cache.fingerprint(
+                    inputs=stage.inputs,
+                    config=stage.config,
+                    modules=stage.modules,
+                    source=stage.source() if stage.source is not None else None
+                )
+
+                if not force and self.stage_cache.is_fresh(stage.name, fingerprint):
+                    logging.info(f"Skipping {stage.name}, its inputs, config and code are unchanged")
+                    record.update({'status': 'skipped', 'duration_s': 0.0})
+                    return
+
+                self.stage_cache.invalidate(stage.name)
+
+            logging.info(f"Running stage {stage.name}")
+            start = time.perf_counter()
+            # concurrent stages share the process, so their peaks include each other's memory
+            with PeakMemorySampler() as sampler:
+                stage.run()
+
+            if self.stage_cache is not None:
+                self.stage_cache.record(stage.name, fingerprint, stage.outputs)
+
+            record.update({
+                'status': 'completed',
+                'duration_s': round(time.perf_counter() - start, 3),
+                'peak_memory_mb': round(sampler.peak_kb / 1024, 1)
+            })
+            logging.info(f"Stage {stage.name} completed in {record['duration_s']}s")
+
+        except Exception as e:
+            record.update({'status': 'failed', 'error': repr(e), 'traceback': traceback.format_exc()})
+            logging.error(f"Error in stage {stage.name}: {e}")
+            raise e
+
+        finally:
+            record['finished_at'] = now()
+
+    def write_manifest(self):
+        if self.manifest_path is None:
+            return
+
+        tmp_path = f'{self.manifest_path}.tmp'
+        save_json(self.manifest, tmp_path)
+        os.replace(tmp_path, self.manifest_path)
@@ -1,11 +1,17 @@
+from pathlib import Path
 from src.laptop_price_prediction.logger import logging
-from src.laptop_price_prediction.pipeline.stage_02_data_transformation_pipeline import DataTransformationPipeline
 from src.laptop_price_prediction.config.configurations import ConfigurationManager
 from src.laptop_price_prediction.components.model_building_and_evaluation import ModelBuilding 
+from src.laptop_price_prediction.utils.common import load_json
 
 
-class ModelBuildingPipeline(DataTransformationPipeline):
-    def __init__(self, train_arr, test_arr):
+class ModelBuildingPipeline:
+    def __init__(self, train_arr=None, test_arr=None):
+        '''
+        Args:
+            - train_arr (np.ndarray): Transformed training data, memory-mapped from train_arr.npy when omitted
+            - test_arr (np.ndarray): Transformed test data, memory-mapped from test_arr.npy when omitted
+        '''
         self.train_arr = train_arr
         self.test_arr = test_arr
 
@@ -19,8 +25,23 @@ class ModelBuildingPipeline(DataTransformationPipeline):
         try:
             config = ConfigurationManager()
             model_building_config = config.get_model_building_config()
+
+            data_transformation_config = config.get_data_transformation_config()
+
+            train_arr, test_arr = self.train_arr, self.test_arr
+            if train_arr is None or test_arr is None:
+                train_arr = data_transformation_config.train_arr_path
+                test_arr = data_transformation_config.test_arr_path
+
+            # the transformation stage records which columns hold native categorical codes
+            sidecar = load_json(Path(data_transformation_config.train_arr_path).with_suffix('.json'))
+
             model_building = ModelBuilding(model_building_config)
-            model_building.initiate_model_building(train_arr=self.train_arr, test_arr=self.test_arr)
+            model_building.initiate_model_building(
+                train_arr=train_arr,
+                test_arr=test_arr,
+                categorical_features=sidecar.get('categorical', [])
+            )
         
         except Exception as e:
             logging.error(f"Error in Model Building Pipeline: {e}")
@@ -1,35 +1,137 @@
+import time
+import numpy as np
 import pandas as pd
-from src.laptop_price_prediction.logger import logging
+from src.laptop_price_prediction.logger import logging, REQUEST
+from src.laptop_price_prediction.utils.artifact_cache import artifact_cache
 from src.laptop_price_prediction.utils.common import load_object
+from src.laptop_price_prediction.utils.metrics import metrics
+from src.laptop_price_prediction.components.compiled_model import CompiledTreeEnsemble
+from src.laptop_price_prediction.utils.prediction_cache import PredictionCache, normalize_features
+
+PREPROCESSOR_PATH = 'artifacts/data_transformation/preprocessor.pkl'
+COMPILED_PREPROCESSOR_PATH = 'artifacts/data_transformation/compiled_preprocessor.pkl'
+MODEL_PATH = 'artifacts/model/model.pkl'
+COMPILED_MODEL_PATH = 'artifacts/model/compiled_model.npz'
+
+FEATURE_COLUMNS = [
+    'Company', 'Product', 'TypeName', 'Inches', 'ScreenResolution',
+    'Cpu', 'Ram', 'Memory', 'Gpu', 'OpSys', 'Weight'
+]
+
 
 class Prediction():
-    def __init__(self) -> None:
-        pass
+    def __init__(self, preprocessor_path=PREPROCESSOR_PATH, model_path=MODEL_PATH, cache: PredictionCache = None) -> None:
+        '''
+        This class predicts laptop prices with the saved preprocessor and model
+
+        Args:
+            - preprocessor_path (str): Path to the fitted preprocessor, or to its compiled lookup-table version
+            - model_path (str): Path to the trained model, a .npz path selects the compiled flat-array ensemble
+            - cache (PredictionCache): Optional cache of predictions keyed on the normalized feature tuple
+        '''
+        self.preprocessor_path = preprocessor_path
+        self.model_path = model_path
+        self.cache = cache
 
     def predict(self, features):
         try:
-            logging.info('Loading preprocessing pipeline')
-            preprocessor = load_object('artifacts/data_transformation/preprocessor.pkl')
-            logging.info('Successfully loaded preprocessing pipeline')
+            start = time.perf_counter()
+            logging.debug('Loading preprocessing pipeline and model')
+            preprocessor, model = self.load_artifacts()
+            logging.debug('Successfully loaded preprocessing pipeline and model')
 
-            logging.info('Loading model')
-            model = load_object('artifacts/model/model.pkl')
-            logging.info('Successfully loaded model')
-
-            logging.info('Preprocessing input features')
-            features = preprocessor.transform(features)
-            logging.info('Successfully preprocessed input features')
-
-            logging.info('Predicting price')
-            price = model.predict(features)
-            logging.info('Successfully predicted price')
+            logging.debug('Preprocessing input features and predicting price')
+            price = self._score(features, preprocessor, model)
+            logging.debug('Successfully predicted price')
 
+            elapsed = time.perf_counter() - start
+            metrics.observe('prediction_seconds', elapsed, method='predict')
+            logging.info('Predicted %d price(s) in %.2f ms', len(price), elapsed * 1000, extra=REQUEST)
             return price
         
         except Exception as e:
             logging.error(f'Error occured while predicting price: {e}')
             return None
 
+    def predict_batch(self, features) -> np.ndarray:
+        '''
+        Predict prices for many rows with a single preprocessor and model call
+
+        Args:
+            - features (pd.DataFrame | np.ndarray | list): Rows to score. Arrays and lists must follow the FEATURE_COLUMNS order.
+              'Ram' and 'Weight' may be given either as numbers or as raw strings such as '8GB' and '1.37kg',
+              the preprocessor parses both
+
+        Returns:
+            - np.ndarray: Predicted prices, one per input row
+
+        Raises:
+            - Error: If there is an error preprocessing the features or predicting the prices
+        '''
+        try:
+            if not isinstance(features, pd.DataFrame):
+                features = pd.DataFrame(np.asarray(features, dtype=object), columns=FEATURE_COLUMNS)
+
+            with metrics.timer('prediction_seconds', method='predict_batch'):
+                features = features[FEATURE_COLUMNS]
+
+                preprocessor, model = self.load_artifacts()
+
+                return self._score(features, preprocessor, model)
+
+        except Exception as e:
+            logging.error(f'Error occured while predicting batch of prices: {e}')
+            raise e
+
+    def load_artifacts(self) -> tuple:
+        '''
+        Fetch the preprocessor and model from the process-wide artifact cache
+
+        Returns:
+            - tuple: Preprocessor and model
+        '''
+        model_loader = CompiledTreeEnsemble.load if str(self.model_path).endswith('.npz') else load_object
+        with metrics.timer('prediction_phase_seconds', phase='artifacts'):
+            return (
+                artifact_cache.get(self.preprocessor_path),
+                artifact_cache.get(self.model_path, loader=model_loader)
+            )
+
+    def _predict(self, features: pd.DataFrame, preprocessor, model) -> np.ndarray:
+        with metrics.timer('prediction_phase_seconds', phase='preprocess'):
+            transformed = preprocessor.transform(features)
+        with metrics.timer('prediction_phase_seconds', phase='model'):
+            prices = model.predict(transformed)
+
+        metrics.inc('predicted_rows', len(prices))
+        return prices
+
+    def _score(self, features: pd.DataFrame, preprocessor, model) -> np.ndarray:
+        if self.cache is None:
+            return self._predict(features, preprocessor, model)
+
+        self.cache.validate((
+            artifact_cache.fingerprint(self.preprocessor_path),
+            artifact_cache.fingerprint(self.model_path)
+        ))
+
+        keys = [normalize_features(row) for row in features[FEATURE_COLUMNS].itertuples(index=False, name=None)]
+        prices = np.empty(len(keys))
+        missing = []
+        for i, key in enumerate(keys):
+            price = self.cache.get(key)
+            if price is None:
+                missing.append(i)
+            else:
+                prices[i] = price
+
+        if missing:
+            prices[missing] = self._predict(features.iloc[missing], preprocessor, model)
+            for i in missing:
+                self.cache.put(keys[i], prices[i])
+
+        return prices
+
 
 class CustomData():
     def __init__(self,
@@ -46,7 +148,7 @@ class CustomData():
                  Weight: float):
 
         try:
-            logging.info('Creating custom data object')
+            logging.debug('Creating custom data object')
 
             self.Company = Company
             self.Product = Product
@@ -60,7 +162,7 @@ class CustomData():
             self.OpSys = OpSys
             self.Weight = Weight
 
-            logging.info('Successfully created custom data object')
+            logging.debug('Successfully created custom data object')
 
         except Exception as e:
             logging.error(f'Error occured while creating custom data object: {e}')
@@ -70,7 +172,7 @@ class CustomData():
     
     def get_data_as_dataframe(self):
         try:
-            logging.info('Creating dataframe from custom data')
+            logging.debug('Creating dataframe from custom data')
             data = {
                 'Company': [self.Company],
                 'Product': [self.Product],
@@ -85,10 +187,10 @@ class CustomData():
                 'Weight': [self.Weight]
             }
 
-            logging.info('Successfully created dataframe from custom data')
+            logging.debug('Successfully created dataframe from custom data')
 
             return pd.DataFrame(data)
         
         except Exception as e:
             logging.error(f'Error occured while creating dataframe from custom data: {e}')
-            return None
\ No newline at end of file
+            return None
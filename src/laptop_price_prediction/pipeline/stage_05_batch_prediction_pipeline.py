@@ -0,0 +1,201 @@
+import argparse
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+from src.laptop_price_prediction.logger import logging
+from src.laptop_price_prediction.pipeline.stage_04_prediction_pipeline import Prediction, PREPROCESSOR_PATH, MODEL_PATH
+from src.laptop_price_prediction.utils.metrics import metrics
+
+PREDICTION_COLUMN = 'Predicted_Price_euros'
+DEFAULT_CHUNK_SIZE = 10000
+
+# prediction object owned by each pool worker, created once by `init_worker`
+_worker_prediction = None
+
+
+def init_worker(preprocessor_path, model_path):
+    '''
+    Load the preprocessor and model once per worker process
+
+    Args:
+        - preprocessor_path (str): Path to the fitted preprocessor
+        - model_path (str): Path to the trained model
+    '''
+    global _worker_prediction
+    _worker_prediction = Prediction(preprocessor_path=preprocessor_path, model_path=model_path)
+    _worker_prediction.load_artifacts()
+
+
+def score_shard(shard: pd.DataFrame):
+    '''
+    Score one shard of rows inside a worker process
+
+    Args:
+        - shard (pd.DataFrame): Rows to score
+
+    Returns:
+        - np.ndarray: Predicted prices for the shard
+    '''
+    return _worker_prediction.predict_batch(shard)
+
+
+class BatchPredictionPipeline:
+    def __init__(self,
+                 input_path,
+                 output_path,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 workers: int = 1,
+                 preprocessor_path=PREPROCESSOR_PATH,
+                 model_path=MODEL_PATH):
+        '''
+        This class scores a CSV file of laptops chunk by chunk and writes the predictions incrementally
+
+        Args:
+            - input_path (str): Path to the CSV file to score, with the same feature columns as raw.csv
+            - output_path (str): Path of the CSV file the input rows and their predicted price are written to
+            - chunk_size (int): Number of rows read, scored and written at a time
+            - workers (int): Number of worker processes the chunks are sharded across, 1 scores in-process
+            - preprocessor_path (str): Path to the fitted preprocessor
+            - model_path (str): Path to the trained model
+        '''
+        self.input_path = input_path
+        self.output_path = output_path
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.preprocessor_path = preprocessor_path
+        self.model_path = model_path
+        self.prediction = Prediction(preprocessor_path=preprocessor_path, model_path=model_path)
+
+    def read_chunks(self):
+        '''
+        Stream the input CSV in fixed-size chunks
+
+        Returns:
+            - Iterator[pd.DataFrame]: Chunks of at most `chunk_size` rows
+        '''
+        reader = pd.read_csv(self.input_path, chunksize=self.chunk_size)
+        while True:
+            with metrics.timer('batch_io_seconds', operation='read'):
+                chunk = next(reader, None)
+            if chunk is None:
+                return
+
+            metrics.inc('batch_rows', len(chunk), operation='read')
+            yield chunk
+
+    def score_chunks(self, chunks):
+        '''
+        Score every chunk with a single vectorized prediction call
+
+        Args:
+            - chunks (Iterator[pd.DataFrame]): Chunks to score
+
+        Returns:
+            - Iterator[pd.DataFrame]: Chunks with the prediction column appended, in input order
+        '''
+        if self.workers <= 1:
+            for chunk in chunks:
+                yield chunk.assign(**{PREDICTION_COLUMN: self.prediction.predict_batch(chunk)})
+            return
+
+        yield from self.score_chunks_parallel(chunks)
+
+    def score_chunks_parallel(self, chunks):
+        '''
+        Shard the chunks across a process pool and yield them back in input order
+
+        At most two shards per worker are in flight, so memory stays bounded by the chunk size
+        no matter how large the input file is.
+
+        Args:
+            - chunks (Iterator[pd.DataFrame]): Chunks to score
+
+        Returns:
+            - Iterator[pd.DataFrame]: Chunks with the prediction column appended, in input order
+        '''
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=init_worker,
+            initargs=(self.preprocessor_path, self.model_path)
+        ) as executor:
+            pending = deque()
+            for chunk in chunks:
+                pending.append((chunk, executor.submit(score_shard, chunk)))
+                if len(pending) >= 2 * self.workers:
+                    done_chunk, future = pending.popleft()
+                    yield done_chunk.assign(**{PREDICTION_COLUMN: future.result()})
+
+            while pending:
+                done_chunk, future = pending.popleft()
+                yield done_chunk.assign(**{PREDICTION_COLUMN: future.result()})
+
+    def main(self) -> dict:
+        '''
+        This function initiates the batch prediction pipeline
+
+        Returns:
+            - dict: Number of rows scored, elapsed seconds and throughput in rows/sec
+
+        Raises:
+            - Error: If there is an error in the batch prediction pipeline
+        '''
+        try:
+            logging.info(f'Scoring {self.input_path} in chunks of {self.chunk_size} rows with {self.workers} worker(s)')
+            output_dir = os.path.dirname(self.output_path)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+
+            start = time.perf_counter()
+            rows = 0
+            header = True
+
+            for scored in self.score_chunks(self.read_chunks()):
+                with metrics.timer('batch_io_seconds', operation='write'):
+                    scored.to_csv(self.output_path, mode='w' if header else 'a', header=header, index=False)
+                metrics.inc('batch_rows', len(scored), operation='write')
+                header = False
+                rows += len(scored)
+
+            elapsed = time.perf_counter() - start
+            stats = {
+                'rows': rows,
+                'seconds': round(elapsed, 3),
+                'rows_per_sec': round(rows / elapsed, 1) if elapsed > 0 else 0.0
+            }
+
+            logging.info(f'Scored {rows} rows in {elapsed:.2f}s ({stats["rows_per_sec"]} rows/sec), predictions saved to {self.output_path}')
+            return stats
+
+        except Exception as e:
+            logging.error(f'Error in batch prediction pipeline: {e}')
+            raise e
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Score a CSV file of laptops with the trained price model')
+    parser.add_argument('input_path', help='CSV file to score')
+    parser.add_argument('output_path', help='CSV file the predictions are written to')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='Rows scored per chunk')
+    parser.add_argument('--workers', type=int, default=1, help='Worker processes to shard chunks across')
+    parser.add_argument('--preprocessor-path', default=PREPROCESSOR_PATH)
+    parser.add_argument('--model-path', default=MODEL_PATH)
+    parser.add_argument('--metrics-path', default=None, help='JSON file the chunk I/O and prediction metrics of the run are saved to')
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    stats = BatchPredictionPipeline(
+        input_path=args.input_path,
+        output_path=args.output_path,
+        chunk_size=args.chunk_size,
+        workers=args.workers,
+        preprocessor_path=args.preprocessor_path,
+        model_path=args.model_path
+    ).main()
+    print(f"Scored {stats['rows']} rows in {stats['seconds']}s ({stats['rows_per_sec']} rows/sec)")
+
+    if args.metrics_path is not None:
+        metrics.save(json_path=args.metrics_path)
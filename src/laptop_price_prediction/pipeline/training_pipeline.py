@@ -0,0 +1,84 @@
+from pathlib import Path
+from src.laptop_price_prediction.pipeline import stage_01_data_ingestion_pipeline, stage_02_data_transformation_pipeline, stage_03_model_building_pipeline
+from src.laptop_price_prediction.pipeline.dag import Stage
+from src.laptop_price_prediction.pipeline.stage_01_data_ingestion_pipeline import DataIngestionPipeline
+from src.laptop_price_prediction.pipeline.stage_02_data_transformation_pipeline import DataTransformationPipeline
+from src.laptop_price_prediction.pipeline.stage_03_model_building_pipeline import ModelBuildingPipeline
+from src.laptop_price_prediction.components import data_ingestion, data_transformation, feature_engineering, feature_parsing, model_building_and_evaluation, compiled_model, compiled_preprocessor
+from src.laptop_price_prediction.components.data_ingestion import DataIngestion
+from src.laptop_price_prediction.config.configurations import ConfigurationManager
+from src.laptop_price_prediction.utils import common, model_search, model_backends, parallel_cv
+
+STAGES = ('data_ingestion', 'data_transformation', 'model_building')
+
+
+def build_training_stages(config: ConfigurationManager) -> list:
+    '''
+    Describe the training pipeline as stages wired together by the artifact paths in config.yaml
+
+    Every stage reads its inputs from and writes its outputs to the configured paths, so any
+    stage can run on its own once the artifacts it depends on exist.
+
+    Args:
+        - config (ConfigurationManager): Configuration the artifact paths are taken from
+
+    Returns:
+        - list: Stage definitions for DAGRunner
+    '''
+    data_ingestion_config = config.get_data_ingestion_config()
+    data_transformation_config = config.get_data_transformation_config()
+    model_building_config = config.get_model_building_config()
+
+    train_sidecar_path = Path(data_transformation_config.train_arr_path).with_suffix('.json')
+    test_sidecar_path = Path(data_transformation_config.test_arr_path).with_suffix('.json')
+
+    return [
+        Stage(
+            name='data_ingestion',
+            run=lambda: DataIngestionPipeline().main(),
+            outputs=[
+                data_ingestion_config.raw_path,
+                data_ingestion_config.train_path,
+                data_ingestion_config.test_path
+            ],
+            config=config.config.data_ingestion.to_dict(),
+            modules=[stage_01_data_ingestion_pipeline, data_ingestion, common],
+            source=lambda: DataIngestion(data_ingestion_config).get_source_fingerprint()
+        ),
+        Stage(
+            name='data_transformation',
+            run=lambda: DataTransformationPipeline(data_ingestion_config.train_path, data_ingestion_config.test_path).main(),
+            inputs=[data_ingestion_config.train_path, data_ingestion_config.test_path],
+            outputs=[
+                data_transformation_config.preprocessor_path,
+                data_transformation_config.compiled_preprocessor_path,
+                data_transformation_config.train_arr_path,
+                data_transformation_config.test_arr_path,
+                train_sidecar_path,
+                test_sidecar_path
+            ],
+            config={
+                'data_transformation': config.config.data_transformation.to_dict(),
+                'backend': data_transformation_config.model_backend
+            },
+            modules=[stage_02_data_transformation_pipeline, data_transformation, feature_engineering, feature_parsing, compiled_preprocessor, model_backends, common]
+        ),
+        Stage(
+            name='model_building',
+            run=lambda: ModelBuildingPipeline().main(),
+            inputs=[
+                data_transformation_config.train_arr_path,
+                data_transformation_config.test_arr_path,
+                train_sidecar_path
+            ],
+            outputs=[
+                model_building_config.model_path,
+                # only GradientBoostingRegressor models are compiled, the other backends remove the file
+                *([model_building_config.compiled_model_path] if model_building_config.backend == 'gbr' else []),
+                model_building_config.train_metrics_path,
+                model_building_config.test_metrics_path
+            ],
+            config=config.config.model.to_dict(),
+            modules=[stage_03_model_building_pipeline, model_building_and_evaluation, compiled_model, model_search, model_backends, parallel_cv, common]
+        )
+    ]
@@ -0,0 +1,142 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+from src.laptop_price_prediction.logger import logging
+from src.laptop_price_prediction.pipeline.stage_04_prediction_pipeline import FEATURE_COLUMNS
+
+
+class MicroBatcher:
+    def __init__(self, predict_fn, max_batch_size: int = 64, max_wait_ms: float = 5.0):
+        '''
+        Coalesce concurrent single-row prediction requests into micro-batches
+
+        The first queued request opens a batch which is closed once it holds `max_batch_size`
+        rows or `max_wait_ms` milliseconds have passed, whichever comes first. The whole batch
+        is then scored with one `predict_fn` call on a dedicated thread so the event loop keeps
+        accepting requests in the meantime. If the batch call fails, its rows are scored one at
+        a time so only the requests whose row fails get the error.
+
+        Args:
+            - predict_fn (callable): Function scoring a DataFrame of FEATURE_COLUMNS rows, e.g. Prediction().predict_batch
+            - max_batch_size (int): Maximum number of rows scored together
+            - max_wait_ms (float): Maximum time the first request of a batch waits for more rows
+        '''
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.queue = None
+        self._task = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='micro-batcher')
+        self.requests = 0
+        self.batches = 0
+
+    async def start(self):
+        '''
+        Start the background task that forms and scores the batches
+        '''
+        self.queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        '''
+        Stop the background task and release the scoring thread
+        '''
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._executor.shutdown(wait=False)
+
+    async def submit(self, record: dict) -> float:
+        '''
+        Queue one row for scoring and wait for its predicted price
+
+        Args:
+            - record (dict): Feature values keyed by FEATURE_COLUMNS
+
+        Returns:
+            - float: Predicted price
+        '''
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((record, future))
+        return await future
+
+    async def _collect_batch(self) -> list:
+        loop = asyncio.get_running_loop()
+        batch = [await self.queue.get()]
+        deadline = loop.time() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            if not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+                continue
+
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect_batch()
+            features = pd.DataFrame([record for record, _ in batch], columns=FEATURE_COLUMNS)
+
+            try:
+                prices = await loop.run_in_executor(self._executor, self.predict_fn, features)
+            except Exception as e:
+                if len(batch) == 1:
+                    logging.error(f'Error scoring a single-row micro-batch: {e}')
+                    self._set_exception(batch[0][1], e)
+                    continue
+
+                logging.error(f'Error scoring micro-batch of {len(batch)} rows, scoring its rows one at a time: {e}')
+                await self._score_rows(batch, features)
+                continue
+
+            self.requests += len(batch)
+            self.batches += 1
+            for (_, future), price in zip(batch, prices):
+                if not future.done():
+                    future.set_result(float(price))
+
+    async def _score_rows(self, batch: list, features: pd.DataFrame):
+        loop = asyncio.get_running_loop()
+        for i, (_, future) in enumerate(batch):
+            try:
+                prices = await loop.run_in_executor(self._executor, self.predict_fn, features.iloc[[i]])
+            except Exception as e:
+                self._set_exception(future, e)
+                continue
+
+            self.requests += 1
+            self.batches += 1
+            if not future.done():
+                future.set_result(float(prices[0]))
+
+    @staticmethod
+    def _set_exception(future: asyncio.Future, error: Exception):
+        if not future.done():
+            future.set_exception(error)
+
+    def stats(self) -> dict:
+        '''
+        Return the batching counters
+
+        Returns:
+            - dict: Number of scored requests and batches and the mean batch size
+        '''
+        return {
+            'requests': self.requests,
+            'batches': self.batches,
+            'mean_batch_size': round(self.requests / self.batches, 2) if self.batches else 0.0,
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait * 1000
+        }
@@ -0,0 +1,225 @@
+import argparse
+import asyncio
+import json
+import time
+from http import HTTPStatus
+import numpy as np
+from src.laptop_price_prediction.logger import logging, REQUEST, configure_logging
+from src.laptop_price_prediction.config.configurations import ConfigurationManager
+from src.laptop_price_prediction.pipeline.stage_04_prediction_pipeline import Prediction, FEATURE_COLUMNS
+from src.laptop_price_prediction.components.feature_parsing import UNIT_COLUMNS, parse_unit_value
+from src.laptop_price_prediction.serving.micro_batcher import MicroBatcher
+from src.laptop_price_prediction.utils.artifact_cache import artifact_cache
+from src.laptop_price_prediction.utils.prediction_cache import PredictionCache
+from src.laptop_price_prediction.utils.metrics import metrics
+
+MAX_BODY_BYTES = 1 << 20
+
+# numeric features and the unit suffix they may be sent with, e.g. 8 or '8GB'
+NUMERIC_COLUMNS = {'Inches': '', **UNIT_COLUMNS}
+
+
+class RequestError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class PredictionServer:
+    def __init__(self, host: str, port: int, max_batch_size: int, max_wait_ms: float, prediction: Prediction = None):
+        '''
+        Minimal asyncio JSON prediction server backed by a MicroBatcher
+
+        Endpoints:
+            - POST /predict: a JSON object with the FEATURE_COLUMNS keys returns {"price": ...},
+              {"instances": [...]} returns {"prices": [...]}
+            - GET /health: liveness probe
+            - GET /stats: micro-batching, artifact cache, prediction cache and hot-path metrics
+            - GET /metrics: hot-path timings and counters in the Prometheus text format
+
+        Args:
+            - host (str): Interface to bind to
+            - port (int): Port to listen on
+            - max_batch_size (int): Maximum number of rows scored together
+            - max_wait_ms (float): Maximum time a request waits for its batch to fill
+            - prediction (Prediction): Prediction object used to score the batches
+        '''
+        self.host = host
+        self.port = port
+        self.prediction = prediction or Prediction()
+        self.batcher = MicroBatcher(self.prediction.predict_batch, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+        self._server = None
+
+    async def start(self):
+        '''
+        Load the artifacts, start the batcher and begin accepting connections
+        '''
+        self.prediction.load_artifacts()
+
+        await self.batcher.start()
+        self._server = await asyncio.start_server(self.handle_connection, self.host, self.port)
+        logging.info(f'Prediction server listening on http://{self.host}:{self.port}')
+
+    async def serve_forever(self):
+        await self.start()
+        try:
+            async with self._server:
+                await self._server.serve_forever()
+        finally:
+            await self.batcher.stop()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                method, path, version = request_line.decode('latin-1').split()
+                headers = await self._read_headers(reader)
+
+                keep_alive = headers.get('connection', '').lower() != 'close' and version == 'HTTP/1.1'
+                start = time.perf_counter()
+                status, payload = await self._dispatch(method, path, headers, reader)
+                logging.info('%s %s %d in %.2f ms', method, path, status.value, (time.perf_counter() - start) * 1000, extra=REQUEST)
+
+                self._write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+
+                if not keep_alive:
+                    break
+
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+
+        finally:
+            writer.close()
+
+    async def _read_headers(self, reader: asyncio.StreamReader) -> dict:
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                return headers
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+
+    async def _dispatch(self, method: str, path: str, headers: dict, reader: asyncio.StreamReader):
+        try:
+            length = int(headers.get('content-length', 0))
+            if length > MAX_BODY_BYTES:
+                raise RequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, 'Request body too large')
+            body = await reader.readexactly(length) if length else b''
+
+            if path == '/health' and method == 'GET':
+                return HTTPStatus.OK, {'status': 'ok'}
+
+            if path == '/stats' and method == 'GET':
+                return HTTPStatus.OK, self.stats()
+
+            if path == '/metrics' and method == 'GET':
+                return HTTPStatus.OK, metrics.to_prometheus()
+
+            if path == '/predict' and method == 'POST':
+                return HTTPStatus.OK, await self.predict(body)
+
+            raise RequestError(HTTPStatus.NOT_FOUND, f'No route for {method} {path}')
+
+        except RequestError as e:
+            return e.status, {'error': str(e)}
+
+        except Exception as e:
+            logging.error(f'Error handling {method} {path}: {e}')
+            return HTTPStatus.INTERNAL_SERVER_ERROR, {'error': str(e)}
+
+    def stats(self) -> dict:
+        stats = {'batching': self.batcher.stats(), 'artifact_cache': artifact_cache.stats(), 'metrics': metrics.snapshot()}
+        if self.prediction.cache is not None:
+            stats['prediction_cache'] = self.prediction.cache.stats()
+        return stats
+
+    async def predict(self, body: bytes) -> dict:
+        '''
+        Score the row(s) of a /predict request body through the micro-batcher
+
+        Args:
+            - body (bytes): JSON request body
+
+        Returns:
+            - dict: Predicted price(s)
+
+        Raises:
+            - RequestError: If the body is not valid JSON, misses feature columns or has non-numeric Inches, Ram or Weight values
+        '''
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            raise RequestError(HTTPStatus.BAD_REQUEST, 'Request body is not valid JSON')
+
+        if isinstance(payload, dict) and 'instances' in payload:
+            records = [self._validate(record) for record in payload['instances']]
+            prices = await asyncio.gather(*(self.batcher.submit(record) for record in records))
+            return {'prices': list(prices)}
+
+        return {'price': await self.batcher.submit(self._validate(payload))}
+
+    def _validate(self, record) -> dict:
+        if not isinstance(record, dict):
+            raise RequestError(HTTPStatus.BAD_REQUEST, 'Each instance must be a JSON object')
+
+        missing = [column for column in FEATURE_COLUMNS if column not in record]
+        if missing:
+            raise RequestError(HTTPStatus.BAD_REQUEST, f'Missing features: {missing}')
+
+        record = {column: record[column] for column in FEATURE_COLUMNS}
+
+        # a bad value is rejected with this request only, instead of failing the micro-batch it would join
+        for column, unit in NUMERIC_COLUMNS.items():
+            value = record[column]
+            if value is None:
+                continue
+            parsed = np.nan if isinstance(value, bool) else parse_unit_value(value, unit)
+            if np.isnan(parsed):
+                raise RequestError(HTTPStatus.BAD_REQUEST, f'{column} must be a number, got {value!r}')
+            record[column] = parsed
+
+        return record
+
+    def _write_response(self, writer: asyncio.StreamWriter, status: HTTPStatus, payload, keep_alive: bool):
+        # text payloads are the Prometheus exposition of GET /metrics
+        if isinstance(payload, str):
+            body, content_type = payload.encode(), 'text/plain; version=0.0.4'
+        else:
+            body, content_type = json.dumps(payload).encode(), 'application/json'
+        head = (
+            f'HTTP/1.1 {status.value} {status.phrase}\r\n'
+            f'Content-Type: {content_type}\r\n'
+            f'Content-Length: {len(body)}\r\n'
+            f'Connection: {"keep-alive" if keep_alive else "close"}\r\n\r\n'
+        )
+        writer.write(head.encode('latin-1') + body)
+
+
+def parse_args(config, argv=None):
+    parser = argparse.ArgumentParser(description='Serve laptop price predictions over HTTP with micro-batching')
+    parser.add_argument('--host', default=config.host)
+    parser.add_argument('--port', type=int, default=config.port)
+    parser.add_argument('--max-batch-size', type=int, default=config.max_batch_size)
+    parser.add_argument('--max-wait-ms', type=float, default=config.max_wait_ms)
+    return parser.parse_args(argv)
+
+
+if __name__ == '__main__':
+    config_manager = ConfigurationManager()
+    configure_logging(config_manager.get_logging_config())
+    metrics.configure(config_manager.get_metrics_config())
+    args = parse_args(config_manager.get_serving_config())
+    cache = PredictionCache.from_config(config_manager.get_prediction_cache_config())
+    server = PredictionServer(
+        host=args.host,
+        port=args.port,
+        max_batch_size=args.max_batch_size,
+        max_wait_ms=args.max_wait_ms,
+        prediction=Prediction(cache=cache)
+    )
+    asyncio.run(server.serve_forever())
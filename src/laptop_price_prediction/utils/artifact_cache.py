@@ -0,0 +1,123 @@
+import os
+import threading
+from dataclasses import dataclass
+from src.laptop_price_prediction.logger import logging
+from src.laptop_price_prediction.utils.common import load_object, get_file_hash
+from src.laptop_price_prediction.utils.metrics import metrics
+
+
+@dataclass
+class CachedArtifact:
+    obj: object
+    stat_key: tuple
+    digest: str
+    loader: object
+
+
+class ArtifactCache:
+    def __init__(self, loader=load_object):
+        '''
+        Process-wide cache of deserialized artifacts (preprocessor, model, ...)
+
+        Every entry is keyed by the absolute file path and validated against the file's
+        mtime/size on each access. When those change the content hash is recomputed and the
+        artifact is only deserialized again if the content is actually different.
+
+        Args:
+            - loader (callable): Function used to deserialize an artifact from its path
+        '''
+        self.loader = loader
+        self._entries = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.reloads = 0
+
+    def get(self, file_path, loader=None):
+        '''
+        Return the artifact stored at `file_path`, loading it only if it is not cached or has changed
+
+        Args:
+            - file_path (str): Path to the artifact
+            - loader (callable): Optional loader overriding the cache default, remembered for later reloads
+
+        Returns:
+            - object: Deserialized artifact
+
+        Raises:
+            - Error: If there is an error reading or deserializing the artifact
+        '''
+        return self._get(file_path, loader).obj
+
+    def _get(self, file_path, loader=None, count=True) -> CachedArtifact:
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry.stat_key == stat_key:
+                self.hits += count
+                return entry
+
+            digest = get_file_hash(path)
+            if entry is not None and entry.digest == digest:
+                # file was touched but its content did not change
+                entry.stat_key = stat_key
+                self.hits += count
+                return entry
+
+            logging.info(f'Loading artifact {path} into the artifact cache')
+            loader = loader or (entry.loader if entry is not None else self.loader)
+            with metrics.timer('artifact_load_seconds', artifact=os.path.basename(path)):
+                obj = loader(path)
+            new_entry = CachedArtifact(obj=obj, stat_key=stat_key, digest=digest, loader=loader)
+            self._entries[path] = new_entry
+
+            if entry is None:
+                self.misses += 1
+            else:
+                self.reloads += 1
+                logging.info(f'Artifact {path} changed on disk and was reloaded')
+
+            return new_entry
+
+    def fingerprint(self, file_path) -> str:
+        '''
+        Return the content hash of a cached artifact, loading it first if needed
+
+        Args:
+            - file_path (str): Path to the artifact
+
+        Returns:
+            - str: SHA-256 digest of the artifact currently held in the cache
+        '''
+        return self._get(file_path, count=False).digest
+
+    def stats(self) -> dict:
+        '''
+        Return the cache counters
+
+        Returns:
+            - dict: Number of hits, misses, reloads and cached entries
+        '''
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'reloads': self.reloads,
+                'entries': len(self._entries)
+            }
+
+    def clear(self):
+        '''
+        Drop every cached artifact and reset the counters
+        '''
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.reloads = 0
+
+
+artifact_cache = ArtifactCache()
@@ -1,4 +1,5 @@
 import os
+import sys
 import pandas as pd
 import numpy as np
 import logging
@@ -6,40 +7,79 @@ import pickle
 import yaml
 from pathlib import Path
 from box import ConfigBox
-import mysql.connector as mysql
-from dotenv import load_dotenv
-from ensure import ensure_annotations
 from box.exceptions import BoxValueError
-from sklearn.ensemble import GradientBoostingRegressor
-from sklearn.model_selection import GridSearchCV
-from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
+from src.laptop_price_prediction.utils.metrics import metrics
 import json
-load_dotenv()
+import time
+import hashlib
+
+# the database driver and the training stack (model search, sklearn metrics) are imported by the
+# functions using them, so the inference path does not pay for them on cold start
+
+# strict: every helper call checks its arguments and return value against the annotations,
+# off: the helpers are left unwrapped, for production images where the checks only cost time
+ANNOTATION_CHECKS_MODES = ('strict', 'off')
+ANNOTATION_CHECKS = os.getenv('ANNOTATION_CHECKS', 'strict').lower()
+
+if ANNOTATION_CHECKS not in ANNOTATION_CHECKS_MODES:
+    raise ValueError(f'Unknown ANNOTATION_CHECKS mode {ANNOTATION_CHECKS!r}, expected one of {ANNOTATION_CHECKS_MODES}')
+
+if ANNOTATION_CHECKS == 'off':
+    def ensure_annotations(function):
+        return function
+else:
+    from ensure import ensure_annotations
 
 
 @ensure_annotations
-def read_sql() -> pd.DataFrame:
+def create_connection():
     '''
-    Read SQL queries from a file
+    Create a connection to the MySQL database described by the environment variables
 
     Returns:
-        - pd.DataFrame: Data read from the SQL file
+        - MySQLConnection: Open database connection
 
     Raises:
-        - Error: If there is an error reading the data
-    ''' 
+        - Error: If there is an error connecting to the database
+    '''
     try:
+        import mysql.connector as mysql
+        from dotenv import load_dotenv
+        load_dotenv()
+
         logging.info('Creating connection to MySQL database')
-        conn = mysql.connect(
+        return mysql.connect(
         host=os.getenv('host'),
         user=os.getenv('user'),
         password=os.getenv('password'),
         database=os.getenv('database')
         )
 
+    except Exception as e:
+        logging.error(f'Error connecting to MySQL database: {e}')
+        raise e
+
+
+@ensure_annotations
+def read_sql(table: str = 'laptop') -> pd.DataFrame:
+    '''
+    Read SQL queries from a file
+
+    Args:
+        - table (str): Table to read, the data_ingestion table of config.yaml
+
+    Returns:
+        - pd.DataFrame: Data read from the SQL file
+
+    Raises:
+        - Error: If there is an error reading the data
+    ''' 
+    try:
+        conn = create_connection()
+
         logging.info('Reading data from MySQL database')
         # read the sql
-        df = pd.read_sql_query('SELECT * FROM laptop', conn)
+        df = pd.read_sql_query(f'SELECT * FROM {table}', conn)
         logging.info('Data read successfully')
         return df
 
@@ -48,6 +88,86 @@ def read_sql() -> pd.DataFrame:
         raise e
 
 
+@ensure_annotations
+def read_sql_chunks(conn, query: str, chunk_size: int, params=None):
+    '''
+    Stream the result of a query in DataFrame chunks through an unbuffered (server-side) cursor
+
+    Args:
+        - conn (Connection): Open DB-API connection, e.g. MySQL or SQLite
+        - query (str): Query to run
+        - chunk_size (int): Number of rows fetched per chunk
+        - params (tuple): Optional query parameters
+
+    Returns:
+        - Iterator[pd.DataFrame]: Chunks of at most `chunk_size` rows
+
+    Raises:
+        - Error: If there is an error running the query or fetching the rows
+    '''
+    try:
+        try:
+            # MySQL streams rows from the server instead of buffering the whole result client-side
+            cursor = conn.cursor(buffered=False)
+        except TypeError:
+            cursor = conn.cursor()
+
+        # closed even if a chunk fails or the consumer stops early, an unbuffered cursor left open
+        # with unread rows keeps the connection busy
+        try:
+            cursor.execute(query, params or ())
+            columns = [column[0] for column in cursor.description]
+
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield pd.DataFrame.from_records(rows, columns=columns)
+
+        finally:
+            cursor.close()
+
+    except Exception as e:
+        logging.error(f'Error streaming data from the database: {e}')
+        raise e
+
+
+@ensure_annotations
+def get_placeholder(conn) -> str:
+    '''
+    Return the query parameter placeholder of a DB-API connection's driver
+
+    Args:
+        - conn (Connection): Open DB-API connection
+
+    Returns:
+        - str: '?' for qmark drivers such as sqlite3, '%s' for format/pyformat drivers such as mysql.connector
+    '''
+    driver = sys.modules.get(type(conn).__module__.split('.')[0])
+    return '?' if getattr(driver, 'paramstyle', 'format') == 'qmark' else '%s'
+
+
+@ensure_annotations
+def hash_split(ids, test_size: float, salt: str = '') -> np.ndarray:
+    '''
+    Deterministically assign rows to the test set from a hash of their id
+
+    The assignment of a row only depends on its id, so the split is reproducible across runs
+    and chunkings without holding all rows in memory.
+
+    Args:
+        - ids (Iterable): Row ids, e.g. laptop_ID values
+        - test_size (float): Expected fraction of rows assigned to the test set
+        - salt (str): Optional salt to draw a different split
+
+    Returns:
+        - np.ndarray: Boolean mask, True for rows that belong to the test set
+    '''
+    keys = np.asarray([f'{salt}{id_}' for id_ in ids], dtype=object)
+    buckets = pd.util.hash_array(keys) % np.uint64(10000)
+    return buckets < np.uint64(round(test_size * 10000))
+
+
 
 @ensure_annotations
 def read_yaml(yamal_file_path: Path) -> ConfigBox:
@@ -120,6 +240,33 @@ def load_object(file_path):
     except Exception as e:
         logging.error(f'Error loading object from file: {e}')
         raise e
+
+
+@ensure_annotations
+def get_file_hash(file_path, chunk_size: int = 1 << 20) -> str:
+    '''
+    Compute the SHA-256 hash of a file's content
+
+    Args:
+        - file_path (str): Path to the file
+        - chunk_size (int): Number of bytes read at a time
+
+    Returns:
+        - str: Hex digest of the file content
+
+    Raises:
+        - Error: If there is an error reading the file
+    '''
+    try:
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    except Exception as e:
+        logging.error(f'Error hashing file {file_path}: {e}')
+        raise e
     
 @ensure_annotations
 def create_directories(dirs: list):
@@ -141,21 +288,34 @@ def create_directories(dirs: list):
     
 
 @ensure_annotations
-def save_transformed_data(data, file_path):
+def save_transformed_data(data, file_path, columns=None, categorical=None):
     '''
-    Save transformed data to a file
+    Save transformed data to a binary .npy file, with a JSON sidecar describing its columns
 
     Args:
         - data (np.array): Data to save
-        - file_path (str): Path to the file
+        - file_path (str): Path to the .npy file
+        - columns (list): Optional column names stored in the sidecar
+        - categorical (list): Optional indices of the columns holding native categorical codes
 
     Raises:
         - Error: If there is an error saving the data
     '''
     try:
         logging.info('Saving transformed data to file')
-        data = pd.DataFrame(data)
-        data.to_csv(file_path, index=False)
+        data = np.ascontiguousarray(data, dtype=np.float64)
+        with open(file_path, 'wb') as file:
+            np.save(file, data)
+
+        save_json(
+            {
+                'columns': list(columns) if columns is not None else None,
+                'categorical': [int(i) for i in categorical] if categorical is not None else [],
+                'shape': list(data.shape),
+                'dtype': str(data.dtype)
+            },
+            Path(file_path).with_suffix('.json')
+        )
         logging.info('Transformed data saved successfully')
 
     except Exception as e:
@@ -163,9 +323,33 @@ def save_transformed_data(data, file_path):
         raise e
 
 
+@ensure_annotations
+def load_transformed_data(file_path, mmap_mode='r'):
+    '''
+    Load transformed data saved with `save_transformed_data`
+
+    Args:
+        - file_path (str): Path to the .npy file
+        - mmap_mode (str): Memory-map mode passed to np.load, None reads the whole array into memory
+
+    Returns:
+        - np.array: Transformed data, memory-mapped read-only by default so nothing is copied up front
+
+    Raises:
+        - Error: If there is an error loading the data
+    '''
+    try:
+        logging.info(f'Loading transformed data from {file_path}')
+        return np.load(file_path, mmap_mode=mmap_mode)
+
+    except Exception as e:
+        logging.error(f'Error loading transformed data from file: {e}')
+        raise e
+
+
 
 @ensure_annotations
-def model_building_and_evaluation(X_train, y_train, X_test, y_test) -> dict:
+def model_building_and_evaluation(X_train, y_train, X_test, y_test, search_config=None, backend='gbr', categorical_features=None, param_grid=None) -> dict:
     '''
     Build and evaluate a model
 
@@ -174,31 +358,63 @@ def model_building_and_evaluation(X_train, y_train, X_test, y_test) -> dict:
         - y_train (np.array): Training labels
         - X_test (np.array): Testing data
         - y_test (np.array): Testing labels
-        - model (object): Model to build and evaluate
+        - search_config (ModelSearchConfig): Hyperparameter search settings, the exhaustive 5-fold grid search is used if None
+        - backend (str): Model backend, 'gbr', 'hist_gbr' or 'xgboost'
+        - categorical_features (list): Indices of the features the hist backends split natively as categories
+        - param_grid (dict): Grid searched by the grid-based strategies, the default PARAM_GRID of model_search if None
 
     Returns:
         - dict: Model evaluation results
         - model: Model object
     '''
     try:
+        from sklearn.metrics import mean_squared_error, mean_absolute_error, r2_score
+        from src.laptop_price_prediction.utils.model_search import build_search
+        from src.laptop_price_prediction.utils.model_backends import build_estimator, STAGE_PARAMS
+
         logging.info('Building and evaluating model')
-        model = GradientBoostingRegressor()
+        model = build_estimator(
+            backend,
+            n_features=X_train.shape[1],
+            categorical_features=categorical_features,
+            random_state=search_config.random_state if search_config is not None else None
+        )
 
         logging.info('Turning hyperparameters')
-        param_grid = {
-            'n_estimators': [10, 50, 100, 200, 400, 450, 500],
-            'max_depth': [3, 5, 7, 9, 11],
-            'learning_rate': [1e-2, 1e-1, 1]
-        }
-
-        logging.info('Performing grid search')
-        grid_search = GridSearchCV(model, param_grid, cv=5, n_jobs=-1)
+        if search_config is None:
+            strategy = 'grid'
+            grid_search = build_search(model, stage_param=STAGE_PARAMS[backend], param_grid=param_grid)
+        else:
+            strategy = search_config.strategy
+            grid_search = build_search(
+                model,
+                strategy=search_config.strategy,
+                cv=search_config.cv,
+                n_jobs=search_config.n_jobs,
+                n_iter=search_config.n_iter,
+                time_budget_seconds=search_config.time_budget_seconds,
+                resource=search_config.resource,
+                random_state=search_config.random_state,
+                stage_param=STAGE_PARAMS[backend],
+                param_grid=param_grid
+            )
+
+        logging.info(f'Performing {strategy} search')
+        search_start = time.perf_counter()
         grid_search.fit(X_train, y_train)
+        fit_seconds = time.perf_counter() - search_start
 
-        logging.info('Evaluating model')
-        model = model.set_params(**grid_search.best_params_)
-        model.fit(X_train, y_train)
+        # the search already refits the best parameters on the whole training set
+        model = grid_search.best_estimator_
+        timings = {
+            'search': fit_seconds - grid_search.refit_time_,
+            'refit': grid_search.refit_time_
+        }
+        logging.info(f'{strategy} search evaluated {len(grid_search.cv_results_["params"])} candidates in {timings["search"]:.1f}s, refit took {timings["refit"]:.1f}s')
+        metrics.inc('search_candidates', len(grid_search.cv_results_['params']), backend=backend, strategy=strategy)
 
+        logging.info('Evaluating model')
+        evaluation_start = time.perf_counter()
         y_pred_train = model.predict(X_train)
         y_pred_test = model.predict(X_test)
 
@@ -209,6 +425,10 @@ def model_building_and_evaluation(X_train, y_train, X_test, y_test) -> dict:
         test_r2 = r2_score(y_test, y_pred_test)
         test_mse = mean_squared_error(y_test, y_pred_test)
         test_mae = mean_absolute_error(y_test, y_pred_test)
+        timings['evaluation'] = time.perf_counter() - evaluation_start
+
+        for phase, seconds in timings.items():
+            metrics.observe('model_building_phase_seconds', seconds, phase=phase, backend=backend, strategy=strategy)
 
         # save the train metrics and test metrics separately
         results = {
@@ -223,7 +443,13 @@ def model_building_and_evaluation(X_train, y_train, X_test, y_test) -> dict:
                 'r2': test_r2,
                 'mse': test_mse,
                 'mae': test_mae,
-                'params': grid_search.best_params_
+                'params': grid_search.best_params_,
+                'search': {
+                    'backend': backend,
+                    'strategy': strategy,
+                    'candidates': len(grid_search.cv_results_['params'])
+                },
+                'timings': timings
             }
         }
 
@@ -258,3 +484,26 @@ def save_json(data, file_path):
         raise e
 
 
+@ensure_annotations
+def load_json(file_path) -> dict:
+    '''
+    Load data from a JSON file
+
+    Args:
+        - file_path (str): Path to the file
+
+    Returns:
+        - dict: Data read from the file
+
+    Raises:
+        - Error: If there is an error reading the data
+    '''
+    try:
+        with open(file_path, 'r') as file:
+            return json.load(file)
+
+    except Exception as e:
+        logging.error(f'Error loading data from JSON file: {e}')
+        raise e
+
+
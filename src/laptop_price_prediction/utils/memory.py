@@ -0,0 +1,93 @@
+import os
+import threading
+
+
+def process_memory_kb(pid: int) -> int:
+    '''
+    Return the proportional set size of a process in kB
+
+    PSS splits shared pages between the processes mapping them, so memory-mapped data read by
+    several workers is only counted once. Falls back to RSS on kernels without smaps_rollup and
+    returns 0 when /proc is not available (e.g. macOS, Windows).
+
+    Args:
+        - pid (int): Process id
+
+    Returns:
+        - int: Memory of the process in kB
+    '''
+    for path, field in ((f'/proc/{pid}/smaps_rollup', 'Pss:'), (f'/proc/{pid}/status', 'VmRSS:')):
+        try:
+            with open(path) as file:
+                for line in file:
+                    if line.startswith(field):
+                        return int(line.split()[1])
+        except OSError:
+            continue
+    return 0
+
+
+def tree_memory_kb(root_pid: int = None) -> int:
+    '''
+    Return the memory of a process and all of its descendants (e.g. CV worker pools) in kB
+
+    Args:
+        - root_pid (int): Process id of the root of the tree, the current process if None
+
+    Returns:
+        - int: Summed memory of the process tree in kB
+    '''
+    root_pid = os.getpid() if root_pid is None else root_pid
+
+    children = {}
+    try:
+        pids = [pid for pid in os.listdir('/proc') if pid.isdigit()]
+    except OSError:
+        pids = []
+
+    for pid in pids:
+        try:
+            with open(f'/proc/{pid}/stat') as file:
+                ppid = int(file.read().rsplit(')', 1)[1].split()[1])
+            children.setdefault(ppid, []).append(int(pid))
+        except (OSError, IndexError, ValueError):
+            continue
+
+    total, stack = 0, [root_pid]
+    while stack:
+        pid = stack.pop()
+        stack.extend(children.get(pid, []))
+        total += process_memory_kb(pid)
+    return total
+
+
+class PeakMemorySampler:
+    def __init__(self, root_pid: int = None, interval: float = 0.1):
+        '''
+        Track the peak memory of a process tree from a background thread while the context is active
+
+        Args:
+            - root_pid (int): Process id of the root of the tree, the current process if None
+            - interval (float): Seconds between two samples
+        '''
+        self.root_pid = root_pid
+        self.interval = interval
+        self.peak_kb = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def sample(self):
+        while True:
+            self.peak_kb = max(self.peak_kb, tree_memory_kb(self.root_pid))
+            if self._stop.wait(self.interval):
+                break
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+        self.peak_kb = max(self.peak_kb, tree_memory_kb(self.root_pid))
@@ -0,0 +1,198 @@
+import json
+import threading
+import time
+from bisect import bisect_left
+from contextlib import nullcontext
+
+# upper bounds in seconds, from sub-millisecond predictions up to a full grid search
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+METRIC_PREFIX = 'laptop_price_'
+
+# returned by `timer` while metrics are disabled, so a disabled timer costs a single attribute check
+NULL_TIMER = nullcontext()
+
+
+class Histogram:
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        '''
+        Fixed-bucket histogram of observed durations
+
+        Args:
+            - buckets (tuple): Sorted upper bounds of the buckets, an implicit +Inf bucket is added
+        '''
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self) -> list:
+        counts, total = [], 0
+        for count in self.counts:
+            total += count
+            counts.append(total)
+        return counts
+
+
+class Timer:
+    __slots__ = ('registry', 'name', 'labels', 'start')
+
+    def __init__(self, registry, name: str, labels: tuple):
+        self.registry = registry
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.registry._observe(self.name, self.labels, time.perf_counter() - self.start)
+
+
+class MetricsRegistry:
+    def __init__(self, enabled: bool = True):
+        '''
+        Process-wide counters and duration histograms of the pipeline and prediction hot paths
+
+        Metrics are identified by a name and keyword labels, e.g.
+        `metrics.timer('prediction_phase_seconds', phase='preprocess')`. Snapshots can be exported
+        in the Prometheus text format or as JSON.
+
+        Args:
+            - enabled (bool): Record metrics, every call is a no-op if False
+        '''
+        self.enabled = enabled
+        self._counters = {}
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def timer(self, name: str, **labels):
+        '''
+        Time the body of a `with` block into the histogram `name`
+
+        Args:
+            - name (str): Histogram name, in seconds
+            - labels: Label values of the series
+
+        Returns:
+            - Timer: Context manager, a no-op one if metrics are disabled
+        '''
+        if not self.enabled:
+            return NULL_TIMER
+        return Timer(self, name, tuple(sorted(labels.items())))
+
+    def observe(self, name: str, seconds: float, **labels):
+        if self.enabled:
+            self._observe(name, tuple(sorted(labels.items())), seconds)
+
+    def inc(self, name: str, value: float = 1, **labels):
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def _observe(self, name: str, labels: tuple, seconds: float):
+        key = (name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(seconds)
+
+    def snapshot(self) -> dict:
+        '''
+        Return the current value of every metric
+
+        Returns:
+            - dict: Counters and histograms (count, sum, mean and bucket counts), keyed by name and then by labels
+        '''
+        snapshot = {'counters': {}, 'histograms': {}}
+        with self._lock:
+            for (name, labels), value in sorted(self._counters.items()):
+                snapshot['counters'].setdefault(name, []).append({'labels': dict(labels), 'value': value})
+
+            for (name, labels), histogram in sorted(self._histograms.items()):
+                snapshot['histograms'].setdefault(name, []).append({
+                    'labels': dict(labels),
+                    'count': histogram.count,
+                    'sum': round(histogram.sum, 6),
+                    'mean': round(histogram.sum / histogram.count, 6) if histogram.count else 0.0,
+                    'buckets': {str(bound): count for bound, count in zip(histogram.buckets + ('+Inf',), histogram.cumulative_counts())}
+                })
+        return snapshot
+
+    def to_prometheus(self) -> str:
+        '''
+        Render every metric in the Prometheus text exposition format
+
+        Returns:
+            - str: Counters as `<name>_total` and histograms as `_bucket`, `_sum` and `_count` series
+        '''
+        lines = []
+        with self._lock:
+            for name in sorted({name for name, _ in self._counters}):
+                lines.append(f'# TYPE {METRIC_PREFIX}{name}_total counter')
+                for (series, labels), value in sorted(self._counters.items()):
+                    if series == name:
+                        lines.append(f'{METRIC_PREFIX}{name}_total{format_labels(labels)} {value}')
+
+            for name in sorted({name for name, _ in self._histograms}):
+                lines.append(f'# TYPE {METRIC_PREFIX}{name} histogram')
+                for (series, labels), histogram in sorted(self._histograms.items()):
+                    if series != name:
+                        continue
+                    for bound, count in zip(histogram.buckets + ('+Inf',), histogram.cumulative_counts()):
+                        lines.append(f'{METRIC_PREFIX}{name}_bucket{format_labels(labels + (("le", bound),))} {count}')
+                    lines.append(f'{METRIC_PREFIX}{name}_sum{format_labels(labels)} {histogram.sum}')
+                    lines.append(f'{METRIC_PREFIX}{name}_count{format_labels(labels)} {histogram.count}')
+
+        return '\n'.join(lines) + '\n'
+
+    def save(self, json_path=None, prometheus_path=None):
+        '''
+        Write the current snapshot as JSON and/or Prometheus text
+
+        Args:
+            - json_path (str): Path of the JSON dump, not written if None
+            - prometheus_path (str): Path of the Prometheus text snapshot, not written if None
+        '''
+        if json_path is not None:
+            with open(json_path, 'w') as file:
+                json.dump(self.snapshot(), file, indent=4)
+        if prometheus_path is not None:
+            with open(prometheus_path, 'w') as file:
+                file.write(self.to_prometheus())
+
+    def configure(self, config):
+        '''
+        Apply the metrics section of config.yaml
+
+        Args:
+            - config (MetricsConfig): Metrics settings
+        '''
+        self.enabled = config.enabled
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+def format_labels(labels: tuple) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{escape_label(value)}"' for key, value in labels) + '}'
+
+
+def escape_label(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+metrics = MetricsRegistry()
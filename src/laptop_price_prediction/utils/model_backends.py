@@ -0,0 +1,63 @@
+from sklearn.ensemble import GradientBoostingRegressor, HistGradientBoostingRegressor
+
+MODEL_BACKENDS = ('gbr', 'hist_gbr', 'xgboost')
+
+# backends binning features into histograms, trained on unscaled ordinal codes with native categoricals
+HIST_BACKENDS = ('hist_gbr', 'xgboost')
+
+# native categorical splits are limited to the number of histogram bins, wider columns stay ordinal
+HIST_MAX_CATEGORIES = 255
+
+# parameter holding the number of boosting stages of each backend
+STAGE_PARAMS = {
+    'gbr': 'n_estimators',
+    'hist_gbr': 'max_iter',
+    'xgboost': 'n_estimators'
+}
+
+
+def build_estimator(backend: str = 'gbr', n_features: int = None, categorical_features: list = None, random_state: int = None):
+    '''
+    Create the unfitted regressor of the backend selected in config.yaml
+
+    Args:
+        - backend (str): 'gbr' (GradientBoostingRegressor), 'hist_gbr' (HistGradientBoostingRegressor) or 'xgboost' (XGBRegressor with the hist method)
+        - n_features (int): Number of input features, required by xgboost to type the categorical features
+        - categorical_features (list): Indices of the ordinal-encoded features split natively as categories
+        - random_state (int): Seed of the estimator
+
+    Returns:
+        - object: Unfitted regressor
+
+    Raises:
+        - ValueError: If the backend is unknown
+        - ImportError: If the xgboost backend is selected without xgboost installed
+    '''
+    categorical_features = list(categorical_features or [])
+
+    if backend == 'gbr':
+        return GradientBoostingRegressor(random_state=random_state)
+
+    if backend == 'hist_gbr':
+        # early stopping would cut the stage grid short and break the staged search
+        return HistGradientBoostingRegressor(
+            categorical_features=categorical_features or None,
+            early_stopping=False,
+            random_state=random_state
+        )
+
+    if backend == 'xgboost':
+        from xgboost import XGBRegressor
+
+        feature_types = None
+        if categorical_features:
+            feature_types = ['c' if i in categorical_features else 'q' for i in range(n_features)]
+
+        return XGBRegressor(
+            tree_method='hist',
+            enable_categorical=bool(categorical_features),
+            feature_types=feature_types,
+            random_state=random_state
+        )
+
+    raise ValueError(f'Unknown model backend {backend!r}, expected one of {MODEL_BACKENDS}')
@@ -0,0 +1,213 @@
+import time
+import numpy as np
+from scipy.stats import loguniform, randint
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.metrics import r2_score
+from sklearn.model_selection import GridSearchCV, ParameterGrid, ParameterSampler, check_cv, cross_val_score
+from src.laptop_price_prediction.logger import logging
+
+SEARCH_STRATEGIES = ('grid', 'shared', 'staged', 'halving', 'random')
+
+PARAM_GRID = {
+    'n_estimators': [10, 50, 100, 200, 400, 450, 500],
+    'max_depth': [3, 5, 7, 9, 11],
+    'learning_rate': [1e-2, 1e-1, 1]
+}
+
+PARAM_DISTRIBUTIONS = {
+    'n_estimators': randint(10, 501),
+    'max_depth': randint(3, 12),
+    'learning_rate': loguniform(1e-2, 1)
+}
+
+
+class TimeBudgetedRandomSearch:
+    def __init__(self, estimator, param_distributions: dict, n_iter: int = 20, cv: int = 5,
+                 n_jobs: int = None, time_budget_seconds: float = None, random_state: int = None):
+        '''
+        Random search that stops sampling new candidates once its time budget is spent
+
+        Exposes the subset of the GridSearchCV API used by the model building stage
+        (`fit`, `best_params_`, `best_score_`, `best_estimator_`, `cv_results_`).
+
+        Args:
+            - estimator (object): Estimator to tune
+            - param_distributions (dict): Distributions or lists to sample the parameters from
+            - n_iter (int): Maximum number of candidates
+            - cv (int): Number of cross-validation folds
+            - n_jobs (int): Number of jobs the folds of a candidate are evaluated with
+            - time_budget_seconds (float): Wall-clock budget, no new candidate is started once it is exceeded. The first candidate always runs, so even a budget of 0 yields a fitted search
+            - random_state (int): Seed of the parameter sampler
+        '''
+        self.estimator = estimator
+        self.param_distributions = param_distributions
+        self.n_iter = n_iter
+        self.cv = cv
+        self.n_jobs = n_jobs
+        self.time_budget_seconds = time_budget_seconds
+        self.random_state = random_state
+
+    def fit(self, X, y):
+        start = time.perf_counter()
+        self.cv_results_ = {'params': [], 'mean_test_score': [], 'std_test_score': []}
+
+        for params in ParameterSampler(self.param_distributions, n_iter=self.n_iter, random_state=self.random_state):
+            # scipy distributions return numpy scalars, which the metrics JSON cannot serialize
+            params = {name: value.item() if hasattr(value, 'item') else value for name, value in params.items()}
+
+            if self.cv_results_['params'] and self.time_budget_seconds is not None and time.perf_counter() - start >= self.time_budget_seconds:
+                logging.info(f'Time budget of {self.time_budget_seconds}s spent after {len(self.cv_results_["params"])} candidates')
+                break
+
+            scores = cross_val_score(clone(self.estimator).set_params(**params), X, y, cv=self.cv, n_jobs=self.n_jobs)
+            self.cv_results_['params'].append(params)
+            self.cv_results_['mean_test_score'].append(float(np.mean(scores)))
+            self.cv_results_['std_test_score'].append(float(np.std(scores)))
+
+        self.best_index_ = int(np.argmax(self.cv_results_['mean_test_score']))
+        self.best_params_ = self.cv_results_['params'][self.best_index_]
+        self.best_score_ = self.cv_results_['mean_test_score'][self.best_index_]
+
+        refit_start = time.perf_counter()
+        self.best_estimator_ = clone(self.estimator).set_params(**self.best_params_).fit(X, y)
+        self.refit_time_ = time.perf_counter() - refit_start
+        return self
+
+
+class StagedGridSearch:
+    def __init__(self, estimator, param_grid: dict, cv: int = 5, n_jobs: int = None, stage_param: str = 'n_estimators'):
+        '''
+        Exhaustive grid search that scores every number of boosting stages from a single fit
+
+        A boosted model with the largest `n_estimators` contains every smaller model as a prefix, so
+        each (max_depth, learning_rate) pair is fitted once per fold and all `n_estimators` values are
+        scored from `staged_predict`. The folds, scores and candidate order match GridSearchCV, so the
+        selected parameters are the same with a fraction of the fits.
+
+        Args:
+            - estimator (object): Boosting estimator implementing `staged_predict`
+            - param_grid (dict): Parameter grid, including the stage parameter
+            - cv (int): Number of cross-validation folds
+            - n_jobs (int): Number of parallel jobs, one per (fold, non-stage parameters) fit
+            - stage_param (str): Parameter holding the number of boosting stages
+        '''
+        self.estimator = estimator
+        self.param_grid = param_grid
+        self.cv = cv
+        self.n_jobs = n_jobs
+        self.stage_param = stage_param
+
+    def fit(self, X, y):
+        stages = sorted(self.param_grid[self.stage_param])
+        base_grid = list(ParameterGrid({name: values for name, values in self.param_grid.items() if name != self.stage_param}))
+        splits = list(check_cv(self.cv, y, classifier=False).split(X, y))
+
+        fold_scores = Parallel(n_jobs=self.n_jobs)(
+            delayed(_score_stages)(clone(self.estimator), params, X, y, train, test, self.stage_param, stages)
+            for train, test in splits
+            for params in base_grid
+        )
+
+        # (fold, base params) -> {n_stages: score}, reordered into GridSearchCV's candidate order
+        scores = {}
+        for i, stage_scores in enumerate(fold_scores):
+            fold, base_index = divmod(i, len(base_grid))
+            scores[(fold, base_index)] = stage_scores
+
+        self.cv_results_ = {'params': [], 'mean_test_score': [], 'std_test_score': []}
+        for params in ParameterGrid(self.param_grid):
+            base_index = base_grid.index({name: value for name, value in params.items() if name != self.stage_param})
+            candidate_scores = [scores[(fold, base_index)][params[self.stage_param]] for fold in range(len(splits))]
+            self.cv_results_['params'].append(params)
+            self.cv_results_['mean_test_score'].append(float(np.mean(candidate_scores)))
+            self.cv_results_['std_test_score'].append(float(np.std(candidate_scores)))
+
+        self.n_fits_ = len(fold_scores)
+        self.best_index_ = int(np.argmax(self.cv_results_['mean_test_score']))
+        self.best_params_ = self.cv_results_['params'][self.best_index_]
+        self.best_score_ = self.cv_results_['mean_test_score'][self.best_index_]
+
+        refit_start = time.perf_counter()
+        self.best_estimator_ = clone(self.estimator).set_params(**self.best_params_).fit(X, y)
+        self.refit_time_ = time.perf_counter() - refit_start
+        return self
+
+
+def _score_stages(estimator, params: dict, X, y, train, test, stage_param: str, stages: list) -> dict:
+    estimator.set_params(**params, **{stage_param: stages[-1]})
+    estimator.fit(X[train], y[train])
+
+    wanted = set(stages)
+    scores = {}
+    for n_stages, y_pred in enumerate(estimator.staged_predict(X[test]), start=1):
+        if n_stages in wanted:
+            scores[n_stages] = r2_score(y[test], y_pred)
+    return scores
+
+
+def with_stage_param(params: dict, stage_param: str) -> dict:
+    return {stage_param if name == 'n_estimators' else name: values for name, values in params.items()}
+
+
+def build_search(estimator, strategy: str = 'grid', cv: int = 5, n_jobs: int = -1, n_iter: int = 20,
+                 time_budget_seconds: float = None, resource: str = 'n_estimators', random_state: int = 42,
+                 stage_param: str = 'n_estimators', param_grid: dict = None):
+    '''
+    Create the hyperparameter search selected in config.yaml
+
+    Args:
+        - estimator (object): Estimator to tune
+        - strategy (str): 'grid' (exhaustive GridSearchCV), 'shared' (the same grid on a pool reading the data from shared memory),
+          'staged' (the same grid scored from staged predictions),
+          'halving' (successive halving) or 'random' (time-budgeted random sampling)
+        - cv (int): Number of cross-validation folds
+        - n_jobs (int): Number of parallel jobs
+        - n_iter (int): Maximum number of candidates of the random strategy
+        - time_budget_seconds (float): Wall-clock budget of the random strategy
+        - resource (str): Budget grown by successive halving, 'n_estimators' or 'n_samples'
+        - random_state (int): Seed of the randomized strategies
+        - stage_param (str): Parameter holding the number of boosting stages of the estimator (e.g. 'max_iter')
+        - param_grid (dict): Grid searched by the grid-based strategies, keyed with 'n_estimators' as the stage parameter; PARAM_GRID if None
+
+    Returns:
+        - object: Unfitted search object with the GridSearchCV fit/best_* API
+
+    Raises:
+        - ValueError: If the strategy is unknown or not supported by the estimator
+    '''
+    param_grid = with_stage_param(PARAM_GRID if param_grid is None else param_grid, stage_param)
+
+    if strategy == 'grid':
+        return GridSearchCV(estimator, param_grid, cv=cv, n_jobs=n_jobs)
+
+    if strategy == 'shared':
+        from src.laptop_price_prediction.utils.parallel_cv import SharedMemoryGridSearch
+        return SharedMemoryGridSearch(estimator, param_grid, cv=cv, n_jobs=n_jobs)
+
+    if strategy == 'staged':
+        if not hasattr(estimator, 'staged_predict'):
+            raise ValueError(f'The staged search needs an estimator with staged_predict, got {type(estimator).__name__}')
+        return StagedGridSearch(estimator, param_grid, cv=cv, n_jobs=n_jobs, stage_param=stage_param)
+
+    if strategy == 'halving':
+        from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+        from sklearn.model_selection import HalvingGridSearchCV
+
+        if resource in ('n_estimators', stage_param):
+            # every round keeps the best third of the candidates and trains them with three times more trees
+            return HalvingGridSearchCV(
+                estimator, {name: values for name, values in param_grid.items() if name != stage_param}, resource=stage_param,
+                min_resources='exhaust', max_resources=max(param_grid[stage_param]),
+                cv=cv, n_jobs=n_jobs, random_state=random_state
+            )
+
+        return HalvingGridSearchCV(estimator, param_grid, resource=resource, cv=cv, n_jobs=n_jobs, random_state=random_state)
+
+    if strategy == 'random':
+        return TimeBudgetedRandomSearch(
+            estimator, with_stage_param(PARAM_DISTRIBUTIONS, stage_param), n_iter=n_iter, cv=cv, n_jobs=n_jobs,
+            time_budget_seconds=time_budget_seconds, random_state=random_state
+        )
+
+    raise ValueError(f'Unknown search strategy {strategy!r}, expected one of {SEARCH_STRATEGIES}')
@@ -0,0 +1,113 @@
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+from joblib import effective_n_jobs
+from sklearn.base import clone
+from sklearn.model_selection import ParameterGrid, check_cv
+from src.laptop_price_prediction.logger import logging
+
+# RAM-backed filesystem the training data is shared through, falling back to the default temp dir
+SHARED_MEMORY_DIR = '/dev/shm'
+
+# training data, estimator and folds owned by each pool worker, set once by `init_worker`
+_worker_state = {}
+
+
+def init_worker(data_dir: str, estimator, splits: list):
+    '''
+    Memory-map the shared training data once per worker process
+
+    Args:
+        - data_dir (str): Directory holding X.npy and y.npy
+        - estimator (object): Unfitted estimator every job clones
+        - splits (list): Precomputed (train, test) index arrays of every fold
+    '''
+    _worker_state['X'] = np.load(os.path.join(data_dir, 'X.npy'), mmap_mode='r')
+    _worker_state['y'] = np.load(os.path.join(data_dir, 'y.npy'), mmap_mode='r')
+    _worker_state['estimator'] = estimator
+    _worker_state['splits'] = splits
+
+
+def fit_and_score(candidate_index: int, params: dict, fold_index: int):
+    '''
+    Fit one candidate on one fold inside a worker process
+
+    Args:
+        - candidate_index (int): Position of the candidate in the parameter grid
+        - params (dict): Candidate parameters
+        - fold_index (int): Fold to fit and score
+
+    Returns:
+        - tuple: Candidate index, fold index and the fold's test score
+    '''
+    X, y = _worker_state['X'], _worker_state['y']
+    train, test = _worker_state['splits'][fold_index]
+
+    estimator = clone(_worker_state['estimator']).set_params(**params)
+    estimator.fit(X[train], y[train])
+    return candidate_index, fold_index, estimator.score(X[test], y[test])
+
+
+class SharedMemoryGridSearch:
+    def __init__(self, estimator, param_grid: dict, cv: int = 5, n_jobs: int = None):
+        '''
+        Exhaustive grid search whose workers read the training data zero-copy
+
+        The training data is written once to a memory-mapped file in shared memory and the fold
+        indices are computed once, so each candidate x fold job only sends its parameters to the
+        pool instead of the data. Folds, scoring and candidate order match GridSearchCV.
+
+        Args:
+            - estimator (object): Estimator to tune
+            - param_grid (dict): Parameter grid
+            - cv (int): Number of cross-validation folds
+            - n_jobs (int): Number of worker processes, following joblib: None is 1 unless set by a joblib parallel_backend context, -1 every core, -2 all but one, ...
+        '''
+        self.estimator = estimator
+        self.param_grid = param_grid
+        self.cv = cv
+        self.n_jobs = n_jobs
+
+    def fit(self, X, y):
+        candidates = list(ParameterGrid(self.param_grid))
+        splits = list(check_cv(self.cv, y, classifier=False).split(X, y))
+        n_workers = effective_n_jobs(self.n_jobs)
+
+        data_dir = tempfile.mkdtemp(prefix='cv_', dir=SHARED_MEMORY_DIR if os.path.isdir(SHARED_MEMORY_DIR) else None)
+        try:
+            np.save(os.path.join(data_dir, 'X.npy'), np.ascontiguousarray(X))
+            np.save(os.path.join(data_dir, 'y.npy'), np.ascontiguousarray(y))
+
+            scores = np.empty((len(candidates), len(splits)))
+            with ProcessPoolExecutor(max_workers=n_workers, initializer=init_worker,
+                                     initargs=(data_dir, clone(self.estimator), splits)) as executor:
+                futures = [
+                    executor.submit(fit_and_score, candidate_index, params, fold_index)
+                    for candidate_index, params in enumerate(candidates)
+                    for fold_index in range(len(splits))
+                ]
+                for future in as_completed(futures):
+                    candidate_index, fold_index, score = future.result()
+                    scores[candidate_index, fold_index] = score
+
+        finally:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+        logging.info(f'Evaluated {len(candidates)} candidates x {len(splits)} folds on {n_workers} workers')
+
+        self.cv_results_ = {
+            'params': candidates,
+            'mean_test_score': scores.mean(axis=1).tolist(),
+            'std_test_score': scores.std(axis=1).tolist()
+        }
+        self.best_index_ = int(np.argmax(self.cv_results_['mean_test_score']))
+        self.best_params_ = self.cv_results_['params'][self.best_index_]
+        self.best_score_ = self.cv_results_['mean_test_score'][self.best_index_]
+
+        refit_start = time.perf_counter()
+        self.best_estimator_ = clone(self.estimator).set_params(**self.best_params_).fit(X, y)
+        self.refit_time_ = time.perf_counter() - refit_start
+        return self
@@ -0,0 +1,149 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+
+
+def normalize_features(values) -> tuple:
+    '''
+    Build a hashable cache key from feature values given in FEATURE_COLUMNS order
+
+    Strings are stripped, numbers are converted to rounded floats (so 8, 8.0 and np.int64(8)
+    share a key) and missing values become None.
+
+    Args:
+        - values (Iterable): Feature values of one row
+
+    Returns:
+        - tuple: Normalized feature tuple
+    '''
+    key = []
+    for value in values:
+        if value is None or (isinstance(value, float) and math.isnan(value)):
+            key.append(None)
+        elif isinstance(value, str):
+            key.append(value.strip())
+        else:
+            try:
+                key.append(round(float(value), 6))
+            except (TypeError, ValueError):
+                key.append(str(value))
+    return tuple(key)
+
+
+class PredictionCache:
+    def __init__(self, max_size: int = 4096, ttl_seconds: float = None, clock=time.monotonic):
+        '''
+        Size-bounded LRU cache of predicted prices with an optional time-to-live
+
+        The cache is bound to a generation token (the content hashes of the preprocessor and the
+        model); whenever `validate` sees a different token every cached price is dropped.
+
+        Args:
+            - max_size (int): Maximum number of cached predictions, least recently used ones are evicted first
+            - ttl_seconds (float): Seconds after which a cached prediction expires, None keeps it until evicted
+            - clock (callable): Monotonic clock used for the TTL
+        '''
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self.generation = None
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def validate(self, generation):
+        '''
+        Drop every cached prediction if the artifacts they were computed with have changed
+
+        Args:
+            - generation (Hashable): Token identifying the current preprocessor and model
+        '''
+        with self._lock:
+            if generation != self.generation:
+                if self.generation is not None:
+                    self.invalidations += 1
+                self._entries.clear()
+                self.generation = generation
+
+    def get(self, key):
+        '''
+        Return the cached prediction for `key`, or None on a miss
+
+        Args:
+            - key (tuple): Normalized feature tuple
+
+        Returns:
+            - float | None: Cached prediction
+        '''
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, expires_at = entry
+            if expires_at is not None and self.clock() >= expires_at:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        '''
+        Cache the prediction for `key`, evicting the least recently used entry when full
+
+        Args:
+            - key (tuple): Normalized feature tuple
+            - value (float): Predicted price
+        '''
+        expires_at = self.clock() + self.ttl_seconds if self.ttl_seconds else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        '''
+        Return the cache counters
+
+        Returns:
+            - dict: Hits, misses, hit rate, evictions, expirations, invalidations and current size
+        '''
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations,
+                'size': len(self._entries),
+                'max_size': self.max_size
+            }
+
+    @classmethod
+    def from_config(cls, config):
+        '''
+        Build a cache from a PredictionCacheConfig
+
+        Args:
+            - config (PredictionCacheConfig): Prediction cache configuration
+
+        Returns:
+            - PredictionCache | None: The cache, or None when caching is disabled
+        '''
+        if not config.enabled:
+            return None
+        return cls(max_size=config.max_size, ttl_seconds=config.ttl_seconds)
@@ -0,0 +1,119 @@
+import hashlib
+import inspect
+import json
+import os
+import threading
+from src.laptop_price_prediction.utils.common import get_file_hash, save_json, load_json
+
+
+def hash_sources(modules: list) -> str:
+    '''
+    Hash the source files of the modules a stage runs, used as its code version
+
+    Args:
+        - modules (list): Imported modules
+
+    Returns:
+        - str: Hex digest of the concatenated source files
+    '''
+    digest = hashlib.sha256()
+    for module in modules:
+        with open(inspect.getsourcefile(module), 'rb') as file:
+            digest.update(file.read())
+    return digest.hexdigest()
+
+
+class StageCache:
+    def __init__(self, state_path):
+        '''
+        Skip pipeline stages whose inputs did not change since their last successful run
+
+        A stage's fingerprint combines the content hash of its input files, its config.yaml
+        section and the source of the modules it runs. The fingerprint and the size/mtime of
+        every output are stored after a successful run; the stage is skipped when the
+        fingerprint matches and all of its outputs are still in place.
+
+        Args:
+            - state_path (str): JSON file the fingerprints are stored in
+        '''
+        self.state_path = state_path
+        self.state = load_json(state_path) if os.path.exists(state_path) else {}
+        self._lock = threading.Lock()
+
+    def fingerprint(self, inputs: list = None, config: dict = None, modules: list = None, source: dict = None) -> str:
+        '''
+        Compute the fingerprint of a stage
+
+        Args:
+            - inputs (list): Paths of the input files, hashed by content
+            - config (dict): Configuration the stage depends on
+            - modules (list): Modules whose source is the stage's code version
+            - source (dict): Any other description of the inputs, e.g. a summary of a database table
+
+        Returns:
+            - str: Hex digest of the stage inputs
+        '''
+        description = {
+            'inputs': {str(path): get_file_hash(path) for path in inputs or []},
+            'config': config or {},
+            'code': hash_sources(modules or []),
+            'source': source or {}
+        }
+        return hashlib.sha256(json.dumps(description, sort_keys=True, default=str).encode()).hexdigest()
+
+    def is_fresh(self, stage: str, fingerprint: str) -> bool:
+        '''
+        Check whether a stage already ran with this fingerprint and its outputs are unchanged
+
+        Args:
+            - stage (str): Stage name
+            - fingerprint (str): Current fingerprint of the stage
+
+        Returns:
+            - bool: True if the stage can be skipped
+        '''
+        entry = self.state.get(stage)
+        if entry is None or entry['fingerprint'] != fingerprint:
+            return False
+
+        for path, stat_key in entry['outputs'].items():
+            if not os.path.exists(path) or self._stat_key(path) != stat_key:
+                return False
+        return True
+
+    def record(self, stage: str, fingerprint: str, outputs: list):
+        '''
+        Store the fingerprint and outputs of a stage that completed successfully
+
+        Args:
+            - stage (str): Stage name
+            - fingerprint (str): Fingerprint the stage ran with
+            - outputs (list): Paths of the files the stage wrote
+        '''
+        with self._lock:
+            self.state[stage] = {
+                'fingerprint': fingerprint,
+                'outputs': {str(path): self._stat_key(path) for path in outputs if os.path.exists(path)}
+            }
+            self._save()
+
+    def invalidate(self, stage: str):
+        '''
+        Forget a stage before it runs, so it is not considered complete if the run fails
+
+        Args:
+            - stage (str): Stage name
+        '''
+        with self._lock:
+            if self.state.pop(stage, None) is not None:
+                self._save()
+
+    def _save(self):
+        tmp_path = f'{self.state_path}.tmp'
+        save_json(self.state, tmp_path)
+        os.replace(tmp_path, self.state_path)
+
+    @staticmethod
+    def _stat_key(path) -> list:
+        stat = os.stat(path)
+        return [stat.st_size, stat.st_mtime_ns]
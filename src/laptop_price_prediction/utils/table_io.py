@@ -0,0 +1,142 @@
+from pathlib import Path
+import pandas as pd
+from src.laptop_price_prediction.logger import logging
+from src.laptop_price_prediction.utils.metrics import metrics
+
+TABLE_FORMATS = ('csv', 'parquet')
+
+PARQUET_COMPRESSION = 'zstd'
+
+
+def table_path(file_path, table_format: str) -> str:
+    '''
+    Return the path of a table artifact with the extension of the configured format
+
+    Args:
+        - file_path (str): Configured path, e.g. artifacts/data_ingestion/raw.csv
+        - table_format (str): 'csv' or 'parquet'
+
+    Returns:
+        - str: Path with the format's extension
+
+    Raises:
+        - ValueError: If the format is unknown
+    '''
+    if table_format not in TABLE_FORMATS:
+        raise ValueError(f'Unknown table format {table_format!r}, expected one of {TABLE_FORMATS}')
+    return str(Path(file_path).with_suffix(f'.{table_format}'))
+
+
+def read_table(file_path, columns: list = None) -> pd.DataFrame:
+    '''
+    Read a table artifact, choosing the reader from the file extension
+
+    Parquet files only decode the requested columns and return their string columns as
+    categoricals, CSV files still parse every row but only keep the requested columns.
+
+    Args:
+        - file_path (str): Path to a .csv or .parquet file
+        - columns (list): Columns to read, all of them if None
+
+    Returns:
+        - pd.DataFrame: Table
+    '''
+    table_format = Path(file_path).suffix.lstrip('.')
+    with metrics.timer('table_io_seconds', operation='read', format=table_format):
+        if table_format == 'parquet':
+            df = pd.read_parquet(file_path, columns=columns)
+        else:
+            df = pd.read_csv(file_path, usecols=columns)
+
+    metrics.inc('table_rows', len(df), operation='read', format=table_format)
+    return df
+
+
+class TableWriter:
+    def __init__(self, file_path, append: bool = False):
+        '''
+        Write a table artifact chunk by chunk, in the format given by the file extension
+
+        Parquet files are written with zstd compression, one row group per chunk, and string
+        columns dictionary-encoded so they are read back as categoricals.
+
+        Args:
+            - file_path (str): Path to a .csv or .parquet file
+            - append (bool): Append to an existing CSV file without writing its header again
+
+        Raises:
+            - ValueError: If appending to a Parquet file, which cannot be extended in place
+        '''
+        self.file_path = file_path
+        self.is_parquet = Path(file_path).suffix == '.parquet'
+        if self.is_parquet and append:
+            raise ValueError(f'Cannot append to the Parquet file {file_path}, use the csv artifact format')
+
+        self.append = append
+        self.rows = 0
+        self._file = None
+        self._writer = None
+        self._schema = None
+
+    def write(self, chunk: pd.DataFrame):
+        table_format = 'parquet' if self.is_parquet else 'csv'
+        with metrics.timer('table_io_seconds', operation='write', format=table_format):
+            if self.is_parquet:
+                self._write_parquet(chunk)
+            else:
+                header = self._file is None and not self.append
+                if self._file is None:
+                    self._file = open(self.file_path, 'a' if self.append else 'w', newline='')
+                chunk.to_csv(self._file, index=False, header=header)
+
+        metrics.inc('table_rows', len(chunk), operation='write', format=table_format)
+        self.rows += len(chunk)
+
+    def _write_parquet(self, chunk: pd.DataFrame):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self._writer is None:
+            # fixed schema for every row group, with 32-bit dictionary indices so later chunks may add categories
+            inferred = pa.Schema.from_pandas(chunk, preserve_index=False)
+            self._schema = pa.schema([
+                pa.field(field.name, pa.dictionary(pa.int32(), pa.string()))
+                if pa.types.is_string(field.type) or pa.types.is_large_string(field.type) or pa.types.is_dictionary(field.type)
+                else field
+                for field in inferred
+            ])
+            self._writer = pq.ParquetWriter(self.file_path, self._schema, compression=PARQUET_COMPRESSION)
+
+        self._writer.write_table(pa.Table.from_pandas(chunk, schema=self._schema, preserve_index=False))
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+        if self._file is not None:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def write_table(df: pd.DataFrame, file_path):
+    '''
+    Write a whole table artifact in the format given by the file extension
+
+    Args:
+        - df (pd.DataFrame): Table to write
+        - file_path (str): Path to a .csv or .parquet file
+
+    Raises:
+        - Error: If there is an error writing the table
+    '''
+    try:
+        with TableWriter(file_path) as writer:
+            writer.write(df)
+
+    except Exception as e:
+        logging.error(f'Error writing table to {file_path}: {e}')
+        raise e
@@ -0,0 +1,54 @@
+import os
+import numpy as np
+import pytest
+from sklearn.ensemble import GradientBoostingRegressor
+from src.laptop_price_prediction.components.compiled_model import CompiledTreeEnsemble
+from src.laptop_price_prediction.components.model_building_and_evaluation import ModelBuilding
+from src.laptop_price_prediction.entity.config_entity import ModelBuildingConfig, ModelSearchConfig
+
+
+def make_config(tmp_path, backend: str) -> ModelBuildingConfig:
+    return ModelBuildingConfig(
+        model_path=str(tmp_path / 'model.pkl'),
+        compiled_model_path=str(tmp_path / 'compiled_model.npz'),
+        train_metrics_path=str(tmp_path / 'train_metrics.json'),
+        test_metrics_path=str(tmp_path / 'test_metrics.json'),
+        backend=backend,
+        search=ModelSearchConfig(
+            strategy='random', cv=2, n_jobs=1, resource='n_estimators',
+            n_iter=1, time_budget_seconds=None, random_state=42
+        )
+    )
+
+
+@pytest.mark.parametrize('backend', ['hist_gbr', 'xgboost'])
+def test_non_gbr_run_removes_compiled_model_of_previous_gbr_run(tmp_path, backend):
+    if backend == 'xgboost':
+        pytest.importorskip('xgboost')
+
+    rng = np.random.default_rng(0)
+    train_arr = np.c_[rng.random((200, 4)), rng.random(200) * 1000]
+    test_arr = np.c_[rng.random((50, 4)), rng.random(50) * 1000]
+
+    ModelBuilding(make_config(tmp_path, 'gbr')).initiate_model_building(train_arr, test_arr)
+    assert os.path.exists(tmp_path / 'compiled_model.npz')
+
+    ModelBuilding(make_config(tmp_path, backend)).initiate_model_building(train_arr, test_arr)
+    assert os.path.exists(tmp_path / 'model.pkl')
+    assert not os.path.exists(tmp_path / 'compiled_model.npz')
+
+
+def test_compiled_ensemble_matches_gradient_boosting(tmp_path):
+    rng = np.random.default_rng(0)
+    X = rng.random((300, 5))
+    y = X @ np.array([3.0, -2.0, 1.0, 0.5, 0.0]) + rng.normal(0, 0.1, 300)
+    # uneven depths exercise leaves that point to themselves before max_depth steps
+    model = GradientBoostingRegressor(n_estimators=30, max_depth=4, min_samples_leaf=20, random_state=0).fit(X, y)
+
+    compiled = CompiledTreeEnsemble.from_gradient_boosting(model)
+    X_test = rng.random((600, 5))
+    assert np.allclose(compiled.predict(X_test), model.predict(X_test))
+
+    compiled.save(tmp_path / 'compiled_model.npz')
+    loaded = CompiledTreeEnsemble.load(tmp_path / 'compiled_model.npz')
+    assert np.allclose(loaded.predict(X_test[0]), model.predict(X_test[:1]))
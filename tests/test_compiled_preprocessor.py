@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+from benchmarks.synthetic import make_synthetic_laptops
+from src.laptop_price_prediction.components.compiled_preprocessor import CompiledPreprocessor
+from src.laptop_price_prediction.components.data_transformation import DataTransformation
+from src.laptop_price_prediction.entity.config_entity import DataTransformationConfig
+from src.laptop_price_prediction.pipeline.stage_04_prediction_pipeline import FEATURE_COLUMNS
+
+
+def make_config(tmp_path, backend: str, feature_engineering: bool) -> DataTransformationConfig:
+    return DataTransformationConfig(
+        preprocessor_path=str(tmp_path / 'preprocessor.pkl'),
+        compiled_preprocessor_path=str(tmp_path / 'compiled_preprocessor.pkl'),
+        train_arr_path=str(tmp_path / 'train_arr.npy'),
+        test_arr_path=str(tmp_path / 'test_arr.npy'),
+        feature_engineering=feature_engineering,
+        model_backend=backend
+    )
+
+
+@pytest.mark.parametrize('backend', ['gbr', 'hist_gbr'])
+@pytest.mark.parametrize('feature_engineering', [False, True])
+def test_compiled_preprocessor_matches_fitted_preprocessor(tmp_path, backend, feature_engineering):
+    train = make_synthetic_laptops(200, seed=0)[FEATURE_COLUMNS]
+    # a different sample holds categories unseen during fit, plus a few missing values
+    test = make_synthetic_laptops(200, seed=1)[FEATURE_COLUMNS]
+    test.loc[:4, ['Inches', 'Company']] = None
+
+    preprocessor = DataTransformation(make_config(tmp_path, backend, feature_engineering)).create_preprocessor()
+    preprocessor.fit(train)
+    compiled = CompiledPreprocessor.from_preprocessor(preprocessor)
+
+    expected = preprocessor.transform(test)
+    assert np.allclose(compiled.transform(test), expected, equal_nan=True)
+    for i in (0, 10):
+        record = test.iloc[i].to_dict()
+        assert np.allclose(compiled.transform_record(record), expected[[i]], equal_nan=True)
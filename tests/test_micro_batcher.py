@@ -0,0 +1,51 @@
+import asyncio
+from http import HTTPStatus
+import pytest
+from src.laptop_price_prediction.serving.micro_batcher import MicroBatcher
+from src.laptop_price_prediction.serving.server import PredictionServer, RequestError
+
+RECORD = {
+    'Company': 'Apple', 'Product': 'MacBook Pro', 'TypeName': 'Ultrabook', 'Inches': 13.3,
+    'ScreenResolution': 'IPS Panel Retina Display 2560x1600', 'Cpu': 'Intel Core i5 2.3GHz', 'Ram': '8GB',
+    'Memory': '128GB SSD', 'Gpu': 'Intel Iris Plus Graphics 640', 'OpSys': 'macOS', 'Weight': '1.37kg'
+}
+
+
+def predict_inches(features):
+    # fails on the whole frame as soon as one row has a non-numeric Inches value
+    return features['Inches'].astype(float).to_numpy() * 100
+
+
+def test_bad_record_only_fails_its_own_request():
+    async def score():
+        batcher = MicroBatcher(predict_inches, max_batch_size=6, max_wait_ms=1000)
+        await batcher.start()
+        try:
+            records = [{**RECORD, 'Inches': 10.0 + i} for i in range(5)] + [{**RECORD, 'Inches': 'abc'}]
+            return batcher, await asyncio.gather(*(batcher.submit(record) for record in records), return_exceptions=True)
+        finally:
+            await batcher.stop()
+
+    batcher, results = asyncio.run(score())
+
+    assert results[:5] == [1000.0, 1100.0, 1200.0, 1300.0, 1400.0]
+    assert isinstance(results[5], ValueError)
+    assert batcher.stats()['requests'] == 5
+
+
+@pytest.mark.parametrize('column, value', [('Inches', 'abc'), ('Ram', 'eight'), ('Weight', True)])
+def test_validate_rejects_non_numeric_values(column, value):
+    server = PredictionServer('127.0.0.1', 0, max_batch_size=8, max_wait_ms=5)
+
+    with pytest.raises(RequestError) as error:
+        server._validate({**RECORD, column: value})
+    assert error.value.status == HTTPStatus.BAD_REQUEST
+
+
+def test_validate_parses_unit_strings():
+    server = PredictionServer('127.0.0.1', 0, max_batch_size=8, max_wait_ms=5)
+
+    record = server._validate({**RECORD, 'Inches': '15.6', 'Weight': None})
+    assert record['Inches'] == 15.6
+    assert record['Ram'] == 8.0
+    assert record['Weight'] is None
@@ -0,0 +1,38 @@
+import numpy as np
+from sklearn.ensemble import GradientBoostingRegressor
+from sklearn.model_selection import GridSearchCV
+from src.laptop_price_prediction.utils.model_search import StagedGridSearch, TimeBudgetedRandomSearch, PARAM_DISTRIBUTIONS
+
+
+def make_data(n_rows: int = 120):
+    rng = np.random.default_rng(0)
+    X = rng.random((n_rows, 4))
+    y = X @ np.array([3.0, -2.0, 1.0, 0.5]) + rng.normal(0, 0.1, n_rows)
+    return X, y
+
+
+def test_random_search_with_spent_budget_still_evaluates_one_candidate():
+    X, y = make_data()
+    search = TimeBudgetedRandomSearch(
+        GradientBoostingRegressor(random_state=0), PARAM_DISTRIBUTIONS,
+        n_iter=5, cv=2, time_budget_seconds=0, random_state=0
+    ).fit(X, y)
+
+    assert len(search.cv_results_['params']) == 1
+    assert search.best_params_ == search.cv_results_['params'][0]
+    assert search.best_estimator_.predict(X).shape == (len(X),)
+
+
+def test_staged_grid_search_selects_same_candidate_as_grid_search():
+    X, y = make_data()
+    param_grid = {'n_estimators': [10, 20, 40], 'max_depth': [2, 3], 'learning_rate': [0.05, 0.1]}
+    estimator = GradientBoostingRegressor(random_state=0)
+
+    staged = StagedGridSearch(estimator, param_grid, cv=3, n_jobs=1).fit(X, y)
+    grid = GridSearchCV(estimator, param_grid, cv=3, scoring='r2').fit(X, y)
+
+    assert staged.best_params_ == grid.best_params_
+    assert np.isclose(staged.best_score_, grid.best_score_)
+    assert np.allclose(staged.cv_results_['mean_test_score'], grid.cv_results_['mean_test_score'])
+    # one fit per fold and (max_depth, learning_rate) pair instead of one per candidate
+    assert staged.n_fits_ == 3 * 4
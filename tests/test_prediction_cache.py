@@ -0,0 +1,76 @@
+import numpy as np
+from src.laptop_price_prediction.pipeline.stage_04_prediction_pipeline import Prediction, FEATURE_COLUMNS
+from src.laptop_price_prediction.utils.common import save_object
+from src.laptop_price_prediction.utils.prediction_cache import PredictionCache
+from tests.test_micro_batcher import RECORD
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class InchesPreprocessor:
+    def transform(self, features):
+        return features[['Inches']].astype(float).to_numpy()
+
+
+class ScaledModel:
+    def __init__(self, scale: float):
+        self.scale = scale
+
+    def predict(self, transformed):
+        return transformed[:, 0] * self.scale
+
+
+def test_least_recently_used_entry_is_evicted_first():
+    cache = PredictionCache(max_size=2)
+    cache.put('a', 1.0)
+    cache.put('b', 2.0)
+
+    # reading 'a' makes 'b' the least recently used entry
+    assert cache.get('a') == 1.0
+    cache.put('c', 3.0)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1.0
+    assert cache.get('c') == 3.0
+    assert cache.stats()['evictions'] == 1
+    assert cache.stats()['size'] == 2
+
+
+def test_entry_expires_after_ttl():
+    clock = FakeClock()
+    cache = PredictionCache(max_size=2, ttl_seconds=10, clock=clock)
+    cache.put('a', 1.0)
+
+    clock.now = 9.9
+    assert cache.get('a') == 1.0
+
+    clock.now = 10.0
+    assert cache.get('a') is None
+    assert cache.stats()['expirations'] == 1
+    assert cache.stats()['size'] == 0
+
+
+def test_reloaded_model_invalidates_cached_predictions(tmp_path):
+    preprocessor_path = str(tmp_path / 'preprocessor.pkl')
+    model_path = str(tmp_path / 'model.pkl')
+    save_object(InchesPreprocessor(), preprocessor_path)
+    save_object(ScaledModel(100), model_path)
+
+    cache = PredictionCache()
+    prediction = Prediction(preprocessor_path, model_path, cache=cache)
+    features = np.array([[RECORD[column] for column in FEATURE_COLUMNS]], dtype=object)
+
+    assert prediction.predict_batch(features).tolist() == [1330.0]
+    assert prediction.predict_batch(features).tolist() == [1330.0]
+    assert cache.stats()['hits'] == 1
+
+    save_object(ScaledModel(200), model_path)
+
+    assert prediction.predict_batch(features).tolist() == [2660.0]
+    assert cache.stats()['invalidations'] == 1